@@ -0,0 +1,56 @@
+"""Compare AdaptiveLinkedList with fixed singly and doubly linked storage.
+
+Two workloads: a stack used from the back (append, then pop from the tail)
+and a queue (append, pop from the front). The adaptive list should match
+SingleLinkedList's memory on the queue and DoubleLinkedList's speed on the
+stack.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_adaptive [n]
+"""
+import sys
+import time
+import tracemalloc
+
+from linkedlist.adaptive import AdaptiveLinkedList
+from linkedlist.DLL import DoubleLinkedList
+from linkedlist.SLL import SingleLinkedList
+
+CLASSES = [SingleLinkedList, DoubleLinkedList, AdaptiveLinkedList]
+
+
+def back_stack(lst, n):
+    """Pop n // 2 elements off the tail."""
+    for _ in range(n // 2):
+        lst.del_at_end()
+
+
+def queue(lst, n):
+    """Append and pop from the front n times."""
+    for i in range(n):
+        lst.insert_at_end(i)
+        lst.del_at_start()
+
+
+def measure(cls, fn, n):
+    """Return (seconds, bytes held by a list of n elements) for fn."""
+    tracemalloc.start()
+    lst = cls.from_range(n)
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    start = time.perf_counter()
+    fn(lst, n)
+    return time.perf_counter() - start, held
+
+
+def main(n=20_000):
+    print(f"{'class':<22}{'workload':<12}{'seconds':>9}{'KB held':>9}")
+    for fn in (back_stack, queue):
+        for cls in CLASSES:
+            seconds, held = measure(cls, fn, n)
+            print(f"{cls.__name__:<22}{fn.__name__:<12}{seconds:>9.3f}{held / 1024:>9.0f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
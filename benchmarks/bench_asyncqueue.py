@@ -0,0 +1,60 @@
+"""Compare AsyncLinkedQueue with asyncio.Queue under many producers and consumers.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_asyncqueue [items]
+"""
+import asyncio
+import sys
+import time
+
+from linkedlist.asyncqueue import AsyncLinkedQueue
+
+SHAPES = [(1, 1), (16, 16), (64, 4), (4, 64)]
+
+
+async def produce(queue, count):
+    for i in range(count):
+        await queue.put(i)
+
+
+async def consume(queue, batch):
+    """Drain until a None sentinel arrives; return the number of items seen."""
+    seen = 0
+    while True:
+        items = await queue.get_many(batch) if batch > 1 else [await queue.get()]
+        for item in items:
+            if item is None:
+                return seen
+            seen += 1
+
+
+async def run(make, producers, consumers, items, maxsize, batch=1):
+    """Return items per second moved from producers to consumers."""
+    queue = make(maxsize)
+    per = items // producers
+    start = time.perf_counter()
+    takers = [asyncio.ensure_future(consume(queue, batch)) for _ in range(consumers)]
+    await asyncio.gather(*(produce(queue, per) for _ in range(producers)))
+    for _ in range(consumers):
+        await queue.put(None)
+    seen = sum(await asyncio.gather(*takers))
+    elapsed = time.perf_counter() - start
+    assert seen == per * producers
+    return seen / elapsed
+
+
+def main(items=200_000):
+    print(f"{'queue':<22}{'prod x cons':>12}{'maxsize':>9}{'items/s':>12}")
+    for producers, consumers in SHAPES:
+        for maxsize in (0, 64):
+            for name, make, batch in (("asyncio.Queue", asyncio.Queue, 1),
+                                      ("AsyncLinkedQueue", AsyncLinkedQueue, 1),
+                                      ("  get_many(32)", AsyncLinkedQueue, 32)):
+                rate = asyncio.run(run(make, producers, consumers, items, maxsize, batch))
+                shape = f"{producers}x{consumers}"
+                print(f"{name:<22}{shape:>12}{maxsize:>9}{rate:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,42 @@
+"""Compare bulk construction with the per-element insert path.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_bulk [n]
+"""
+import sys
+import time
+
+from linkedlist.CLL import CircularLinkedList
+from linkedlist.DCLL import CircularDoubleLinkedList
+from linkedlist.DLL import DoubleLinkedList
+from linkedlist.SLL import SingleLinkedList
+
+CLASSES = [SingleLinkedList, DoubleLinkedList, CircularLinkedList, CircularDoubleLinkedList]
+
+
+def per_element(cls, n):
+    """Build the list one insert_at_position call at a time."""
+    lst = cls()
+    for i in range(n):
+        lst.insert_at_position(i, i)
+    return lst
+
+
+def timed(fn, *args):
+    """Return the seconds taken by fn(*args)."""
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def main(n=1_000_000):
+    print(f"{'class':<26}{'per-elem s':>12}{'from_range s':>14}{'speedup':>9}")
+    for cls in CLASSES:
+        slow = timed(per_element, cls, n)
+        fast = timed(cls.from_range, n)
+        print(f"{cls.__name__:<26}{slow:>12.3f}{fast:>14.3f}{slow / fast:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
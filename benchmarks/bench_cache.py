@@ -0,0 +1,66 @@
+"""Compare the cache module with a hand-rolled DoubleLinkedList LRU.
+
+The hand-rolled version is the usual pattern: ``remove(key)`` and
+``insert_at_beginning(key)`` on every hit, which scans the list.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_cache [lookups]
+"""
+import random
+import sys
+import time
+
+from linkedlist.cache import LFUCache, LRUCache
+from linkedlist.DLL import DoubleLinkedList
+
+
+class HandRolledLRU:
+    """An LRU cache the way callers wrote it before linkedlist.cache."""
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.values = {}
+        self.order = DoubleLinkedList()
+
+    def get(self, key, default=None):
+        if key not in self.values:
+            return default
+        self.order.remove(key)
+        self.order.insert_at_beginning(key)
+        return self.values[key]
+
+    def put(self, key, value):
+        if key in self.values:
+            self.order.remove(key)
+        elif len(self.values) >= self.capacity:
+            del self.values[self.order.tail.data]
+            self.order.del_at_end()
+        self.order.insert_at_beginning(key)
+        self.values[key] = value
+
+
+def workload(cache, keys):
+    """Look each key up and fill the cache on a miss."""
+    start = time.perf_counter()
+    for key in keys:
+        if cache.get(key) is None:
+            cache.put(key, key)
+    return time.perf_counter() - start
+
+
+def main(lookups=200_000):
+    rnd = random.Random(0)
+    print(f"{'cache':<14}{'capacity':>10}{'lookups/s':>12}  stats")
+    for capacity in (100, 1_000, 10_000):
+        keys = [min(int(rnd.expovariate(1 / capacity)), capacity * 4) for _ in range(lookups)]
+        for name, cache in (("hand-rolled", HandRolledLRU(capacity)),
+                            ("LRUCache", LRUCache(capacity)),
+                            ("LFUCache", LFUCache(capacity))):
+            elapsed = workload(cache, keys)
+            stats = cache.stats() if hasattr(cache, "stats") else ""
+            print(f"{name:<14}{capacity:>10,}{lookups / elapsed:>12,.0f}  {stats}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,118 @@
+"""Stress and throughput test for the concurrent doubly linked lists.
+
+Every thread appends its own values at the tail and pops from both ends;
+a second workload inserts and deletes near the head by position. The
+baseline wraps a plain DoubleLinkedList in one global lock. After each run
+the popped and remaining values are checked against what was pushed.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_concurrent [ops_per_thread]
+"""
+import sys
+import threading
+import time
+from collections import Counter
+
+from linkedlist.concurrent import ConcurrentCircularDoubleLinkedList, ConcurrentDoubleLinkedList
+from linkedlist.DLL import DoubleLinkedList
+
+THREADS = [1, 2, 4, 8, 16]
+
+
+class GlobalLockList:
+    """A DoubleLinkedList behind one lock, as callers share it today."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._lst = DoubleLinkedList()
+
+    def insert_at_end(self, data):
+        with self._lock:
+            self._lst.insert_at_end(data)
+
+    def insert_at_position(self, data, position):
+        with self._lock:
+            self._lst.insert_at_position(data, position)
+
+    def pop_left(self):
+        with self._lock:
+            data = self._lst.head.data
+            self._lst.del_at_start()
+            return data
+
+    def pop_right(self):
+        with self._lock:
+            data = self._lst.tail.data
+            self._lst.del_at_end()
+            return data
+
+    def delete(self, position):
+        with self._lock:
+            self._lst.delete(position)
+
+    def __iter__(self):
+        with self._lock:
+            return iter(list(self._lst))
+
+
+def ends(lst, tid, ops, popped):
+    """Append at the tail, then pop from alternating ends."""
+    for j in range(ops):
+        lst.insert_at_end((tid, j))
+        popped.append(lst.pop_left() if j % 2 else lst.pop_right())
+
+
+def positional(lst, tid, ops, popped):
+    """Insert then delete a few nodes from the head, by position."""
+    for j in range(ops):
+        lst.insert_at_position((tid, j), 4)
+        lst.delete(2)
+
+
+def run(make, workload, threads, ops):
+    """Return (ops per second, consistent) for one configuration."""
+    lst = make()
+    prefill = [("pre", i) for i in range(64)]
+    for data in prefill:
+        lst.insert_at_end(data)
+    popped = [[] for _ in range(threads)]
+    workers = [threading.Thread(target=workload, args=(lst, t, ops, popped[t]))
+               for t in range(threads)]
+    start = time.perf_counter()
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    elapsed = time.perf_counter() - start
+    seen = Counter(list(lst))
+    for values in popped:
+        seen.update(values)
+    if workload is ends:
+        pushed = Counter(prefill + [(t, j) for t in range(threads) for j in range(ops)])
+        consistent = seen == pushed
+    else:
+        consistent = sum(seen.values()) == len(prefill)
+    return threads * ops / elapsed, consistent
+
+
+def main(ops=20_000):
+    makers = [("global lock", GlobalLockList),
+              ("concurrent", ConcurrentDoubleLinkedList),
+              ("concurrent ring", ConcurrentCircularDoubleLinkedList)]
+    for workload in (ends, positional):
+        print(f"workload: {workload.__name__}")
+        print(f"{'list':<18}" + "".join(f"{t:>10}" for t in THREADS) + "  ok")
+        for name, make in makers:
+            rates = []
+            ok = True
+            for threads in THREADS:
+                rate, consistent = run(make, workload, threads, ops)
+                rates.append(rate)
+                ok = ok and consistent
+            print(f"{name:<18}" + "".join(f"{r:>10,.0f}" for r in rates) + f"  {ok}")
+        print()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
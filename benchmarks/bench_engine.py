@@ -0,0 +1,57 @@
+"""Compare the node and array storage engines.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_engine [n]
+"""
+import sys
+import time
+import tracemalloc
+
+from linkedlist.CLL import CircularLinkedList
+from linkedlist.DCLL import CircularDoubleLinkedList
+from linkedlist.DLL import DoubleLinkedList
+from linkedlist.SLL import SingleLinkedList
+
+CLASSES = [SingleLinkedList, DoubleLinkedList, CircularLinkedList, CircularDoubleLinkedList]
+
+
+def bytes_per_element(cls, engine, n):
+    """Return the traced allocation per element for n appended ints."""
+    tracemalloc.start()
+    lst = cls(engine=engine)
+    for i in range(n):
+        lst.insert_at_end(i)
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del lst
+    return used / n
+
+
+def ops_per_second(cls, engine, n):
+    """Return append, iterate and pop-front throughput for n elements."""
+    lst = cls(engine=engine)
+    start = time.perf_counter()
+    for i in range(n):
+        lst.insert_at_end(i)
+    appended = time.perf_counter()
+    for _ in lst:
+        pass
+    iterated = time.perf_counter()
+    for _ in range(n):
+        lst.del_at_start()
+    popped = time.perf_counter()
+    return (n / (appended - start), n / (iterated - appended), n / (popped - iterated))
+
+
+def main(n=200_000):
+    print(f"{'class':<26}{'engine':<8}{'B/elem':>9}{'append/s':>12}{'iter/s':>12}{'popleft/s':>12}")
+    for cls in CLASSES:
+        for engine in ("node", "array"):
+            per = bytes_per_element(cls, engine, n)
+            append, iterate, pop = ops_per_second(cls, engine, n)
+            print(f"{cls.__name__:<26}{engine:<8}{per:>9.1f}{append:>12,.0f}{iterate:>12,.0f}{pop:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,75 @@
+"""Measure how long importing the package takes, using ``python -X importtime``.
+
+Each scenario runs in a fresh interpreter with bytecode caching on (in a
+temporary pycache prefix, after a warm-up run), and the time reported is
+the cumulative import time of every module it loads that a bare
+interpreter does not, best of several runs.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_import [max_ms]
+
+With max_ms the script exits with status 1 if ``from linkedlist import
+SingleLinkedList`` takes longer, so it can guard against regressions.
+"""
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPEAT = 5
+
+SCENARIOS = [
+    ("import linkedlist", "import linkedlist"),
+    ("SingleLinkedList", "from linkedlist import SingleLinkedList"),
+    ("four core lists", "from linkedlist import (SingleLinkedList, DoubleLinkedList, "
+                        "CircularLinkedList, CircularDoubleLinkedList)"),
+    ("IntLinkedList", "from linkedlist import IntLinkedList"),
+    ("every export", "import linkedlist\nfor name in linkedlist.__all__: getattr(linkedlist, name)"),
+]
+
+
+def importtime(code, cache):
+    """Return {module: cumulative microseconds} for the top-level imports of code."""
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-X", f"pycache_prefix={cache}", "-c", code],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit() and not name.startswith("  "):
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def measure(code, cache, baseline):
+    """Return the best total microseconds spent importing what code adds."""
+    importtime(code, cache)
+    best = None
+    for _ in range(REPEAT):
+        times = importtime(code, cache)
+        total = sum(us for name, us in times.items() if name not in baseline)
+        best = total if best is None else min(best, total)
+    return best
+
+
+def main(max_ms=None):
+    with tempfile.TemporaryDirectory() as cache:
+        baseline = importtime("pass", cache)
+        results = {label: measure(code, cache, baseline) for label, code in SCENARIOS}
+    print(f"{'scenario':<20}{'ms':>8}")
+    for label, us in results.items():
+        print(f"{label:<20}{us / 1000:>8.2f}")
+    if max_ms is not None and results["SingleLinkedList"] / 1000 > max_ms:
+        print(f"SingleLinkedList import exceeds {max_ms} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(float(sys.argv[1]) if len(sys.argv) > 1 else None))
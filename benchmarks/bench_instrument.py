@@ -0,0 +1,44 @@
+"""Measure the cost of instrumentation: never enabled, enabled, and switched off again.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_instrument [n]
+"""
+import sys
+import time
+
+from linkedlist.DLL import DoubleLinkedList
+from linkedlist.instrument import instrument, uninstrument
+from linkedlist.SLL import SingleLinkedList
+
+CLASSES = [SingleLinkedList, DoubleLinkedList]
+
+
+def workload(lst, n):
+    """Run a mix of end, positional and search operations; return seconds."""
+    start = time.perf_counter()
+    for i in range(n):
+        lst.insert_at_end(i)
+        lst.show_val(i // 2)
+    lst.find(-1)
+    for _ in range(n // 2):
+        lst.del_at_start()
+    return time.perf_counter() - start
+
+
+def main(n=20_000):
+    print(f"{'class':<20}{'off s':>9}{'on s':>9}{'after s':>9}")
+    for cls in CLASSES:
+        off = workload(cls(), n)
+        lst = cls()
+        probe = instrument(lst)
+        on = workload(lst, n)
+        uninstrument(lst)
+        after = workload(cls(), n)
+        print(f"{cls.__name__:<20}{off:>9.3f}{on:>9.3f}{after:>9.3f}")
+        for name, row in sorted(probe.stats().items()):
+            print(f"    {name:<16}{row['calls']:>8} calls{row['hops']:>12} hops{row['max_hops']:>8} max")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
@@ -0,0 +1,50 @@
+"""Compare eliminate_every with removing every k-th node through delete().
+
+The old way keeps a position, deletes the node there and steps k - 1 on,
+so each removal walks again from the head or the finger. eliminate_every
+walks the ring once with a trailing pointer.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_josephus [n] [k]
+"""
+import sys
+import time
+
+from linkedlist.CLL import CircularLinkedList
+from linkedlist.DCLL import CircularDoubleLinkedList
+
+CLASSES = [CircularLinkedList, CircularDoubleLinkedList]
+
+
+def by_delete(lst, k):
+    """Remove every k-th node with delete(position) until the list is empty."""
+    removed = []
+    pos = 0
+    while lst.size:
+        pos = (pos + k - 1) % lst.size
+        removed.append(lst.show_val(pos))
+        lst.delete(pos)
+    return removed
+
+
+def by_eliminate(lst, k):
+    """Remove every k-th node with a single eliminate_every call."""
+    return lst.eliminate_every(k)
+
+
+def main(n=20_000, k=3):
+    print(f"{'class':<28}{'approach':<14}{'seconds':>9}")
+    for cls in CLASSES:
+        orders = []
+        for fn in (by_delete, by_eliminate):
+            lst = cls.from_range(n)
+            start = time.perf_counter()
+            orders.append(fn(lst, k))
+            elapsed = time.perf_counter() - start
+            print(f"{cls.__name__:<28}{fn.__name__:<14}{elapsed:>9.4f}")
+        assert orders[0] == orders[1]
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,38 @@
+"""Show that reopening a MappedLinkedList costs the same at any length.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_mapped [max_n]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from linkedlist.mapped import MappedLinkedList
+
+
+def main(max_n=1_000_000):
+    print(f"{'n':>10}{'build s':>10}{'file MB':>9}{'reopen ms':>11}{'tail read ms':>14}")
+    n = 1_000
+    with tempfile.TemporaryDirectory() as tmp:
+        while n <= max_n:
+            path = os.path.join(tmp, f"list{n}.bin")
+            start = time.perf_counter()
+            with MappedLinkedList(path) as lst:
+                lst.extend(range(n))
+            build = time.perf_counter() - start
+            start = time.perf_counter()
+            lst = MappedLinkedList(path)
+            reopen = time.perf_counter() - start
+            start = time.perf_counter()
+            assert lst.show_val(n - 1) == n - 1
+            tail = time.perf_counter() - start
+            lst.close()
+            print(f"{n:>10,}{build:>10.2f}{os.path.getsize(path) / 2 ** 20:>9.1f}"
+                  f"{reopen * 1e3:>11.3f}{tail * 1e3:>14.3f}")
+            n *= 10
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
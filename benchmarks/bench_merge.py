@@ -0,0 +1,70 @@
+"""Compare k-way merging of sorted lists by relinking with flattening them.
+
+The flattening baseline sorts the payloads of every list into one Python
+list and builds a new linked list from it, which is what merge_sorted
+replaces. Time and peak traced memory are measured for the merge alone,
+with the inputs already built.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_merge [parts] [per_part]
+"""
+import random
+import sys
+import time
+import tracemalloc
+from heapq import merge
+from itertools import chain
+
+from linkedlist.DLL import DoubleLinkedList
+from linkedlist.merge import imerge, merge_sorted
+from linkedlist.SLL import SingleLinkedList
+
+CLASSES = [SingleLinkedList, DoubleLinkedList]
+
+
+def flatten(lists):
+    """Sort every payload into a Python list and rebuild."""
+    return type(lists[0]).from_iterable(sorted(chain(*lists)))
+
+
+def heapq_merge(lists):
+    """Rebuild from heapq.merge over the lists' iterators."""
+    return type(lists[0]).from_iterable(merge(*lists))
+
+
+def relink(lists):
+    """Relink the nodes with merge_sorted."""
+    return merge_sorted(*lists)
+
+
+def lazy(lists):
+    """Collect imerge, deleting each node from its input as it goes."""
+    return imerge(*lists).collect()
+
+
+def measure(cls, fn, parts, per_part):
+    """Return (seconds, peak KB) of merging freshly built inputs with fn."""
+    rng = random.Random(0)
+    lists = [cls.from_iterable(sorted(rng.random() for _ in range(per_part)))
+             for _ in range(parts)]
+    tracemalloc.start()
+    start = time.perf_counter()
+    merged = fn(lists)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert merged.size == parts * per_part
+    return elapsed, peak / 1024
+
+
+def main(parts=32, per_part=5_000):
+    print(f"{'class':<20}{'approach':<14}{'seconds':>9}{'peak KB':>10}")
+    for cls in CLASSES:
+        for fn in (flatten, heapq_merge, relink, lazy):
+            seconds, peak = measure(cls, fn, parts, per_part)
+            print(f"{cls.__name__:<20}{fn.__name__:<14}{seconds:>9.4f}{peak:>10.0f}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,57 @@
+"""Round-trip large lists through pickle, copy and deepcopy.
+
+Before __reduce_ex__ existed these recursed node by node and raised
+RecursionError after a few thousand elements.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_pickle [n]
+"""
+import copy
+import pickle
+import sys
+import time
+
+from linkedlist.CLL import CircularLinkedList
+from linkedlist.DCLL import CircularDoubleLinkedList
+from linkedlist.DLL import DoubleLinkedList
+from linkedlist.SLL import SingleLinkedList
+
+CLASSES = [SingleLinkedList, DoubleLinkedList, CircularLinkedList, CircularDoubleLinkedList]
+
+
+def timed(fn, *args):
+    """Return (result, seconds) for fn(*args)."""
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def out_of_band(lst):
+    """Pickle with protocol 5, keeping buffers outside the pickle stream."""
+    buffers = []
+    data = pickle.dumps(lst, protocol=5, buffer_callback=buffers.append)
+    return pickle.loads(data, buffers=buffers), len(data)
+
+
+def main(n=1_000_000):
+    payloads = {"int": range(n), "float": [i * 0.5 for i in range(n)],
+                "str": [str(i) for i in range(n)]}
+    print(f"{'class':<26}{'payload':>8}{'pickle s':>10}{'bytes':>13}"
+          f"{'oob s':>8}{'oob bytes':>11}{'copy s':>8}{'deepcopy s':>12}")
+    for cls in CLASSES:
+        for kind, values in payloads.items():
+            lst = cls.from_iterable(values)
+            data, dump = timed(pickle.dumps, lst, pickle.HIGHEST_PROTOCOL)
+            back, load = timed(pickle.loads, data)
+            assert back.size == n
+            (back, oob_size), oob = timed(out_of_band, lst)
+            assert back.size == n
+            _, shallow = timed(copy.copy, lst)
+            _, deep = timed(copy.deepcopy, lst)
+            print(f"{cls.__name__:<26}{kind:>8}{dump + load:>10.3f}{len(data):>13,}"
+                  f"{oob:>8.3f}{oob_size:>11,}{shallow:>8.3f}{deep:>12.3f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
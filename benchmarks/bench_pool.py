@@ -0,0 +1,38 @@
+"""Measure node pooling on a queue workload (append at tail, pop at head).
+
+Run from the repository root:
+
+    python -m benchmarks.bench_pool [turns]
+"""
+import sys
+import time
+
+from linkedlist.DLL import DoubleLinkedList
+from linkedlist.node import DLLNode, SLLNode
+from linkedlist.pool import NodePool
+from linkedlist.SLL import SingleLinkedList
+
+
+def churn(lst, turns, depth=1000):
+    """Keep depth items queued while pushing and popping turns times."""
+    for i in range(depth):
+        lst.insert_at_end(i)
+    start = time.perf_counter()
+    for i in range(turns):
+        lst.insert_at_end(i)
+        lst.del_at_start()
+    return time.perf_counter() - start
+
+
+def main(turns=1_000_000):
+    print(f"{'class':<18}{'pool':>6}{'turns/s':>12}  stats")
+    for cls, node_type in ((SingleLinkedList, SLLNode), (DoubleLinkedList, DLLNode)):
+        for capacity in (None, 64):
+            pool = NodePool(node_type, capacity) if capacity is not None else None
+            elapsed = churn(cls(pool=pool), turns)
+            stats = pool.stats() if pool is not None else ""
+            print(f"{cls.__name__:<18}{str(capacity):>6}{turns / elapsed:>12,.0f}  {stats}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
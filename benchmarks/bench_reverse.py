@@ -0,0 +1,51 @@
+"""Compare O(1) reverse() with rewriting every node's links.
+
+Each round reverses the list and then reads both ends, the pattern of
+code that flips a list to consume it from the other side.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_reverse [n]
+"""
+import sys
+import time
+
+from linkedlist.DCLL import CircularDoubleLinkedList
+from linkedlist.DLL import DoubleLinkedList
+
+CLASSES = [DoubleLinkedList, CircularDoubleLinkedList]
+ROUNDS = 100
+
+
+def eager(lst):
+    """Reverse lst and rewrite the links straight away, as reverse() used to."""
+    lst.reverse()
+    lst.materialize()
+    return lst.show_val(0), lst.show_val(lst.size - 1)
+
+
+def lazy(lst):
+    """Reverse lst by flipping its orientation only."""
+    lst.reverse()
+    return lst.show_val(0), lst.show_val(lst.size - 1)
+
+
+def measure(cls, fn, n):
+    """Return the seconds per round of fn on a list of n elements."""
+    lst = cls.from_range(n)
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        fn(lst)
+    return (time.perf_counter() - start) / ROUNDS
+
+
+def main(n=200_000):
+    print(f"{'class':<26}{'eager ms':>10}{'flip us':>10}")
+    for cls in CLASSES:
+        slow = measure(cls, eager, n)
+        fast = measure(cls, lazy, n)
+        print(f"{cls.__name__:<26}{slow * 1e3:>10.2f}{fast * 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,64 @@
+"""Measure round-robin turns per second over a ring of workers.
+
+Compares RoundRobin.next, the old way of advancing a CircularLinkedList
+(del_at_start then insert_at_end, one node allocated per turn), a bare
+rotate(-1) on the ring, and collections.deque.rotate as the baseline.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_roundrobin [turns]
+"""
+import sys
+import time
+from collections import deque
+
+from linkedlist.CLL import CircularLinkedList
+from linkedlist.roundrobin import RoundRobin
+
+WORKERS = 64
+
+
+def scheduler(turns):
+    """Give out turns with RoundRobin.next."""
+    rr = RoundRobin(range(WORKERS))
+    advance = rr.next
+    for _ in range(turns):
+        advance()
+
+
+def requeue(turns):
+    """Advance by popping the head and appending it again."""
+    ring = CircularLinkedList.from_range(WORKERS)
+    for _ in range(turns):
+        worker = ring.head.data
+        ring.del_at_start()
+        ring.insert_at_end(worker)
+
+
+def rotate(turns):
+    """Advance the ring with rotate(-1)."""
+    ring = CircularLinkedList.from_range(WORKERS)
+    advance = ring.rotate
+    for _ in range(turns):
+        advance(-1)
+
+
+def deque_rotate(turns):
+    """Advance a deque with rotate(-1)."""
+    ring = deque(range(WORKERS))
+    advance = ring.rotate
+    for _ in range(turns):
+        advance(-1)
+
+
+def main(turns=200_000):
+    print(f"{'approach':<24}{'turns/s':>12}")
+    for fn in (scheduler, requeue, rotate, deque_rotate):
+        start = time.perf_counter()
+        fn(turns)
+        elapsed = time.perf_counter() - start
+        print(f"{fn.__name__:<24}{turns / elapsed:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
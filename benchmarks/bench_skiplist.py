@@ -0,0 +1,41 @@
+"""Compare SingleLinkedList positional operations with and without a skip index.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_skiplist [ops]
+"""
+import random
+import sys
+import time
+
+from linkedlist.SLL import SingleLinkedList
+
+SIZES = [10 ** 4, 10 ** 5, 10 ** 6]
+
+
+def run(n, ops, skiplist):
+    """Return seconds spent on ops random show_val, insert and delete calls."""
+    lst = SingleLinkedList(skiplist=skiplist)
+    for i in range(n):
+        lst.insert_at_end(i)
+    rnd = random.Random(n)
+    positions = [rnd.randrange(n) for _ in range(ops)]
+    lst.show_val(0)  # builds the lanes outside the timed region
+    start = time.perf_counter()
+    for pos in positions:
+        lst.show_val(pos)
+        lst.insert_at_position(-1, pos)
+        lst.delete(pos)
+    return time.perf_counter() - start
+
+
+def main(ops=200):
+    print(f"{'n':>9}{'walk s':>10}{'skip s':>10}{'speedup':>9}")
+    for n in SIZES:
+        walk = run(n, ops, False)
+        skip = run(n, ops, True)
+        print(f"{n:>9}{walk:>10.3f}{skip:>10.3f}{walk / skip:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,58 @@
+"""Compare in-place sort() with copying into a Python list and rebuilding.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_sort [n]
+"""
+import random
+import sys
+import time
+import tracemalloc
+
+from linkedlist.CLL import CircularLinkedList
+from linkedlist.DCLL import CircularDoubleLinkedList
+from linkedlist.DLL import DoubleLinkedList
+from linkedlist.SLL import SingleLinkedList
+
+CLASSES = [SingleLinkedList, DoubleLinkedList, CircularLinkedList, CircularDoubleLinkedList]
+
+
+def copy_sort_rebuild(lst):
+    """Return a sorted copy built the way callers did before sort() existed."""
+    out = type(lst)()
+    for data in sorted(lst):
+        out.insert_at_end(data)
+    return out
+
+
+def in_place(lst):
+    """Sort lst by relinking its nodes."""
+    lst.sort()
+    return lst
+
+
+def measure(cls, fn, values):
+    """Return (seconds, peak traced bytes) for fn on a fresh list."""
+    lst = cls.from_iterable(values)
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn(lst)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return elapsed, peak
+
+
+def main(n=200_000):
+    values = [random.random() for _ in range(n)]
+    print(f"{'class':<26}{'rebuild s':>10}{'peak MB':>9}{'sort s':>9}{'peak MB':>9}")
+    for cls in CLASSES:
+        slow, slow_peak = measure(cls, copy_sort_rebuild, values)
+        fast, fast_peak = measure(cls, in_place, values)
+        print(f"{cls.__name__:<26}{slow:>10.3f}{slow_peak / 2 ** 20:>9.1f}"
+              f"{fast:>9.3f}{fast_peak / 2 ** 20:>9.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
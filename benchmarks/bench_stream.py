@@ -0,0 +1,58 @@
+"""Compare a lazy stream() pipeline with chained intermediate Python lists.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_stream [n]
+"""
+import sys
+import time
+import tracemalloc
+
+from linkedlist.CLL import CircularLinkedList
+from linkedlist.DCLL import CircularDoubleLinkedList
+from linkedlist.DLL import DoubleLinkedList
+from linkedlist.SLL import SingleLinkedList
+
+CLASSES = [SingleLinkedList, DoubleLinkedList, CircularLinkedList, CircularDoubleLinkedList]
+
+
+def eager(lst, limit):
+    """Filter, map and take through intermediate lists, then rebuild."""
+    odd = [x for x in lst if x % 2]
+    squares = [x * x for x in odd]
+    out = SingleLinkedList()
+    for x in squares[:limit]:
+        out.insert_at_end(x)
+    return out
+
+
+def lazy(lst, limit):
+    """Run the same pipeline through stream()."""
+    return (lst.stream().filter(lambda x: x % 2).map(lambda x: x * x)
+            .take(limit).collect(into=SingleLinkedList))
+
+
+def measure(fn, lst, limit):
+    """Return (seconds, peak traced bytes) for fn on lst."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn(lst, limit)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main(n=200_000):
+    print(f"{'class':<26}{'take':>8}{'eager s':>9}{'peak MB':>9}{'stream s':>10}{'peak MB':>9}")
+    for cls in CLASSES:
+        lst = cls.from_range(n)
+        for limit in (100, n):
+            slow, slow_peak = measure(eager, lst, limit)
+            fast, fast_peak = measure(lazy, lst, limit)
+            print(f"{cls.__name__:<26}{limit:>8}{slow:>9.3f}{slow_peak / 2 ** 20:>9.1f}"
+                  f"{fast:>10.3f}{fast_peak / 2 ** 20:>9.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
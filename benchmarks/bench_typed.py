@@ -0,0 +1,66 @@
+"""Compare typed numeric lists with the generic SingleLinkedList.
+
+The generic list has no count/sum/min/max/argwhere, so it is measured with
+the Python-level loops callers write over its iterator. The typed list
+uses NumPy for its queries when NumPy is installed.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_typed [n]
+"""
+import sys
+import time
+
+from linkedlist.SLL import SingleLinkedList
+from linkedlist.typed import IntLinkedList, numpy
+
+
+def timed(fn, *args):
+    """Return the seconds taken by fn(*args)."""
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def generic_queries(lst, target):
+    """Return the queries as callers write them over a generic list."""
+    return {
+        "find": lambda: lst.find(target),
+        "count": lambda: sum(1 for data in lst if data == target),
+        "sum": lambda: sum(lst),
+        "min": lambda: min(lst),
+        "max": lambda: max(lst),
+        "argwhere": lambda: [idx for idx, data in enumerate(lst) if data % 7 == 0],
+    }
+
+
+def typed_queries(lst, target):
+    """Return the same queries through the typed list's methods."""
+    return {
+        "find": lambda: lst.find(target),
+        "count": lambda: lst.count(target),
+        "sum": lst.sum,
+        "min": lst.min,
+        "max": lst.max,
+        "argwhere": lambda: lst.argwhere(lambda data: data % 7 == 0),
+    }
+
+
+def main(n=1_000_000):
+    values = range(n)
+    generic = SingleLinkedList.from_iterable(values)
+    typed = IntLinkedList.from_iterable(values)
+    print(f"numpy: {'yes' if numpy is not None else 'no'}")
+    print(f"{'query':<10}{'generic s':>11}{'typed s':>10}{'speedup':>9}")
+    slow = generic_queries(generic, n - 1)
+    fast = typed_queries(typed, n - 1)
+    for name in slow:
+        a = timed(slow[name])
+        b = timed(fast[name])
+        print(f"{name:<10}{a:>11.3f}{b:>10.3f}{a / b:>8.1f}x")
+    typed.insert_at_beginning(-1)
+    print(f"{'compact':<10}{'':>11}{timed(typed.compact):>10.3f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
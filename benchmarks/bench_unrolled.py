@@ -0,0 +1,66 @@
+"""Compare UnrolledLinkedList chunk sizes with SingleLinkedList.
+
+Reports the traced bytes per element after building the list (including
+the int payloads themselves, about 32 bytes each), plus the
+time to iterate, find the last element, display, and run a mix of
+positional inserts and deletes.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_unrolled [n]
+"""
+import random
+import sys
+import time
+import tracemalloc
+
+from linkedlist.SLL import SingleLinkedList
+from linkedlist.unrolled import UnrolledLinkedList
+
+CHUNK_SIZES = [8, 16, 32, 64, 128, 256]
+
+
+def timed(fn, *args):
+    """Return the seconds taken by fn(*args)."""
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def built(make, n):
+    """Return (list, traced bytes per element) for a list of range(n)."""
+    tracemalloc.start()
+    lst = make(range(n))
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return lst, size / n
+
+
+def churn(lst, n, ops=2_000):
+    """Insert and delete at random positions ops times."""
+    rnd = random.Random(0)
+    for _ in range(ops):
+        lst.insert_at_position(-1, rnd.randrange(n))
+        lst.delete(rnd.randrange(n))
+
+
+def row(name, make, n):
+    """Build one list and print its measurements."""
+    lst, per = built(make, n)
+    it = timed(lambda: sum(1 for _ in lst))
+    find = timed(lst.find, n - 1)
+    show = timed(lst.display)
+    mix = timed(churn, lst, n)
+    print(f"{name:<20}{per:>10.1f}{it:>9.3f}{find:>9.3f}{show:>10.3f}{mix:>9.3f}")
+
+
+def main(n=1_000_000):
+    print(f"{'list':<20}{'B/elem':>10}{'iter s':>9}{'find s':>9}{'display s':>10}{'mix s':>9}")
+    row("SingleLinkedList", SingleLinkedList.from_iterable, n)
+    for size in CHUNK_SIZES:
+        row(f"Unrolled({size})",
+            lambda values, size=size: UnrolledLinkedList.from_iterable(values, chunk_size=size), n)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
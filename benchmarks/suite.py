@@ -0,0 +1,344 @@
+"""Time and peak memory of every list operation, with list and deque as baselines.
+
+Each operation runs on a fresh structure of n elements, for every class
+and n in the chosen sizes. Cheap operations run a batch of calls and are
+reported per call; linear ones run once. Time is the best of several
+repeats; peak memory is measured with tracemalloc in a separate run, so it
+does not slow the timed runs, and counts only what the operation itself
+allocates. Operations with no list or deque counterpart are skipped for
+those baselines.
+
+Run from the repository root:
+
+    python -m benchmarks.suite run [--sizes 1000 10000] [--only find,sort] [--out results.json]
+    python -m benchmarks.suite compare base.json new.json [--threshold 0.2]
+
+``compare`` prints every operation that got slower or hungrier by more
+than the threshold and exits with status 1 if there was any.
+"""
+import argparse
+import gc
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from collections import deque, namedtuple
+from datetime import datetime, timezone
+from itertools import islice
+
+from linkedlist.CLL import CircularLinkedList
+from linkedlist.DCLL import CircularDoubleLinkedList
+from linkedlist.DLL import DoubleLinkedList
+from linkedlist.SLL import SingleLinkedList
+
+STRUCTURES = [SingleLinkedList, DoubleLinkedList, CircularLinkedList,
+              CircularDoubleLinkedList, list, deque]
+SIZES = [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6]
+
+Op = namedtuple("Op", "name calls setup linked seq deq")
+
+
+def one(n):
+    """Run linear operations once."""
+    return 1
+
+
+def batch(n):
+    """Run O(1) operations in batches of up to 1000 calls."""
+    return min(n, 1000)
+
+
+def few(n):
+    """Run positional operations 100 times, near the middle of the list."""
+    return min(n // 2, 100)
+
+
+def _make(cls, values):
+    """Return a structure of type cls holding values."""
+    if cls is list or cls is deque:
+        return cls(values)
+    return cls.from_iterable(values)
+
+
+def _drain(s):
+    """Iterate over s, discarding the values."""
+    for _ in s:
+        pass
+
+
+def _split_list(s, n):
+    """Split a Python list at n // 2 the way split_at does."""
+    part = s[n // 2:]
+    del s[n // 2:]
+    return part
+
+
+def _splice_deque(d, other, n):
+    """Insert other into d at n // 2 by rotating, as splice does."""
+    d.rotate(-(n // 2))
+    d.extendleft(reversed(other))
+    d.rotate(n // 2)
+
+
+def _odd(x):
+    """Return True for odd x."""
+    return x % 2
+
+
+OPS = [
+    Op("from_iterable", one, "values",
+       lambda c, s, n, i: c.from_iterable(s),
+       lambda c, s, n, i: list(s),
+       lambda c, s, n, i: deque(s)),
+    Op("from_range", one, "values",
+       lambda c, s, n, i: c.from_range(n),
+       lambda c, s, n, i: list(range(n)),
+       lambda c, s, n, i: deque(range(n))),
+    Op("generate", one, "empty",
+       lambda c, s, n, i: s.generate(n),
+       lambda c, s, n, i: s.extend(range(1, n + 1)),
+       lambda c, s, n, i: s.extend(range(1, n + 1))),
+    Op("insert_at_beginning", batch, "built",
+       lambda c, s, n, i: s.insert_at_beginning(i),
+       lambda c, s, n, i: s.insert(0, i),
+       lambda c, s, n, i: s.appendleft(i)),
+    Op("insert_at_end", batch, "built",
+       lambda c, s, n, i: s.insert_at_end(i),
+       lambda c, s, n, i: s.append(i),
+       lambda c, s, n, i: s.append(i)),
+    Op("insert_at_position", few, "built",
+       lambda c, s, n, i: s.insert_at_position(i, n // 2),
+       lambda c, s, n, i: s.insert(n // 2, i),
+       lambda c, s, n, i: s.insert(n // 2, i)),
+    Op("extend", one, "built",
+       lambda c, s, n, i: s.extend(range(n)),
+       lambda c, s, n, i: s.extend(range(n)),
+       lambda c, s, n, i: s.extend(range(n))),
+    Op("extendleft", one, "built",
+       lambda c, s, n, i: s.extendleft(range(n)),
+       lambda c, s, n, i: s.__setitem__(slice(0, 0), range(n - 1, -1, -1)),
+       lambda c, s, n, i: s.extendleft(range(n))),
+    Op("insert_many", one, "built",
+       lambda c, s, n, i: s.insert_many((p, p) for p in range(0, n, 10)),
+       None, None),
+    Op("del_at_start", batch, "built",
+       lambda c, s, n, i: s.del_at_start(),
+       lambda c, s, n, i: s.pop(0),
+       lambda c, s, n, i: s.popleft()),
+    Op("del_at_end", batch, "built",
+       lambda c, s, n, i: s.del_at_end(),
+       lambda c, s, n, i: s.pop(),
+       lambda c, s, n, i: s.pop()),
+    Op("delete", few, "built",
+       lambda c, s, n, i: s.delete(n // 2 - i),
+       lambda c, s, n, i: s.__delitem__(n // 2 - i),
+       lambda c, s, n, i: s.__delitem__(n // 2 - i)),
+    Op("delete_many", one, "built",
+       lambda c, s, n, i: s.delete_many(range(0, n, 10)),
+       None, None),
+    Op("remove", one, "built",
+       lambda c, s, n, i: s.remove(n - 1),
+       lambda c, s, n, i: s.remove(n - 1),
+       lambda c, s, n, i: s.remove(n - 1)),
+    Op("remove_all", one, "built",
+       lambda c, s, n, i: s.remove_all(n - 1),
+       None, None),
+    Op("remove_if", one, "built",
+       lambda c, s, n, i: s.remove_if(_odd),
+       lambda c, s, n, i: s.__setitem__(slice(None), [x for x in s if not x % 2]),
+       None),
+    Op("update", few, "built",
+       lambda c, s, n, i: s.update(n // 2, i),
+       lambda c, s, n, i: s.__setitem__(n // 2, i),
+       lambda c, s, n, i: s.__setitem__(n // 2, i)),
+    Op("show_val", few, "built",
+       lambda c, s, n, i: s.show_val(n // 2),
+       lambda c, s, n, i: s[n // 2],
+       lambda c, s, n, i: s[n // 2]),
+    Op("show_len", batch, "built",
+       lambda c, s, n, i: s.show_len(),
+       lambda c, s, n, i: len(s),
+       lambda c, s, n, i: len(s)),
+    Op("is_empty", batch, "built",
+       lambda c, s, n, i: s.is_empty(),
+       lambda c, s, n, i: not s,
+       lambda c, s, n, i: not s),
+    Op("find", one, "built",
+       lambda c, s, n, i: s.find(n - 1),
+       lambda c, s, n, i: s.index(n - 1),
+       lambda c, s, n, i: s.index(n - 1)),
+    Op("contains", one, "built",
+       lambda c, s, n, i: -1 in s,
+       lambda c, s, n, i: -1 in s,
+       lambda c, s, n, i: -1 in s),
+    Op("iterate", one, "built",
+       lambda c, s, n, i: _drain(s),
+       lambda c, s, n, i: _drain(s),
+       lambda c, s, n, i: _drain(s)),
+    Op("stream", one, "built",
+       lambda c, s, n, i: s.stream().filter(_odd).take(100).collect(),
+       lambda c, s, n, i: list(islice(filter(_odd, s), 100)),
+       lambda c, s, n, i: deque(islice(filter(_odd, s), 100))),
+    Op("reverse", one, "built",
+       lambda c, s, n, i: s.reverse(),
+       lambda c, s, n, i: s.reverse(),
+       lambda c, s, n, i: s.reverse()),
+    Op("sort", one, "shuffled",
+       lambda c, s, n, i: s.sort(),
+       lambda c, s, n, i: s.sort(),
+       None),
+    Op("concat", one, "pair",
+       lambda c, s, n, i: s[0].concat(s[1]),
+       lambda c, s, n, i: s[0].extend(s[1]),
+       lambda c, s, n, i: s[0].extend(s[1])),
+    Op("splice", one, "pair",
+       lambda c, s, n, i: s[0].splice(n // 2, s[1]),
+       lambda c, s, n, i: s[0].__setitem__(slice(n // 2, n // 2), s[1]),
+       lambda c, s, n, i: _splice_deque(s[0], s[1], n)),
+    Op("split_at", one, "built",
+       lambda c, s, n, i: s.split_at(n // 2),
+       lambda c, s, n, i: _split_list(s, n),
+       None),
+    Op("cut", one, "built",
+       lambda c, s, n, i: s.cut(n // 4, n // 2),
+       None, None),
+    Op("display", one, "built",
+       lambda c, s, n, i: s.display(),
+       lambda c, s, n, i: str(s),
+       lambda c, s, n, i: str(s)),
+]
+
+
+def setup(cls, kind, n):
+    """Return the input an operation starts from."""
+    if kind == "values":
+        return list(range(n))
+    if kind == "empty":
+        return cls()
+    if kind == "shuffled":
+        values = list(range(n))
+        random.Random(n).shuffle(values)
+        return _make(cls, values)
+    if kind == "pair":
+        return _make(cls, range(n)), _make(cls, range(n))
+    return _make(cls, range(n))
+
+
+def implementation(op, cls):
+    """Return the function running op on cls, or None if it has none."""
+    if cls is list:
+        return op.seq
+    if cls is deque:
+        return op.deq
+    return op.linked
+
+
+def measure(op, cls, n, repeat):
+    """Return (seconds per call, peak traced bytes, calls) for op on cls at size n."""
+    fn = implementation(op, cls)
+    calls = op.calls(n)
+    best = float("inf")
+    for _ in range(repeat):
+        s = setup(cls, op.setup, n)
+        gc.collect()
+        start = time.perf_counter()
+        for i in range(calls):
+            fn(cls, s, n, i)
+        best = min(best, time.perf_counter() - start)
+        del s
+    s = setup(cls, op.setup, n)
+    gc.collect()
+    tracemalloc.start()
+    for i in range(calls):
+        fn(cls, s, n, i)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best / calls, peak, calls
+
+
+def run(sizes, only, repeat):
+    """Run the suite and return its results as a JSON-ready dict."""
+    ops = [op for op in OPS if not only or op.name in only]
+    results = []
+    print(f"{'structure':<26}{'op':<21}{'n':>9}{'us/call':>12}{'peak KB':>10}")
+    for n in sizes:
+        for op in ops:
+            for cls in STRUCTURES:
+                if implementation(op, cls) is None:
+                    continue
+                seconds, peak, calls = measure(op, cls, n, repeat)
+                results.append({"structure": cls.__name__, "op": op.name, "n": n,
+                                "calls": calls, "seconds": seconds, "peak_bytes": peak})
+                print(f"{cls.__name__:<26}{op.name:<21}{n:>9}{seconds * 1e6:>12.2f}{peak / 1024:>10.1f}")
+    return {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare(base, new, threshold, min_seconds):
+    """Print how new differs from base and return the number of regressions."""
+    old = {(r["structure"], r["op"], r["n"]): r for r in base["results"]}
+    regressions = 0
+    print(f"{'structure':<26}{'op':<21}{'n':>9}{'time':>9}{'memory':>9}")
+    for r in new["results"]:
+        key = (r["structure"], r["op"], r["n"])
+        before = old.pop(key, None)
+        if before is None:
+            print(f"{key[0]:<26}{key[1]:<21}{key[2]:>9}  new")
+            continue
+        time_ratio = r["seconds"] / before["seconds"] if before["seconds"] else 1.0
+        if max(r["seconds"], before["seconds"]) < min_seconds:
+            time_ratio = 1.0
+        mem_ratio = (r["peak_bytes"] + 1) / (before["peak_bytes"] + 1)
+        worse = time_ratio > 1 + threshold or mem_ratio > 1 + threshold
+        better = time_ratio < 1 - threshold or mem_ratio < 1 - threshold
+        if worse or better:
+            label = "REGRESSION" if worse else "improved"
+            print(f"{key[0]:<26}{key[1]:<21}{key[2]:>9}{time_ratio:>8.2f}x{mem_ratio:>8.2f}x  {label}")
+        regressions += worse
+    for key in old:
+        print(f"{key[0]:<26}{key[1]:<21}{key[2]:>9}  missing")
+    print(f"{regressions} regression(s) beyond {threshold:.0%}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.suite",
+                                     description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_cmd = commands.add_parser("run", help="run the suite")
+    run_cmd.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    run_cmd.add_argument("--only", default="", help="comma-separated operation names")
+    run_cmd.add_argument("--repeat", type=int, default=5)
+    run_cmd.add_argument("--out", help="write the results to this JSON file")
+    cmp_cmd = commands.add_parser("compare", help="flag regressions between two result files")
+    cmp_cmd.add_argument("base")
+    cmp_cmd.add_argument("new")
+    cmp_cmd.add_argument("--threshold", type=float, default=0.2,
+                         help="relative slowdown or memory growth to flag (default 0.2)")
+    cmp_cmd.add_argument("--min-seconds", type=float, default=5e-5,
+                         help="ignore timing changes when both sides are faster than this")
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        only = {name for name in args.only.split(",") if name}
+        results = run(args.sizes, only, args.repeat)
+        if args.out:
+            with open(args.out, "w") as f:
+                json.dump(results, f, indent=1)
+        return 0
+    with open(args.base) as f:
+        base = json.load(f)
+    with open(args.new) as f:
+        new = json.load(f)
+    return 1 if compare(base, new, args.threshold, args.min_seconds) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
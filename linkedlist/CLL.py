@@ -1,300 +1,1044 @@
-from .node import SLLNode
-
-class CircularLinkedList:
-    """A circular singly linked list with head and tail pointers."""
-    __slots__ = ['head', 'tail', 'size']
-
-    def __init__(self):
-        """Initialize an empty circular linked list."""
-        self.head = None
-        self.tail = None
-        self.size = 0
-
-    def is_empty(self):
-        """Return True if the list is empty."""
-        return self.head is None
-
-    def insert_at_beginning(self, data):
-        """Insert a node with the given data at the beginning.
-
-        Args:
-            data: The data to insert.
-        """
-        new_node = SLLNode(data)
-        if not self.head:
-            self.head = self.tail = new_node
-            new_node.next = self.head
-        else:
-            new_node.next = self.head
-            self.head = new_node
-            self.tail.next = self.head
-        self.size += 1
-
-    def insert_at_end(self, data):
-        """Insert a node with the given data at the end.
-
-        Args:
-            data: The data to insert.
-        """
-        new_node = SLLNode(data)
-        if not self.head:
-            self.head = self.tail = new_node
-            new_node.next = self.head
-        else:
-            self.tail.next = new_node
-            self.tail = new_node
-            self.tail.next = self.head
-        self.size += 1
-
-    def insert_at_position(self, data, position):
-        """Insert a node with the given data at the specified 0-based position.
-
-        Args:
-            data: The data to insert.
-            position: The 0-based index where the node should be inserted.
-
-        Raises:
-            ValueError: If position is negative or beyond list length.
-        """
-        if position < 0 or position > self.size:
-            raise ValueError("Invalid position")
-        if position == 0:
-            self.insert_at_beginning(data)
-            return
-        if position == self.size:
-            self.insert_at_end(data)
-            return
-
-        new_node = SLLNode(data)
-        cur = self.head
-        for _ in range(position - 1):
-            cur = cur.next
-        new_node.next = cur.next
-        cur.next = new_node
-        if cur == self.tail:
-            self.tail = new_node
-        self.size += 1
-
-    def delete(self, position):
-        """Delete the node at the specified 0-based position.
-
-        Args:
-            position: The 0-based index of the node to delete.
-
-        Raises:
-            ValueError: If the list is empty or position is invalid.
-        """
-        if not self.head:
-            raise ValueError("Empty list")
-        if position < 0 or position >= self.size:
-            raise ValueError("Invalid position")
-        if position == 0:
-            self.del_at_start()
-            return
-        if position == self.size - 1:
-            self.del_at_end()
-            return
-
-        cur = self.head
-        for _ in range(position - 1):
-            cur = cur.next
-        cur.next = cur.next.next
-        if cur.next == self.head:
-            self.tail = cur
-        self.size -= 1
-
-    def remove(self, data):
-        """Remove the first node with the given data.
-
-        Args:
-            data: The data to remove.
-
-        Raises:
-            ValueError: If the list is empty or data is not found.
-        """
-        if not self.head:
-            raise ValueError("Empty list")
-        if self.head.data == data:
-            self.del_at_start()
-            return
-
-        prev = self.head
-        cur = self.head.next
-        while cur != self.head:
-            if cur.data == data:
-                prev.next = cur.next
-                if cur == self.tail:
-                    self.tail = prev
-                self.size -= 1
-                return
-            prev = cur
-            cur = cur.next
-        raise ValueError("Data not found")
-
-    def del_at_start(self):
-        """Delete the node at the beginning.
-
-        Raises:
-            ValueError: If the list is empty.
-        """
-        if not self.head:
-            raise ValueError("Empty list")
-        if self.head == self.tail:
-            self.head = self.tail = None
-        else:
-            self.head = self.head.next
-            self.tail.next = self.head
-        self.size -= 1
-
-    def del_at_end(self):
-        """Delete the node at the end.
-
-        Raises:
-            ValueError: If the list is empty.
-        """
-        if not self.head:
-            raise ValueError("Empty list")
-        if self.head == self.tail:
-            self.head = self.tail = None
-        else:
-            cur = self.head
-            while cur.next != self.tail:
-                cur = cur.next
-            cur.next = self.head
-            self.tail = cur
-        self.size -= 1
-
-    def update(self, position, data):
-        """Update the data of the node at the specified 0-based position.
-
-        Args:
-            position: The 0-based index of the node to update.
-            data: The new data value.
-
-        Raises:
-            ValueError: If the list is empty or position is invalid.
-        """
-        if not self.head:
-            raise ValueError("Empty list")
-        if position < 0 or position >= self.size:
-            raise ValueError("Invalid position")
-
-        cur = self.head
-        for _ in range(position):
-            cur = cur.next
-        cur.data = data
-
-    def reverse(self):
-        """Reverse the linked list in place."""
-        if not self.head or self.head == self.tail:
-            return
-        prev = None
-        cur = self.head
-        self.tail = self.head
-        while True:
-            next_node = cur.next
-            cur.next = prev
-            prev = cur
-            cur = next_node
-            if cur == self.head:
-                break
-        self.head = prev
-        self.tail.next = self.head
-
-    def show_val(self, position):
-        """Return the data at the specified 0-based position.
-
-        Args:
-            position: The 0-based index of the node.
-
-        Returns:
-            The data at the specified position.
-
-        Raises:
-            ValueError: If the list is empty or position is invalid.
-        """
-        if not self.head:
-            raise ValueError("Empty list")
-        if position < 0 or position >= self.size:
-            raise ValueError("Invalid position")
-
-        cur = self.head
-        for _ in range(position):
-            cur = cur.next
-        return cur.data
-
-    def show_len(self):
-        """Return the number of nodes in the list.
-
-        Returns:
-            The size of the list.
-        """
-        return self.size
-
-    def find(self, data):
-        """Return the 0-based position of the first node with the given data.
-
-        Args:
-            data: The data to find.
-
-        Returns:
-            The 0-based index of the data, or -1 if not found.
-
-        Raises:
-            ValueError: If the list is empty.
-        """
-        if not self.head:
-            raise ValueError("Empty list")
-
-        cur = self.head
-        idx = 0
-        while True:
-            if cur.data == data:
-                return idx
-            cur = cur.next
-            idx += 1
-            if cur == self.head:
-                break
-        return -1
-
-    def generate(self, n):
-        """Generate a list with values from 1 to n at positions 0 to n-1.
-
-        Args:
-            n: The number of nodes to generate.
-
-        Raises:
-            ValueError: If n is negative.
-        """
-        if n < 0:
-            raise ValueError("Invalid size")
-        for i in range(1, n + 1):
-            self.insert_at_position(i, i)
-
-    def display(self):
-        """Return a string representation of the list.
-
-        Returns:
-            A string representing the list.
-        """
-        if not self.head:
-            return "Empty list"
-        result = []
-        cur = self.head
-        while True:
-            result.append(str(cur.data))
-            cur = cur.next
-            if cur == self.head:
-                break
-        return " -> ".join(result) + " -> (back to head)"
-
-    def __iter__(self):
-        """Yield the data of each node in the list."""
-        if not self.head:
-            return
-        cur = self.head
-        while True:
-            yield cur.data
-            cur = cur.next
-            if cur == self.head:
-                break
\ No newline at end of file
+from itertools import islice
+
+from .array_engine import ArrayCircularLinkedList, array_list
+from .hashindex import HashIndex
+from .node import SLLNode
+from .pickling import reduce_list
+from .pool import NodePool
+from .sorting import sort_chain
+from .stream import Stream
+
+class CircularLinkedList:
+    """A circular singly linked list with head and tail pointers."""
+    __slots__ = ['head', 'tail', 'size', '_finger', '_finger_pos', '_index', '_pool']
+
+    def __new__(cls, engine="node", *args, **kwargs):
+        """Create the list, dispatching to the array-backed engine on request.
+
+        ``engine="array"``, given by position or keyword, returns an empty
+        ``ArrayCircularLinkedList``, which is not an instance of this class
+        and supports only the core operations listed on ``ArrayLinkedList``.
+
+        Raises:
+            TypeError: If engine is "array" and an argument matches no option.
+            ValueError: If engine is unknown, or another option is given
+                with the array engine.
+        """
+        if engine == "array":
+            return array_list(ArrayCircularLinkedList,
+                              ("indexed", "key", "pool"), args, kwargs)
+        if engine != "node":
+            raise ValueError("Unknown engine")
+        return super().__new__(cls)
+
+    def __init__(self, engine="node", indexed=False, key=None,
+                 pool=None):
+        """Initialize an empty circular linked list.
+
+        Args:
+            engine: "node" to store one node object per element, or "array"
+                for the array-backed engine in ``array_engine``.
+            indexed: If True, keep a ``HashIndex`` from payload to nodes so
+                membership tests are O(1) and ``remove`` skips the scan.
+            key: Optional function mapping a payload to its index key; with
+                it ``remove`` and ``find`` match nodes by key.
+            pool: Optional ``NodePool`` of SLLNodes that recycles unlinked
+                nodes for later inserts, shareable between lists, or an int
+                capacity for a private pool.
+
+        Raises:
+            ValueError: If pool holds a different node type, or key is
+                given without indexed.
+        """
+        if key is not None and not indexed:
+            raise ValueError("Key needs indexed=True")
+        if isinstance(pool, int):
+            pool = NodePool(SLLNode, pool)
+        if pool is not None and pool.node_type is not SLLNode:
+            raise ValueError("Pool holds the wrong node type")
+        self.head = None
+        self.tail = None
+        self.size = 0
+        self._finger = None
+        self._finger_pos = 0
+        self._index = HashIndex(self, key) if indexed else None
+        self._pool = pool
+
+    def _node_at(self, position):
+        """Return the node at a valid 0-based position.
+
+        The walk starts from the tail, the finger left by the previous walk,
+        or the head, whichever is closest, and leaves the finger on the
+        returned node so sequential access is amortized O(1).
+        """
+        if position == self.size - 1:
+            cur = self.tail
+        else:
+            cur = self.head
+            start = 0
+            if self._finger is not None and self._finger_pos <= position:
+                cur = self._finger
+                start = self._finger_pos
+            for _ in range(position - start):
+                cur = cur.next
+        self._finger = cur
+        self._finger_pos = position
+        return cur
+
+    def _release(self, node):
+        """Hand an unlinked node back to the pool, if the list has one."""
+        if self._pool is not None:
+            self._pool.release(node)
+
+    def _new_node(self, data):
+        """Return a node holding data, taken from the pool when possible."""
+        if self._pool is not None:
+            return self._pool.acquire(data)
+        return SLLNode(data)
+
+    def _linked(self, position, node):
+        """Update the finger and index after node was linked at position."""
+        if self._finger is not None and self._finger_pos >= position:
+            self._finger_pos += 1
+        if self._index is not None:
+            self._index.add(node)
+
+    def _unlinked(self, position, node):
+        """Update the finger and index for node leaving position.
+
+        A position of None means it is unknown, so the finger is dropped.
+        """
+        if self._finger is not None:
+            if position is None or self._finger_pos == position:
+                self._finger = None
+            elif self._finger_pos > position:
+                self._finger_pos -= 1
+        if self._index is not None:
+            self._index.discard(node)
+
+    def _run_linked(self, position, first, count):
+        """Update the finger and index after a run of count nodes was linked."""
+        if self._finger is not None and self._finger_pos >= position:
+            self._finger_pos += count
+        if self._index is not None:
+            self._index.add_run(first, count)
+
+    def _restructured(self):
+        """Resync the finger and indexes after nodes were relinked in bulk."""
+        self._finger = None
+        if self._index is not None:
+            self._index.rebuild()
+
+    def _remove_where(self, doomed, stop=None):
+        """Unlink, in one pass, every node for which doomed(idx, node) holds.
+
+        If doomed raises, the nodes already removed stay removed and the
+        list is left consistent before the exception propagates.
+
+        Args:
+            doomed: Callable taking a 0-based index and a node.
+            stop: Last index worth visiting, or None to walk the whole list.
+
+        Returns:
+            The number of nodes removed.
+        """
+        if not self.head:
+            return 0
+        if stop is None:
+            stop = self.size - 1
+        self.tail.next = None
+        removed = 0
+        prev = None
+        cur = self.head
+        idx = 0
+        try:
+            while cur is not None and idx <= stop:
+                nxt = cur.next
+                if doomed(idx, cur):
+                    if prev is None:
+                        self.head = nxt
+                    else:
+                        prev.next = nxt
+                    self._release(cur)
+                    removed += 1
+                else:
+                    prev = cur
+                cur = nxt
+                idx += 1
+        finally:
+            if cur is None:
+                self.tail = prev
+            if self.head:
+                self.tail.next = self.head
+            if removed:
+                self.size -= removed
+                self._restructured()
+        return removed
+
+    def _run_unlinked(self, position, first, count):
+        """Update the finger and indexes for a run of count nodes leaving position."""
+        if self._finger is not None:
+            if self._finger_pos >= position + count:
+                self._finger_pos -= count
+            elif self._finger_pos >= position:
+                self._finger = None
+        if self._index is not None:
+            self._index.discard_run(first, count)
+
+    def _reset(self):
+        """Forget every node, leaving the nodes themselves untouched."""
+        self.head = None
+        self.tail = None
+        self.size = 0
+        self._finger = None
+        if self._index is not None:
+            self._index.clear()
+
+    def _options(self):
+        """Return the constructor options, other than the pool, that configure this list."""
+        index = self._index
+        return {"indexed": index is not None,
+                "key": index.key if index is not None else None}
+
+    def _like(self):
+        """Return an empty list configured like this one."""
+        return type(self)(pool=self._pool, **self._options())
+
+    @classmethod
+    def from_iterable(cls, iterable, **kwargs):
+        """Build a list from an iterable in a single linking pass.
+
+        Args:
+            iterable: The items to store, in order.
+            **kwargs: Constructor options such as ``engine``.
+
+        Returns:
+            A new list holding the items.
+        """
+        lst = cls(**kwargs)
+        lst.extend(iterable)
+        return lst
+
+    @classmethod
+    def from_range(cls, *args, **kwargs):
+        """Build a list holding ``range(*args)`` in a single linking pass.
+
+        Returns:
+            A new list holding the range values.
+        """
+        return cls.from_iterable(range(*args), **kwargs)
+
+    def is_empty(self):
+        """Return True if the list is empty."""
+        return self.head is None
+
+    def insert_at_beginning(self, data):
+        """Insert a node with the given data at the beginning.
+
+        Args:
+            data: The data to insert.
+        """
+        new_node = self._new_node(data)
+        if not self.head:
+            self.head = self.tail = new_node
+            new_node.next = self.head
+        else:
+            new_node.next = self.head
+            self.head = new_node
+            self.tail.next = self.head
+        self._linked(0, new_node)
+        self.size += 1
+
+    def insert_at_end(self, data):
+        """Insert a node with the given data at the end.
+
+        Args:
+            data: The data to insert.
+        """
+        new_node = self._new_node(data)
+        if not self.head:
+            self.head = self.tail = new_node
+            new_node.next = self.head
+        else:
+            self.tail.next = new_node
+            self.tail = new_node
+            self.tail.next = self.head
+        self._linked(self.size, new_node)
+        self.size += 1
+
+    def insert_at_position(self, data, position):
+        """Insert a node with the given data at the specified 0-based position.
+
+        Args:
+            data: The data to insert.
+            position: The 0-based index where the node should be inserted.
+
+        Raises:
+            ValueError: If position is negative or beyond list length.
+        """
+        if position < 0 or position > self.size:
+            raise ValueError("Invalid position")
+        if position == 0:
+            self.insert_at_beginning(data)
+            return
+        if position == self.size:
+            self.insert_at_end(data)
+            return
+
+        new_node = self._new_node(data)
+        cur = self._node_at(position - 1)
+        new_node.next = cur.next
+        cur.next = new_node
+        if cur == self.tail:
+            self.tail = new_node
+        self._linked(position, new_node)
+        self.size += 1
+
+    def extend(self, iterable):
+        """Append every item of iterable at the end.
+
+        The new nodes are chained in one pass and spliced onto the tail
+        once, so the cost is O(k) for k items.
+
+        Args:
+            iterable: The items to append, in order.
+        """
+        first = last = None
+        count = 0
+        for data in iterable:
+            node = self._new_node(data)
+            if last is None:
+                first = node
+            else:
+                last.next = node
+            last = node
+            count += 1
+        if first is None:
+            return
+
+        if self.head is None:
+            self.head = first
+        else:
+            self.tail.next = first
+        self.tail = last
+        last.next = self.head
+        self._run_linked(self.size, first, count)
+        self.size += count
+
+    def extendleft(self, iterable):
+        """Insert every item of iterable at the beginning, one after another.
+
+        As with ``collections.deque.extendleft`` the items end up in reverse
+        order. The new nodes are chained in one pass and spliced onto the
+        head once.
+
+        Args:
+            iterable: The items to insert.
+        """
+        first = last = None
+        count = 0
+        for data in iterable:
+            node = self._new_node(data)
+            if first is None:
+                last = node
+            else:
+                node.next = first
+            first = node
+            count += 1
+        if first is None:
+            return
+
+        if self.head is None:
+            self.tail = last
+        else:
+            last.next = self.head
+        self.head = first
+        self.tail.next = first
+        self._run_linked(0, first, count)
+        self.size += count
+
+    def concat(self, other):
+        """Move every node of other onto the end of this list in O(1).
+
+        Args:
+            other: A list of the same type; it is left empty.
+        """
+        self.splice(self.size, other)
+
+    def splice(self, position, other):
+        """Move every node of other into this list before position.
+
+        Nodes are relinked, never copied, and other is left empty.
+
+        Args:
+            position: The 0-based index where other's first node should land.
+            other: A list of the same type.
+
+        Raises:
+            TypeError: If other is not a list of the same type.
+            ValueError: If other is this list or position is invalid.
+        """
+        if type(other) is not type(self):
+            raise TypeError("Can only splice a list of the same type")
+        if other is self:
+            raise ValueError("Cannot splice a list into itself")
+        if position < 0 or position > self.size:
+            raise ValueError("Invalid position")
+        if not other.head:
+            return
+
+        first, last, count = other.head, other.tail, other.size
+        other._reset()
+        if position == 0:
+            last.next = self.head
+            if self.head is None:
+                self.tail = last
+            self.head = first
+        elif position == self.size:
+            self.tail.next = first
+            self.tail = last
+        else:
+            prev = self._node_at(position - 1)
+            last.next = prev.next
+            prev.next = first
+        self.tail.next = self.head
+        self._run_linked(position, first, count)
+        self.size += count
+
+    def cut(self, start, stop):
+        """Move the nodes in [start, stop) into a new list.
+
+        Nodes are relinked, never copied.
+
+        Args:
+            start: The 0-based index of the first node to move.
+            stop: The 0-based index one past the last node to move.
+
+        Returns:
+            A new list of the same type holding the moved nodes.
+
+        Raises:
+            ValueError: If the range is invalid.
+        """
+        if start < 0 or stop > self.size or start > stop:
+            raise ValueError("Invalid position")
+        part = self._like()
+        count = stop - start
+        if not count:
+            return part
+
+        prev = self._node_at(start - 1) if start else None
+        last = self._node_at(stop - 1)
+        first = prev.next if prev is not None else self.head
+        after = last.next if stop < self.size else None
+        if count == self.size:
+            self.head = self.tail = None
+        else:
+            if prev is None:
+                self.head = after
+            else:
+                prev.next = after
+            if after is None:
+                self.tail = prev
+            self.tail.next = self.head
+        self._run_unlinked(start, first, count)
+        self.size -= count
+
+        last.next = first
+        part.head = first
+        part.tail = last
+        part._run_linked(0, first, count)
+        part.size = count
+        return part
+
+    def split_at(self, position):
+        """Move the nodes from position onwards into a new list.
+
+        Args:
+            position: The 0-based index of the first node to move.
+
+        Returns:
+            A new list of the same type holding the moved nodes.
+
+        Raises:
+            ValueError: If position is negative or beyond list length.
+        """
+        return self.cut(position, self.size)
+
+    def delete(self, position):
+        """Delete the node at the specified 0-based position.
+
+        Args:
+            position: The 0-based index of the node to delete.
+
+        Raises:
+            ValueError: If the list is empty or position is invalid.
+        """
+        if not self.head:
+            raise ValueError("Empty list")
+        if position < 0 or position >= self.size:
+            raise ValueError("Invalid position")
+        if position == 0:
+            self.del_at_start()
+            return
+        if position == self.size - 1:
+            self.del_at_end()
+            return
+
+        cur = self._node_at(position - 1)
+        old = cur.next
+        self._unlinked(position, old)
+        cur.next = old.next
+        if cur.next == self.head:
+            self.tail = cur
+        self._release(old)
+        self.size -= 1
+
+    def remove(self, data):
+        """Remove the first node with the given data.
+
+        Args:
+            data: The data to remove.
+
+        Raises:
+            ValueError: If the list is empty or data is not found.
+        """
+        if not self.head:
+            raise ValueError("Empty list")
+        prev = self.tail
+        cur = self.head
+        idx = 0
+        if self._index is not None:
+            target = self._index.first(data)
+            if target is None:
+                raise ValueError("Data not found")
+            while cur is not target:
+                prev = cur
+                cur = cur.next
+                idx += 1
+        else:
+            while True:
+                if cur.data == data:
+                    break
+                prev = cur
+                cur = cur.next
+                idx += 1
+                if cur == self.head:
+                    raise ValueError("Data not found")
+        if idx == 0:
+            self.del_at_start()
+            return
+
+        self._unlinked(idx, cur)
+        prev.next = cur.next
+        if cur == self.tail:
+            self.tail = prev
+        self._release(cur)
+        self.size -= 1
+
+    def insert_many(self, items):
+        """Insert several (position, data) pairs in one pass.
+
+        Positions refer to the list before any insertion, so each item lands
+        in front of the node that held its position, or at the end for
+        ``position == size``. Items sharing a position keep their order.
+
+        Args:
+            items: Iterable of (position, data) pairs.
+
+        Raises:
+            ValueError: If any position is negative or beyond list length.
+        """
+        items = sorted(items, key=lambda item: item[0])
+        if not items:
+            return
+        if items[0][0] < 0 or items[-1][0] > self.size:
+            raise ValueError("Invalid position")
+
+        if self.head:
+            self.tail.next = None
+        prev = None
+        cur = self.head
+        idx = 0
+        for position, data in items:
+            while idx < position:
+                prev = cur
+                cur = cur.next
+                idx += 1
+            node = self._new_node(data)
+            node.next = cur
+            if prev is None:
+                self.head = node
+            else:
+                prev.next = node
+            prev = node
+        if cur is None:
+            self.tail = prev
+        if self.head:
+            self.tail.next = self.head
+        self.size += len(items)
+        self._restructured()
+
+    def delete_many(self, positions):
+        """Delete the nodes at several 0-based positions in one pass.
+
+        Positions refer to the list before any deletion; duplicates are
+        ignored.
+
+        Args:
+            positions: Iterable of 0-based indices to delete.
+
+        Raises:
+            ValueError: If the list is empty or any position is invalid.
+        """
+        doomed = set(positions)
+        if not doomed:
+            return
+        if not self.head:
+            raise ValueError("Empty list")
+        if min(doomed) < 0 or max(doomed) >= self.size:
+            raise ValueError("Invalid position")
+        self._remove_where(lambda idx, node: idx in doomed, max(doomed))
+
+    def remove_all(self, data):
+        """Remove every node with the given data in one pass.
+
+        Args:
+            data: The data to remove.
+
+        Returns:
+            The number of nodes removed.
+        """
+        if self._index is not None:
+            doomed = {id(node) for node in self._index.nodes(data)}
+            if not doomed:
+                return 0
+            return self._remove_where(lambda idx, node: id(node) in doomed)
+        return self._remove_where(lambda idx, node: node.data == data)
+
+    def remove_if(self, predicate):
+        """Remove every node whose data satisfies predicate in one pass.
+
+        If predicate raises, the nodes removed before it stay removed.
+
+        Args:
+            predicate: Callable taking the data of a node.
+
+        Returns:
+            The number of nodes removed.
+        """
+        return self._remove_where(lambda idx, node: predicate(node.data))
+
+    def del_at_start(self):
+        """Delete the node at the beginning.
+
+        Raises:
+            ValueError: If the list is empty.
+        """
+        if not self.head:
+            raise ValueError("Empty list")
+        old = self.head
+        self._unlinked(0, old)
+        if self.head == self.tail:
+            self.head = self.tail = None
+        else:
+            self.head = self.head.next
+            self.tail.next = self.head
+        self._release(old)
+        self.size -= 1
+
+    def del_at_end(self):
+        """Delete the node at the end.
+
+        Raises:
+            ValueError: If the list is empty.
+        """
+        if not self.head:
+            raise ValueError("Empty list")
+        old = self.tail
+        self._unlinked(self.size - 1, old)
+        if self.head == self.tail:
+            self.head = self.tail = None
+        else:
+            cur = self._node_at(self.size - 2)
+            cur.next = self.head
+            self.tail = cur
+        self._release(old)
+        self.size -= 1
+
+    def update(self, position, data):
+        """Update the data of the node at the specified 0-based position.
+
+        Args:
+            position: The 0-based index of the node to update.
+            data: The new data value.
+
+        Raises:
+            ValueError: If the list is empty or position is invalid.
+        """
+        if not self.head:
+            raise ValueError("Empty list")
+        if position < 0 or position >= self.size:
+            raise ValueError("Invalid position")
+
+        node = self._node_at(position)
+        if self._index is not None:
+            self._index.discard(node)
+            node.data = data
+            self._index.add(node)
+        else:
+            node.data = data
+
+    def reverse(self):
+        """Reverse the linked list in place."""
+        if not self.head or self.head == self.tail:
+            return
+        prev = None
+        cur = self.head
+        self.tail = self.head
+        while True:
+            next_node = cur.next
+            cur.next = prev
+            prev = cur
+            cur = next_node
+            if cur == self.head:
+                break
+        self.head = prev
+        self.tail.next = self.head
+        self._finger_pos = self.size - 1 - self._finger_pos
+        if self._index is not None:
+            self._index.reverse()
+
+    def rotate(self, k=1):
+        """Rotate the ring k steps to the right, like ``collections.deque.rotate``.
+
+        The last k elements come round to the front, or the first -k go to
+        the back when k is negative. Only head and tail move, so nothing is
+        allocated. The new tail can only be reached going forwards, from
+        the head or from the finger when that is closer, so ``rotate(-k)``
+        takes O(k) hops but ``rotate(k)`` up to O(n - k). An indexed list
+        reorders its index in place, walking the shorter of the two runs
+        that trade ends.
+
+        Args:
+            k: The number of steps, taken modulo the length.
+        """
+        if self.size < 2:
+            return
+        shift = -k % self.size
+        if not shift:
+            return
+        old_head = self.head
+        self.tail = self._node_at(shift - 1)
+        self.head = self.tail.next
+        self._finger_pos = (self._finger_pos - shift) % self.size
+        if self._index is not None:
+            if shift <= self.size - shift:
+                self._index.move_run(old_head, shift, True)
+            else:
+                self._index.move_run(self.head, self.size - shift, False)
+
+    def eliminate_every(self, k, count=None):
+        """Remove every k-th node going round the ring, Josephus style.
+
+        Counting starts at the head, so the first node removed is the one
+        at position k - 1; each later count starts just after the node
+        last removed. The ring is walked once with a trailing pointer, at
+        most min(k, n) - 1 hops per removal, and the head is left on the
+        node the next count would start from, so a later call carries on
+        where this one stopped.
+
+        Args:
+            k: The step; 1 removes nodes in list order.
+            count: The number of nodes to remove, or None for all of them.
+
+        Returns:
+            The removed data, in the order it was removed.
+
+        Raises:
+            ValueError: If k is less than 1 or count is negative or beyond
+                list length.
+        """
+        if k < 1:
+            raise ValueError("Invalid step")
+        if count is None:
+            count = self.size
+        if count < 0 or count > self.size:
+            raise ValueError("Invalid count")
+        removed = []
+        if not count:
+            return removed
+        prev = self.tail
+        left = self.size
+        for _ in range(count):
+            for _ in range((k - 1) % left):
+                prev = prev.next
+            old = prev.next
+            prev.next = old.next
+            removed.append(old.data)
+            self._release(old)
+            left -= 1
+        self.size = left
+        if left:
+            self.tail = prev
+            self.head = prev.next
+        else:
+            self.head = self.tail = None
+        self._restructured()
+        return removed
+
+    def stride(self, k, start=0):
+        """Return a lazy ``Stream`` over every k-th element, once round from start.
+
+        Args:
+            k: The step between the elements yielded.
+            start: The 0-based index of the first element; like ``stream``,
+                the walk wraps past the tail and ends before start.
+
+        Raises:
+            ValueError: If k is less than 1, or start is negative or beyond
+                list length.
+        """
+        if k < 1:
+            raise ValueError("Invalid step")
+        return Stream(self, islice(Stream.of(self, start, wrap=True), 0, None, k))
+
+    def take_every(self, k, start=0):
+        """Move every k-th node, once round from start, into a new list.
+
+        The new list holds what ``stride(k, start)`` would yield, in that
+        order. Nodes are relinked, never copied, in a single pass.
+
+        Args:
+            k: The step between the nodes moved.
+            start: The 0-based index of the first node to move.
+
+        Returns:
+            A new list of the same type holding the moved nodes.
+
+        Raises:
+            ValueError: If k is less than 1, or start is negative or beyond
+                list length.
+        """
+        if k < 1:
+            raise ValueError("Invalid step")
+        if start < 0 or start > self.size:
+            raise ValueError("Invalid position")
+        part = self._like()
+        if not self.head:
+            return part
+        size = self.size
+        self.tail.next = None
+        first = last = prev = None
+        wrapped = taken = 0
+        cur = self.head
+        for idx in range(size):
+            nxt = cur.next
+            if (idx - start) % size % k:
+                prev = cur
+            else:
+                if prev is None:
+                    self.head = nxt
+                else:
+                    prev.next = nxt
+                if last is None:
+                    first = cur
+                else:
+                    last.next = cur
+                last = cur
+                taken += 1
+                if idx < start:
+                    wrapped += 1
+            cur = nxt
+        self.tail = prev
+        if self.head:
+            self.tail.next = self.head
+        self.size -= taken
+        self._restructured()
+
+        last.next = first
+        part.head = first
+        part.tail = last
+        part._run_linked(0, first, taken)
+        part.size = taken
+        part.rotate(-wrapped)
+        return part
+
+    def sort(self, key=None, reverse=False):
+        """Sort the list in place with a stable bottom-up merge sort.
+
+        Only the links of the existing nodes change, so the sort takes
+        O(n log n) time and O(1) extra memory.
+
+        Args:
+            key: Optional function computing a sort key from each payload.
+                It is called on every comparison rather than cached.
+            reverse: If True, sort in descending order.
+
+        If key or a comparison raises, the list keeps all its nodes, in an
+        unspecified order, before the exception propagates.
+        """
+        if self.size < 2:
+            return
+        self.tail.next = None
+        try:
+            sort_chain(self, key, reverse)
+        finally:
+            self.tail.next = self.head
+            self._restructured()
+
+    def show_val(self, position):
+        """Return the data at the specified 0-based position.
+
+        Args:
+            position: The 0-based index of the node.
+
+        Returns:
+            The data at the specified position.
+
+        Raises:
+            ValueError: If the list is empty or position is invalid.
+        """
+        if not self.head:
+            raise ValueError("Empty list")
+        if position < 0 or position >= self.size:
+            raise ValueError("Invalid position")
+
+        return self._node_at(position).data
+
+    def show_len(self):
+        """Return the number of nodes in the list.
+
+        Returns:
+            The size of the list.
+        """
+        return self.size
+
+    def find(self, data):
+        """Return the 0-based position of the first node with the given data.
+
+        Args:
+            data: The data to find.
+
+        Returns:
+            The 0-based index of the data, or -1 if not found.
+
+        Raises:
+            ValueError: If the list is empty.
+        """
+        if not self.head:
+            raise ValueError("Empty list")
+
+        if self._index is not None:
+            target = self._index.first(data)
+            if target is None:
+                return -1
+            cur = self.head
+            idx = 0
+            while cur is not target:
+                cur = cur.next
+                idx += 1
+            return idx
+
+        cur = self.head
+        idx = 0
+        while True:
+            if cur.data == data:
+                return idx
+            cur = cur.next
+            idx += 1
+            if cur == self.head:
+                break
+        return -1
+
+    def generate(self, n):
+        """Generate a list with values from 1 to n at positions 0 to n-1.
+
+        Args:
+            n: The number of nodes to generate.
+
+        Raises:
+            ValueError: If n is negative.
+        """
+        if n < 0:
+            raise ValueError("Invalid size")
+        self.extend(range(1, n + 1))
+
+    def display(self):
+        """Return a string representation of the list.
+
+        Returns:
+            A string representing the list.
+        """
+        if not self.head:
+            return "Empty list"
+        result = []
+        cur = self.head
+        while True:
+            result.append(str(cur.data))
+            cur = cur.next
+            if cur == self.head:
+                break
+        return " -> ".join(result) + " -> (back to head)"
+
+    def stream(self, start=0):
+        """Return a lazy ``Stream`` over the data, once round from position start.
+
+        Args:
+            start: The 0-based index of the first element; the stream wraps
+                past the tail back to the head and ends before start.
+
+        Raises:
+            ValueError: If start is negative or beyond list length.
+        """
+        return Stream.of(self, start, wrap=True)
+
+    def __contains__(self, data):
+        """Return True if some node carries the given data.
+
+        O(1) when the list is indexed; otherwise a linear scan.
+        """
+        if self._index is not None:
+            return data in self._index
+        if not self.head:
+            return False
+        cur = self.head
+        while True:
+            if cur.data == data:
+                return True
+            cur = cur.next
+            if cur == self.head:
+                return False
+
+    def __iter__(self):
+        """Yield the data of each node in the list."""
+        if not self.head:
+            return
+        cur = self.head
+        while True:
+            yield cur.data
+            cur = cur.next
+            if cur == self.head:
+                break
+
+    def __reduce_ex__(self, protocol):
+        """Pickle the payloads as one flat sequence rather than a node chain.
+
+        Numeric payloads are packed into an array, sent out of band under
+        protocol 5. The pool, if any, is not pickled.
+        """
+        return reduce_list(self, protocol, self._options())
+
+    def __copy__(self):
+        """Return a new list, configured like this one, of the same payloads."""
+        new = self._like()
+        new.extend(self)
+        return new
+
+    def __deepcopy__(self, memo):
+        """Return a new list, configured like this one, of copied payloads."""
+        from copy import deepcopy
+        new = self._like()
+        memo[id(self)] = new
+        new.extend(deepcopy(data, memo) for data in self)
+        return new
\ No newline at end of file
@@ -0,0 +1,58 @@
+"""Linked list data structures.
+
+Every public class is importable from the package itself, for example
+``from linkedlist import SingleLinkedList``. Submodules are imported on
+first use of a name from them (PEP 562), so ``import linkedlist`` is cheap
+and optional parts such as the NumPy-backed typed lists cost nothing until
+they are touched.
+"""
+
+_EXPORTS = {
+    "SingleLinkedList": "SLL",
+    "DoubleLinkedList": "DLL",
+    "CircularLinkedList": "CLL",
+    "CircularDoubleLinkedList": "DCLL",
+    "AdaptiveLinkedList": "adaptive",
+    "ArrayLinkedList": "array_engine",
+    "ArraySingleLinkedList": "array_engine",
+    "ArrayDoubleLinkedList": "array_engine",
+    "ArrayCircularLinkedList": "array_engine",
+    "ArrayCircularDoubleLinkedList": "array_engine",
+    "AsyncLinkedQueue": "asyncqueue",
+    "LRUCache": "cache",
+    "LFUCache": "cache",
+    "memoize": "cache",
+    "ConcurrentDoubleLinkedList": "concurrent",
+    "ConcurrentCircularDoubleLinkedList": "concurrent",
+    "HashIndex": "hashindex",
+    "MappedLinkedList": "mapped",
+    "merge_sorted": "merge",
+    "imerge": "merge",
+    "SLLNode": "node",
+    "DLLNode": "node",
+    "NodePool": "pool",
+    "RoundRobin": "roundrobin",
+    "SkipIndex": "skiplist",
+    "Stream": "stream",
+    "TypedLinkedList": "typed",
+    "IntLinkedList": "typed",
+    "FloatLinkedList": "typed",
+    "UnrolledLinkedList": "unrolled",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    """Import the submodule defining name on first access and cache the result."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(__import__(f"{__name__}.{module}", fromlist=[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List the lazily exported names along with the module's own."""
+    return sorted(set(globals()) | set(_EXPORTS))
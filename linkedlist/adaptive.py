@@ -0,0 +1,343 @@
+from .CLL import CircularLinkedList
+from .DCLL import CircularDoubleLinkedList
+from .DLL import DoubleLinkedList
+from .SLL import SingleLinkedList
+
+class AdaptiveLinkedList:
+    """A linked list that picks singly or doubly linked storage from its workload.
+
+    It starts out as a ``SingleLinkedList`` (or ``CircularLinkedList``),
+    whose nodes are a slot smaller. Tail deletions and positional accesses
+    in the back half of the list are counted as backward operations, since
+    singly linked storage has to walk up to them from the front. Once
+    ``promote_after`` of them land within ``window`` operations, the
+    elements are copied into doubly linked storage in one O(n) pass. With
+    ``demote_after`` set, a doubly linked list that then sees that many
+    operations in a row without a backward one is copied back.
+
+    ``history`` records every switch as (operation count, new storage,
+    reason); ``stats`` returns the counters.
+    """
+    __slots__ = ['circular', 'promote_after', 'demote_after', 'window', 'history',
+                 'tail_deletes', 'backward_accesses', 'promotions', 'demotions',
+                 '_list', '_ops', '_backward', '_quiet']
+
+    def __init__(self, circular=False, promote_after=32, demote_after=None, window=1024):
+        """Initialize an empty adaptive list.
+
+        Args:
+            circular: If True, store the elements in a circular list.
+            promote_after: The backward operations within one window that
+                switch to doubly linked storage.
+            demote_after: The consecutive operations without a backward one
+                that switch back to singly linked storage, or None to stay
+                doubly linked once promoted.
+            window: The number of operations after which the backward count
+                starts again from zero.
+
+        Raises:
+            ValueError: If a threshold or the window is less than 1.
+        """
+        if promote_after < 1 or window < 1 or (demote_after is not None and demote_after < 1):
+            raise ValueError("Invalid threshold")
+        self.circular = circular
+        self.promote_after = promote_after
+        self.demote_after = demote_after
+        self.window = window
+        self.history = []
+        self.tail_deletes = 0
+        self.backward_accesses = 0
+        self.promotions = 0
+        self.demotions = 0
+        self._list = CircularLinkedList() if circular else SingleLinkedList()
+        self._ops = 0
+        self._backward = 0
+        self._quiet = 0
+
+    @property
+    def size(self):
+        """The number of elements."""
+        return self._list.size
+
+    @property
+    def doubly(self):
+        """True while the elements are in doubly linked storage."""
+        return isinstance(self._list, (DoubleLinkedList, CircularDoubleLinkedList))
+
+    def _switch(self, doubly, reason):
+        """Copy the elements into the other storage in one pass."""
+        if doubly:
+            cls = CircularDoubleLinkedList if self.circular else DoubleLinkedList
+            self.promotions += 1
+        else:
+            cls = CircularLinkedList if self.circular else SingleLinkedList
+            self.demotions += 1
+        self._list = cls.from_iterable(self._list)
+        self.history.append((self._ops, "doubly" if doubly else "singly", reason))
+        self._backward = 0
+        self._quiet = 0
+
+    def _count(self, backward=False):
+        """Record one successful operation and switch storage if a threshold is crossed."""
+        self._ops += 1
+        if self._ops % self.window == 0:
+            self._backward = 0
+        if backward:
+            self._backward += 1
+            self._quiet = 0
+            if not self.doubly and self._backward >= self.promote_after:
+                self._switch(True, f"{self._backward} backward operations "
+                                   f"in a {self.window}-operation window")
+        elif self.demote_after is not None and self.doubly:
+            self._quiet += 1
+            if self._quiet >= self.demote_after:
+                self._switch(False, f"{self._quiet} operations without a backward one")
+
+    def _positional(self, position, method, *args):
+        """Call a positional method of the list, then record the operation.
+
+        It counts as backward when position lies in the back half of the
+        list as it was before the call. Nothing is recorded if the call
+        raises.
+        """
+        backward = position > self._list.size // 2
+        result = method(*args)
+        if backward:
+            self.backward_accesses += 1
+        self._count(backward)
+        return result
+
+    def stats(self):
+        """Return a snapshot of the counters.
+
+        Returns:
+            A dict with the storage in use, the operation count, the tail
+            deletions and backward accesses seen, and the number of
+            promotions and demotions.
+        """
+        return {
+            "storage": "doubly" if self.doubly else "singly",
+            "operations": self._ops,
+            "tail_deletes": self.tail_deletes,
+            "backward_accesses": self.backward_accesses,
+            "promotions": self.promotions,
+            "demotions": self.demotions,
+        }
+
+    @classmethod
+    def from_iterable(cls, iterable, **kwargs):
+        """Build a list from an iterable in a single linking pass.
+
+        Args:
+            iterable: The items to store, in order.
+            **kwargs: Constructor options such as ``promote_after``.
+
+        Returns:
+            A new list holding the items.
+        """
+        lst = cls(**kwargs)
+        lst._list.extend(iterable)
+        return lst
+
+    @classmethod
+    def from_range(cls, *args, **kwargs):
+        """Build a list holding ``range(*args)`` in a single linking pass.
+
+        Returns:
+            A new list holding the range values.
+        """
+        return cls.from_iterable(range(*args), **kwargs)
+
+    def is_empty(self):
+        """Return True if the list is empty."""
+        return self._list.size == 0
+
+    def insert_at_beginning(self, data):
+        """Insert the given data at the beginning.
+
+        Args:
+            data: The data to insert.
+        """
+        self._list.insert_at_beginning(data)
+        self._count()
+
+    def insert_at_end(self, data):
+        """Insert the given data at the end.
+
+        Args:
+            data: The data to insert.
+        """
+        self._list.insert_at_end(data)
+        self._count()
+
+    def insert_at_position(self, data, position):
+        """Insert the given data at the specified 0-based position.
+
+        Args:
+            data: The data to insert.
+            position: The 0-based index where the data should be inserted.
+
+        Raises:
+            ValueError: If position is negative or beyond list length.
+        """
+        self._positional(position, self._list.insert_at_position, data, position)
+
+    def extend(self, iterable):
+        """Append every item of iterable at the end.
+
+        Args:
+            iterable: The items to append, in order.
+        """
+        self._list.extend(iterable)
+        self._count()
+
+    def extendleft(self, iterable):
+        """Insert every item of iterable at the beginning, one after another.
+
+        Args:
+            iterable: The items to insert; they end up in reverse order.
+        """
+        self._list.extendleft(iterable)
+        self._count()
+
+    def delete(self, position):
+        """Delete the element at the specified 0-based position.
+
+        Args:
+            position: The 0-based index of the element to delete.
+
+        Raises:
+            ValueError: If the list is empty or position is invalid.
+        """
+        self._positional(position, self._list.delete, position)
+
+    def remove(self, data):
+        """Remove the first element equal to data.
+
+        Args:
+            data: The data to remove.
+
+        Raises:
+            ValueError: If the list is empty or data is not found.
+        """
+        self._list.remove(data)
+        self._count()
+
+    def del_at_start(self):
+        """Delete the element at the beginning.
+
+        Raises:
+            ValueError: If the list is empty.
+        """
+        self._list.del_at_start()
+        self._count()
+
+    def del_at_end(self):
+        """Delete the element at the end.
+
+        Raises:
+            ValueError: If the list is empty.
+        """
+        self._list.del_at_end()
+        self.tail_deletes += 1
+        self._count(True)
+
+    def update(self, position, data):
+        """Update the element at the specified 0-based position.
+
+        Args:
+            position: The 0-based index of the element to update.
+            data: The new data value.
+
+        Raises:
+            ValueError: If the list is empty or position is invalid.
+        """
+        self._positional(position, self._list.update, position, data)
+
+    def reverse(self):
+        """Reverse the list in place."""
+        self._list.reverse()
+        self._count()
+
+    def sort(self, key=None, reverse=False):
+        """Sort the list in place with a stable merge sort.
+
+        Args:
+            key: Optional function computing a sort key from each payload.
+            reverse: If True, sort in descending order.
+        """
+        self._list.sort(key, reverse)
+        self._count()
+
+    def show_val(self, position):
+        """Return the data at the specified 0-based position.
+
+        Args:
+            position: The 0-based index of the element.
+
+        Returns:
+            The data at the specified position.
+
+        Raises:
+            ValueError: If the list is empty or position is invalid.
+        """
+        return self._positional(position, self._list.show_val, position)
+
+    def show_len(self):
+        """Return the number of elements in the list.
+
+        Returns:
+            The size of the list.
+        """
+        return self._list.size
+
+    def find(self, data):
+        """Return the 0-based position of the first element equal to data.
+
+        Args:
+            data: The data to find.
+
+        Returns:
+            The 0-based index of the data, or -1 if not found.
+
+        Raises:
+            ValueError: If the list is empty.
+        """
+        position = self._list.find(data)
+        self._count()
+        return position
+
+    def generate(self, n):
+        """Generate a list with values from 1 to n at positions 0 to n-1.
+
+        Args:
+            n: The number of elements to generate.
+
+        Raises:
+            ValueError: If n is negative.
+        """
+        self._list.generate(n)
+        self._count()
+
+    def display(self):
+        """Return a string representation of the list.
+
+        Returns:
+            A string representing the list.
+        """
+        if not self._list.size:
+            return "Empty list"
+        end = " -> (back to head)" if self.circular else " -> None"
+        return " -> ".join(map(str, self._list)) + end
+
+    def stream(self, start=0):
+        """Return a lazy ``Stream`` over the data, as the underlying list does."""
+        return self._list.stream(start)
+
+    def __contains__(self, data):
+        """Return True if some element equals data."""
+        return data in self._list
+
+    def __iter__(self):
+        """Yield each element in list order."""
+        return iter(self._list)
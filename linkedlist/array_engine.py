@@ -0,0 +1,481 @@
+from array import array
+
+NIL = -1
+
+
+_NODE_DEFAULTS = {"skiplist": False, "indexed": False, "key": None, "pool": None}
+
+
+def array_list(cls, options, args, kwargs):
+    """Return an empty cls for ``engine="array"``, refusing node-engine options.
+
+    Args:
+        cls: The array-backed class to build.
+        options: The names of the node-engine options, in constructor order.
+        args: The positional constructor arguments after ``engine``.
+        kwargs: The keyword constructor arguments other than ``engine``.
+
+    Raises:
+        TypeError: If an argument matches no option, or one option twice.
+        ValueError: If any option is given a value other than its default.
+    """
+    if len(args) > len(options):
+        raise TypeError("Too many arguments")
+    given = dict(zip(options, args))
+    for name, value in kwargs.items():
+        if name not in options or name in given:
+            raise TypeError(f"Unexpected argument {name!r}")
+        given[name] = value
+    if any(value is not _NODE_DEFAULTS[name] for name, value in given.items()):
+        raise ValueError("Option not supported by the array engine")
+    return cls()
+
+
+class ArrayLinkedList:
+    """A linked list whose nodes live in parallel arrays.
+
+    Links are integer slot indices held in ``array('q')`` columns and the
+    payloads sit in one parallel list, so an element costs a few machine
+    words instead of a full node object. Freed slots are threaded onto a
+    free-list through the ``next`` column and recycled by later inserts.
+
+    Subclasses pick the shape through the ``doubly`` and ``circular`` class
+    attributes; ``head`` and ``tail`` are slot indices (``NIL`` when empty).
+
+    The engine covers the core interface only: construction through the
+    node classes' ``from_iterable``/``from_range``, ``is_empty``, the
+    ``insert_at_*`` methods, ``extend``, ``extendleft``, ``delete``,
+    ``remove``, ``del_at_start``, ``del_at_end``, ``update``, ``reverse``,
+    ``show_val``, ``show_len``, ``find``, ``generate``, ``display``,
+    ``nbytes``, ``in`` and iteration. Indexes, pools, relinking and batch
+    operations, sorting, streams, rotation and ``reversed`` need the node
+    engine.
+    """
+    __slots__ = ['head', 'tail', 'size', '_next', '_prev', '_data', '_free']
+
+    doubly = False
+    circular = False
+    _sep = " -> "
+    _end = " -> None"
+
+    def __init__(self):
+        """Initialize an empty array-backed linked list."""
+        self.head = NIL
+        self.tail = NIL
+        self.size = 0
+        self._next = array('q')
+        self._prev = array('q') if self.doubly else None
+        self._data = []
+        self._free = NIL
+
+    def _alloc(self, data):
+        """Return a slot holding data, reusing a freed slot when possible."""
+        slot = self._free
+        if slot != NIL:
+            self._free = self._next[slot]
+            self._next[slot] = NIL
+            self._data[slot] = data
+            return slot
+        self._next.append(NIL)
+        if self.doubly:
+            self._prev.append(NIL)
+        self._data.append(data)
+        return len(self._data) - 1
+
+    def _release(self, slot):
+        """Scrub a slot and push it onto the free-list."""
+        self._data[slot] = None
+        if self.doubly:
+            self._prev[slot] = NIL
+        self._next[slot] = self._free
+        self._free = slot
+
+    def _close(self):
+        """Restore the end links after head or tail changed."""
+        if not self.size:
+            self.head = self.tail = NIL
+            return
+        if self.circular:
+            self._next[self.tail] = self.head
+            if self.doubly:
+                self._prev[self.head] = self.tail
+        else:
+            self._next[self.tail] = NIL
+            if self.doubly:
+                self._prev[self.head] = NIL
+
+    def _slot_at(self, position):
+        """Return the slot at a valid 0-based position."""
+        nxt = self._next
+        if self.doubly and position > self.size // 2:
+            prv = self._prev
+            cur = self.tail
+            for _ in range(self.size - 1 - position):
+                cur = prv[cur]
+            return cur
+        cur = self.head
+        for _ in range(position):
+            cur = nxt[cur]
+        return cur
+
+    def _slot_before(self, slot):
+        """Return the slot preceding a non-head slot."""
+        if self.doubly:
+            return self._prev[slot]
+        nxt = self._next
+        cur = self.head
+        while nxt[cur] != slot:
+            cur = nxt[cur]
+        return cur
+
+    def _unlink(self, prev, slot):
+        """Unlink slot given its predecessor (NIL for the head)."""
+        nxt = self._next[slot]
+        if slot == self.head:
+            self.head = nxt
+        else:
+            self._next[prev] = nxt
+        if slot == self.tail:
+            self.tail = prev
+        elif self.doubly:
+            self._prev[nxt] = prev
+        self._release(slot)
+        self.size -= 1
+        self._close()
+
+    def is_empty(self):
+        """Return True if the list is empty."""
+        return self.size == 0
+
+    def insert_at_beginning(self, data):
+        """Insert a node with the given data at the beginning.
+
+        Args:
+            data: The data to insert.
+        """
+        slot = self._alloc(data)
+        if not self.size:
+            self.head = self.tail = slot
+        else:
+            self._next[slot] = self.head
+            if self.doubly:
+                self._prev[self.head] = slot
+            self.head = slot
+        self.size += 1
+        self._close()
+
+    def insert_at_end(self, data):
+        """Insert a node with the given data at the end.
+
+        Args:
+            data: The data to insert.
+        """
+        slot = self._alloc(data)
+        if not self.size:
+            self.head = self.tail = slot
+        else:
+            self._next[self.tail] = slot
+            if self.doubly:
+                self._prev[slot] = self.tail
+            self.tail = slot
+        self.size += 1
+        self._close()
+
+    def insert_at_position(self, data, position):
+        """Insert a node with the given data at the specified 0-based position.
+
+        Args:
+            data: The data to insert.
+            position: The 0-based index where the node should be inserted.
+
+        Raises:
+            ValueError: If position is negative or beyond list length.
+        """
+        if position < 0 or position > self.size:
+            raise ValueError("Invalid position")
+        if position == 0:
+            self.insert_at_beginning(data)
+            return
+        if position == self.size:
+            self.insert_at_end(data)
+            return
+
+        prev = self._slot_at(position - 1)
+        slot = self._alloc(data)
+        nxt = self._next[prev]
+        self._next[slot] = nxt
+        self._next[prev] = slot
+        if self.doubly:
+            self._prev[slot] = prev
+            self._prev[nxt] = slot
+        self.size += 1
+
+    def extend(self, iterable):
+        """Append every item of iterable at the end in a single pass.
+
+        Args:
+            iterable: The items to append, in order.
+        """
+        nxt = self._next
+        prv = self._prev
+        last = self.tail
+        for data in iterable:
+            slot = self._alloc(data)
+            if last == NIL:
+                self.head = slot
+            else:
+                nxt[last] = slot
+                if prv is not None:
+                    prv[slot] = last
+            last = slot
+            self.size += 1
+        self.tail = last
+        self._close()
+
+    def extendleft(self, iterable):
+        """Insert every item of iterable at the beginning, one after another.
+
+        As with ``collections.deque.extendleft`` the items end up in reverse
+        order.
+
+        Args:
+            iterable: The items to insert.
+        """
+        nxt = self._next
+        prv = self._prev
+        first = self.head
+        for data in iterable:
+            slot = self._alloc(data)
+            if first == NIL:
+                self.tail = slot
+            else:
+                nxt[slot] = first
+                if prv is not None:
+                    prv[first] = slot
+            first = slot
+            self.size += 1
+        self.head = first
+        self._close()
+
+    def delete(self, position):
+        """Delete the node at the specified 0-based position.
+
+        Args:
+            position: The 0-based index of the node to delete.
+
+        Raises:
+            ValueError: If the list is empty or position is invalid.
+        """
+        if not self.size:
+            raise ValueError("Empty list")
+        if position < 0 or position >= self.size:
+            raise ValueError("Invalid position")
+        if position == 0:
+            self._unlink(NIL, self.head)
+            return
+        prev = self._slot_at(position - 1)
+        self._unlink(prev, self._next[prev])
+
+    def remove(self, data):
+        """Remove the first node with the given data.
+
+        Args:
+            data: The data to remove.
+
+        Raises:
+            ValueError: If the list is empty or data is not found.
+        """
+        if not self.size:
+            raise ValueError("Empty list")
+        nxt = self._next
+        values = self._data
+        prev = NIL
+        cur = self.head
+        for _ in range(self.size):
+            if values[cur] == data:
+                self._unlink(prev, cur)
+                return
+            prev = cur
+            cur = nxt[cur]
+        raise ValueError("Data not found")
+
+    def del_at_start(self):
+        """Delete the node at the beginning.
+
+        Raises:
+            ValueError: If the list is empty.
+        """
+        if not self.size:
+            raise ValueError("Empty list")
+        self._unlink(NIL, self.head)
+
+    def del_at_end(self):
+        """Delete the node at the end.
+
+        Raises:
+            ValueError: If the list is empty.
+        """
+        if not self.size:
+            raise ValueError("Empty list")
+        if self.size == 1:
+            self._unlink(NIL, self.tail)
+        else:
+            self._unlink(self._slot_before(self.tail), self.tail)
+
+    def update(self, position, data):
+        """Update the data of the node at the specified 0-based position.
+
+        Args:
+            position: The 0-based index of the node to update.
+            data: The new data value.
+
+        Raises:
+            ValueError: If the list is empty or position is invalid.
+        """
+        if not self.size:
+            raise ValueError("Empty list")
+        if position < 0 or position >= self.size:
+            raise ValueError("Invalid position")
+        self._data[self._slot_at(position)] = data
+
+    def reverse(self):
+        """Reverse the linked list in place."""
+        if self.size < 2:
+            return
+        nxt = self._next
+        prv = self._prev
+        prev = NIL
+        cur = self.head
+        for _ in range(self.size):
+            following = nxt[cur]
+            nxt[cur] = prev
+            if prv is not None:
+                prv[cur] = following
+            prev = cur
+            cur = following
+        self.head, self.tail = self.tail, self.head
+        self._close()
+
+    def show_val(self, position):
+        """Return the data at the specified 0-based position.
+
+        Args:
+            position: The 0-based index of the node.
+
+        Returns:
+            The data at the specified position.
+
+        Raises:
+            ValueError: If the list is empty or position is invalid.
+        """
+        if not self.size:
+            raise ValueError("Empty list")
+        if position < 0 or position >= self.size:
+            raise ValueError("Invalid position")
+        return self._data[self._slot_at(position)]
+
+    def show_len(self):
+        """Return the number of nodes in the list.
+
+        Returns:
+            The size of the list.
+        """
+        return self.size
+
+    def find(self, data):
+        """Return the 0-based position of the first node with the given data.
+
+        Args:
+            data: The data to find.
+
+        Returns:
+            The 0-based index of the data, or -1 if not found.
+
+        Raises:
+            ValueError: If the list is empty.
+        """
+        if not self.size:
+            raise ValueError("Empty list")
+        nxt = self._next
+        values = self._data
+        cur = self.head
+        for idx in range(self.size):
+            if values[cur] == data:
+                return idx
+            cur = nxt[cur]
+        return -1
+
+    def generate(self, n):
+        """Generate a list with values from 1 to n at positions 0 to n-1.
+
+        Args:
+            n: The number of nodes to generate.
+
+        Raises:
+            ValueError: If n is negative.
+        """
+        if n < 0:
+            raise ValueError("Invalid size")
+        self.extend(range(1, n + 1))
+
+    def display(self):
+        """Return a string representation of the list.
+
+        Returns:
+            A string representing the list.
+        """
+        if not self.size:
+            return "Empty list"
+        return self._sep.join(str(data) for data in self) + self._end
+
+    def nbytes(self):
+        """Return the bytes held by the link columns and payload list.
+
+        The payload objects themselves are not counted.
+        """
+        total = self._next.itemsize * len(self._next)
+        if self._prev is not None:
+            total += self._prev.itemsize * len(self._prev)
+        return total + self._data.__sizeof__()
+
+    def __contains__(self, data):
+        """Return True if some node carries the given data."""
+        return any(value == data for value in self)
+
+    def __iter__(self):
+        """Yield the data of each node in the list."""
+        nxt = self._next
+        values = self._data
+        cur = self.head
+        for _ in range(self.size):
+            yield values[cur]
+            cur = nxt[cur]
+
+
+class ArraySingleLinkedList(ArrayLinkedList):
+    """Array-backed counterpart of ``SingleLinkedList``."""
+    __slots__ = []
+
+
+class ArrayDoubleLinkedList(ArrayLinkedList):
+    """Array-backed counterpart of ``DoubleLinkedList``."""
+    __slots__ = []
+    doubly = True
+    _sep = " <-> "
+    _end = " <-> None"
+
+
+class ArrayCircularLinkedList(ArrayLinkedList):
+    """Array-backed counterpart of ``CircularLinkedList``."""
+    __slots__ = []
+    circular = True
+    _end = " -> (back to head)"
+
+
+class ArrayCircularDoubleLinkedList(ArrayLinkedList):
+    """Array-backed counterpart of ``CircularDoubleLinkedList``."""
+    __slots__ = []
+    doubly = True
+    circular = True
+    _sep = " <-> "
+    _end = " <-> (back to head)"
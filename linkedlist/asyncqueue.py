@@ -0,0 +1,144 @@
+import asyncio
+from collections import deque
+
+from .DLL import DoubleLinkedList
+
+class AsyncLinkedQueue:
+    """A FIFO queue for asyncio tasks, stored in a DoubleLinkedList.
+
+    Items are appended at the tail and taken from the head. A ``put`` that
+    finds a consumer waiting claims the queued item for it, and a ``get``
+    that frees a slot reserves it for the oldest blocked producer. Woken
+    waiters move their own item once they resume, and one cancelled before
+    that passes its claim or slot to the next waiter, so each wakeup goes
+    to exactly one waiter that can finish, with no re-checking. The nowait
+    methods raise ``asyncio.QueueEmpty`` and ``asyncio.QueueFull`` as
+    ``asyncio.Queue`` does.
+    """
+    __slots__ = ['maxsize', '_items', '_getters', '_putters', '_claimed', '_reserved']
+
+    def __init__(self, maxsize=0):
+        """Initialize an empty queue.
+
+        Args:
+            maxsize: The most items held before ``put`` blocks; 0 or less
+                means unbounded.
+        """
+        self.maxsize = maxsize
+        self._items = DoubleLinkedList()
+        self._getters = deque()
+        self._putters = deque()
+        self._claimed = 0
+        self._reserved = 0
+
+    @staticmethod
+    def _wake(waiters):
+        """Wake the oldest waiter that is still waiting.
+
+        Returns:
+            True if a waiter was woken.
+        """
+        while waiters:
+            fut = waiters.popleft()
+            if not fut.done():
+                fut.set_result(None)
+                return True
+        return False
+
+    def _take(self):
+        """Pop the head item and reserve the freed slot for a blocked producer."""
+        items = self._items
+        data = items.head.data
+        items.del_at_start()
+        if self._wake(self._putters):
+            self._reserved += 1
+        return data
+
+    def _add(self, item):
+        """Append item and claim it for the oldest waiting consumer, if any."""
+        self._items.insert_at_end(item)
+        if self._wake(self._getters):
+            self._claimed += 1
+
+    def qsize(self):
+        """Return the number of queued items."""
+        return self._items.size
+
+    def empty(self):
+        """Return True if no item is queued."""
+        return self._items.size == 0
+
+    def full(self):
+        """Return True if put would block."""
+        return 0 < self.maxsize <= self._items.size + self._reserved
+
+    def put_nowait(self, item):
+        """Queue item without blocking.
+
+        Raises:
+            asyncio.QueueFull: If the queue holds maxsize items.
+        """
+        if self.full():
+            raise asyncio.QueueFull
+        self._add(item)
+
+    async def put(self, item):
+        """Queue item, waiting for a free slot if the queue is full."""
+        if self.full():
+            fut = asyncio.get_running_loop().create_future()
+            self._putters.append(fut)
+            try:
+                await fut
+            except asyncio.CancelledError:
+                if fut.done() and not fut.cancelled():
+                    self._reserved -= 1
+                    if self._wake(self._putters):
+                        self._reserved += 1
+                raise
+            self._reserved -= 1
+        self._add(item)
+
+    def get_nowait(self):
+        """Remove and return the head item without blocking.
+
+        Raises:
+            asyncio.QueueEmpty: If the queue is empty.
+        """
+        if self._items.size <= self._claimed:
+            raise asyncio.QueueEmpty
+        return self._take()
+
+    async def get(self):
+        """Remove and return the head item, waiting for one if needed."""
+        if self._items.size <= self._claimed:
+            fut = asyncio.get_running_loop().create_future()
+            self._getters.append(fut)
+            try:
+                await fut
+            except asyncio.CancelledError:
+                if fut.done() and not fut.cancelled():
+                    self._claimed -= 1
+                    if self._wake(self._getters):
+                        self._claimed += 1
+                raise
+            self._claimed -= 1
+        return self._take()
+
+    async def get_many(self, n):
+        """Wait for at least one item, then return up to n items.
+
+        Args:
+            n: The most items to return.
+
+        Returns:
+            A list of between 1 and n items, oldest first.
+
+        Raises:
+            ValueError: If n is less than 1.
+        """
+        if n < 1:
+            raise ValueError("Invalid size")
+        batch = [await self.get()]
+        while len(batch) < n and self._items.size > self._claimed:
+            batch.append(self._take())
+        return batch
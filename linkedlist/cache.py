@@ -0,0 +1,308 @@
+from functools import wraps
+
+from .DLL import DoubleLinkedList
+from .node import DLLNode
+
+_MISSING = object()
+_KWARGS = object()
+
+class _Entry:
+    """A cached key and value with its weight and use count."""
+    __slots__ = ['key', 'value', 'weight', 'freq']
+
+    def __init__(self, key, value, weight):
+        self.key = key
+        self.value = value
+        self.weight = weight
+        self.freq = 1
+
+class _Cache:
+    """Lookup, limits, eviction and counters shared by the caches.
+
+    Each key maps to a DLLNode whose data is an ``_Entry``. Subclasses
+    decide the eviction order through ``_link``, ``_unlink``, ``_used``
+    and ``_victim``, all O(1) node relinks.
+    """
+    __slots__ = ['capacity', 'max_weight', 'weigh', 'on_evict', 'weight',
+                 'hits', 'misses', 'evictions', '_map']
+
+    def __init__(self, capacity=128, max_weight=None, weigh=None, on_evict=None):
+        """Initialize an empty cache.
+
+        Args:
+            capacity: The most entries kept, or None for no count limit.
+            max_weight: The most total weight kept, or None for no limit.
+            weigh: Function giving the weight of a value; each value
+                weighs 1 without it.
+            on_evict: Optional callback ``on_evict(key, value)`` run for
+                every entry evicted to make room.
+
+        Raises:
+            ValueError: If capacity or max_weight is negative.
+        """
+        if (capacity is not None and capacity < 0) or (max_weight is not None and max_weight < 0):
+            raise ValueError("Invalid capacity")
+        self.capacity = capacity
+        self.max_weight = max_weight
+        self.weigh = weigh
+        self.on_evict = on_evict
+        self.weight = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._map = {}
+
+    def _drop(self, node):
+        """Unlink an entry's node and forget its key."""
+        self._unlink(node)
+        del self._map[node.data.key]
+        self.weight -= node.data.weight
+
+    def _evict_for(self, weight):
+        """Evict entries until one more entry of the given weight fits."""
+        while self._map and (
+                (self.capacity is not None and len(self._map) >= self.capacity)
+                or (self.max_weight is not None and self.weight + weight > self.max_weight)):
+            node = self._victim()
+            self._drop(node)
+            self.evictions += 1
+            if self.on_evict is not None:
+                self.on_evict(node.data.key, node.data.value)
+
+    def get(self, key, default=None):
+        """Return the value for key and record the use.
+
+        Args:
+            key: The key to look up.
+            default: Returned, and counted as a miss, if key is absent.
+        """
+        node = self._map.get(key)
+        if node is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._used(node)
+        return node.data.value
+
+    def peek(self, key, default=None):
+        """Return the value for key without counting or recording a use."""
+        node = self._map.get(key)
+        return default if node is None else node.data.value
+
+    def put(self, key, value):
+        """Store value under key, evicting other entries if it does not fit.
+
+        Replacing a value reuses the key's node and counts as a use.
+
+        Raises:
+            ValueError: If the value alone is heavier than the limits allow.
+        """
+        weight = 1 if self.weigh is None else self.weigh(value)
+        if self.capacity == 0 or (self.max_weight is not None and weight > self.max_weight):
+            raise ValueError("Item too heavy")
+        node = self._map.get(key)
+        if node is None:
+            node = DLLNode(_Entry(key, value, weight))
+        else:
+            self._drop(node)
+            node.data.value = value
+            node.data.weight = weight
+            node.data.freq += 1
+        self._evict_for(weight)
+        self._link(node)
+        self._map[key] = node
+        self.weight += weight
+
+    def pop(self, key, default=_MISSING):
+        """Remove key and return its value without calling on_evict.
+
+        Raises:
+            KeyError: If key is absent and no default is given.
+        """
+        node = self._map.get(key)
+        if node is None:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        self._drop(node)
+        return node.data.value
+
+    def stats(self):
+        """Return a snapshot of the cache counters.
+
+        Returns:
+            A dict with the entry count, total weight, hits, misses and
+            evictions.
+        """
+        return {
+            "size": len(self._map),
+            "weight": self.weight,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def reset_stats(self):
+        """Zero the hit, miss and eviction counters."""
+        self.hits = self.misses = self.evictions = 0
+
+    def __contains__(self, key):
+        """Return True if key is cached, without recording a use."""
+        return key in self._map
+
+    def __len__(self):
+        """Return the number of cached entries."""
+        return len(self._map)
+
+class LRUCache(_Cache):
+    """A least-recently-used cache with O(1) get, put and eviction.
+
+    Nodes sit in one DoubleLinkedList from most to least recently used. A
+    use relinks the existing node at the head and eviction takes the tail.
+    """
+    __slots__ = ['_order']
+
+    def __init__(self, capacity=128, max_weight=None, weigh=None, on_evict=None):
+        """Initialize an empty cache.
+
+        Args:
+            capacity: The most entries kept, or None for no count limit.
+            max_weight: The most total weight kept, or None for no limit.
+            weigh: Function giving the weight of a value; each value
+                weighs 1 without it.
+            on_evict: Optional callback ``on_evict(key, value)`` run for
+                every entry evicted to make room.
+
+        Raises:
+            ValueError: If capacity or max_weight is negative.
+        """
+        super().__init__(capacity, max_weight, weigh, on_evict)
+        self._order = DoubleLinkedList()
+
+    def _link(self, node):
+        """Link a node as the most recently used."""
+        self._order._push_front(node)
+
+    def _unlink(self, node):
+        """Unlink a node from the recency order."""
+        self._order._detach(node)
+
+    def _used(self, node):
+        """Relink a used node at the head."""
+        self._order._move_to_front(node)
+
+    def _victim(self):
+        """Return the least recently used node."""
+        return self._order.tail
+
+    def move_to_front(self, key):
+        """Mark key most recently used without counting a hit.
+
+        Raises:
+            KeyError: If key is not cached.
+        """
+        self._order._move_to_front(self._map[key])
+
+    def keys(self):
+        """Return the keys from most to least recently used."""
+        return [entry.key for entry in self._order]
+
+    def clear(self):
+        """Drop every entry without calling on_evict."""
+        self._order._reset()
+        self._map.clear()
+        self.weight = 0
+
+class LFUCache(_Cache):
+    """A least-frequently-used cache with O(1) get, put and eviction.
+
+    Nodes are kept in one DoubleLinkedList per use count, most recent
+    first, so ties are broken by recency. A use relinks the node into the
+    next bucket and eviction takes the tail of the lowest bucket.
+    """
+    __slots__ = ['_buckets', '_min_freq', '_spare']
+
+    def __init__(self, capacity=128, max_weight=None, weigh=None, on_evict=None):
+        """Initialize an empty cache; the arguments are as for ``LRUCache``."""
+        super().__init__(capacity, max_weight, weigh, on_evict)
+        self._buckets = {}
+        self._min_freq = 1
+        self._spare = None
+
+    def _link(self, node):
+        """Link a node at the head of the bucket for its use count."""
+        freq = node.data.freq
+        bucket = self._buckets.get(freq)
+        if bucket is None:
+            bucket = self._spare if self._spare is not None else DoubleLinkedList()
+            self._spare = None
+            self._buckets[freq] = bucket
+        bucket._push_front(node)
+        if freq < self._min_freq:
+            self._min_freq = freq
+
+    def _unlink(self, node):
+        """Unlink a node from its bucket, keeping an emptied bucket for reuse."""
+        freq = node.data.freq
+        bucket = self._buckets[freq]
+        bucket._detach(node)
+        if bucket.head is None:
+            del self._buckets[freq]
+            self._spare = bucket
+            if freq == self._min_freq:
+                self._min_freq += 1
+
+    def _used(self, node):
+        """Move a used node up to the next bucket."""
+        self._unlink(node)
+        node.data.freq += 1
+        self._link(node)
+
+    def _victim(self):
+        """Return the least recently used node of the lowest bucket."""
+        if self._min_freq not in self._buckets:
+            self._min_freq = min(self._buckets)
+        return self._buckets[self._min_freq].tail
+
+    def frequency(self, key):
+        """Return the use count of key.
+
+        Raises:
+            KeyError: If key is not cached.
+        """
+        return self._map[key].data.freq
+
+    def clear(self):
+        """Drop every entry without calling on_evict."""
+        self._buckets.clear()
+        self._min_freq = 1
+        self._map.clear()
+        self.weight = 0
+
+def memoize(cache=None):
+    """Decorator caching a function's results by its arguments.
+
+    Args:
+        cache: The cache to store results in; a fresh ``LRUCache`` if None.
+            The arguments must be hashable.
+
+    Returns:
+        A decorator. The wrapped function exposes the cache as ``.cache``.
+    """
+    if cache is None:
+        cache = LRUCache()
+
+    def decorate(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = args
+            if kwargs:
+                key += (_KWARGS,) + tuple(sorted(kwargs.items()))
+            value = cache.get(key, _MISSING)
+            if value is _MISSING:
+                value = func(*args, **kwargs)
+                cache.put(key, value)
+            return value
+        wrapper.cache = cache
+        return wrapper
+    return decorate
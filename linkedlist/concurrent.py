@@ -0,0 +1,589 @@
+from threading import Lock
+
+class LockedDLLNode:
+    """Node for a doubly linked list shared between threads."""
+    __slots__ = ['prev', 'data', 'next', 'lock']
+
+    def __init__(self, data):
+        self.data = data
+        self.prev = None
+        self.next = None
+        self.lock = Lock()
+
+class ConcurrentDoubleLinkedList:
+    """A doubly linked list that several threads may use at once.
+
+    Two sentinel nodes bracket the elements and every node carries its own
+    lock. The front sentinel's lock is the head lock and the back
+    sentinel's lock is the tail lock, so producers at one end and consumers
+    at the other only meet when the list is nearly empty. Positional
+    operations walk the list with hand-over-hand locking. Locks are always
+    taken in front-to-back order, so threads cannot deadlock.
+
+    Unlinked nodes get ``next`` and ``prev`` cleared and are never reused,
+    so an operation that locked a node it found without holding a lock can
+    tell when that node has gone stale and retry.
+    """
+    __slots__ = ['_front', '_back', '_size', '_size_lock']
+
+    def __init__(self):
+        """Initialize an empty list."""
+        self._front = LockedDLLNode(None)
+        self._back = LockedDLLNode(None)
+        self._front.next = self._back
+        self._back.prev = self._front
+        self._size = 0
+        self._size_lock = Lock()
+
+    @property
+    def size(self):
+        """The number of nodes at the moment of the call."""
+        return self._size
+
+    def _resize(self, delta):
+        """Add delta to the node count."""
+        with self._size_lock:
+            self._size += delta
+
+    def _link(self, pred, succ, data):
+        """Link a new node holding data between locked neighbours pred and succ."""
+        node = LockedDLLNode(data)
+        node.prev = pred
+        node.next = succ
+        pred.next = node
+        succ.prev = node
+
+    def _unlink(self, pred, node, succ):
+        """Unlink node from its locked neighbours and return its data."""
+        pred.next = succ
+        succ.prev = pred
+        node.next = node.prev = None
+        return node.data
+
+    def _lock_last(self):
+        """Lock the last node (or the front sentinel) and the back sentinel.
+
+        Returns:
+            The locked node in front of the back sentinel.
+        """
+        back = self._back
+        while True:
+            pred = back.prev
+            pred.lock.acquire()
+            back.lock.acquire()
+            if pred.next is back:
+                return pred
+            back.lock.release()
+            pred.lock.release()
+
+    def _walk(self, steps):
+        """Walk steps hops from the front sentinel hand over hand.
+
+        Returns:
+            The node reached, with only its lock held. The walk stops early,
+            on the locked back sentinel, if the list is too short.
+        """
+        cur = self._front
+        cur.lock.acquire()
+        for _ in range(steps):
+            if cur is self._back:
+                break
+            nxt = cur.next
+            nxt.lock.acquire()
+            cur.lock.release()
+            cur = nxt
+        return cur
+
+    def _index_of(self, data):
+        """Return the position of the first node with data, or -1, walking hand over hand."""
+        cur = self._front
+        cur.lock.acquire()
+        idx = -1
+        try:
+            while cur.next is not self._back:
+                nxt = cur.next
+                nxt.lock.acquire()
+                cur.lock.release()
+                cur = nxt
+                idx += 1
+                if cur.data == data:
+                    return idx
+            return -1
+        finally:
+            cur.lock.release()
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        """Build a list from an iterable.
+
+        Args:
+            iterable: The items to store, in order.
+
+        Returns:
+            A new list holding the items.
+        """
+        lst = cls()
+        lst.extend(iterable)
+        return lst
+
+    def is_empty(self):
+        """Return True if the list is empty at the moment of the call."""
+        return self._front.next is self._back
+
+    def insert_at_beginning(self, data):
+        """Insert a node with the given data at the beginning.
+
+        Args:
+            data: The data to insert.
+        """
+        front = self._front
+        with front.lock:
+            succ = front.next
+            with succ.lock:
+                self._link(front, succ, data)
+                self._resize(1)
+
+    def insert_at_end(self, data):
+        """Insert a node with the given data at the end.
+
+        Args:
+            data: The data to insert.
+        """
+        pred = self._lock_last()
+        try:
+            self._link(pred, self._back, data)
+            self._resize(1)
+        finally:
+            self._back.lock.release()
+            pred.lock.release()
+
+    def insert_at_position(self, data, position):
+        """Insert a node with the given data at the specified 0-based position.
+
+        Args:
+            data: The data to insert.
+            position: The 0-based index where the node should be inserted.
+
+        Raises:
+            ValueError: If position is negative or beyond list length.
+        """
+        if position < 0:
+            raise ValueError("Invalid position")
+        pred = self._walk(position)
+        try:
+            if pred is self._back:
+                raise ValueError("Invalid position")
+            succ = pred.next
+            with succ.lock:
+                self._link(pred, succ, data)
+                self._resize(1)
+        finally:
+            pred.lock.release()
+
+    def extend(self, iterable):
+        """Append every item of iterable at the end as one atomic step.
+
+        The new nodes are chained before any lock is taken, then spliced
+        onto the tail under the tail lock.
+
+        Args:
+            iterable: The items to append, in order.
+        """
+        first = last = None
+        count = 0
+        for data in iterable:
+            node = LockedDLLNode(data)
+            if first is None:
+                first = node
+            else:
+                last.next = node
+                node.prev = last
+            last = node
+            count += 1
+        if first is None:
+            return
+        pred = self._lock_last()
+        try:
+            first.prev = pred
+            last.next = self._back
+            pred.next = first
+            self._back.prev = last
+            self._resize(count)
+        finally:
+            self._back.lock.release()
+            pred.lock.release()
+
+    def pop_left(self):
+        """Remove the first node and return its data atomically.
+
+        Returns:
+            The data of the removed node.
+
+        Raises:
+            ValueError: If the list is empty.
+        """
+        front = self._front
+        with front.lock:
+            first = front.next
+            if first is self._back:
+                raise ValueError("Empty list")
+            with first.lock:
+                succ = first.next
+                with succ.lock:
+                    data = self._unlink(front, first, succ)
+                    self._resize(-1)
+        return data
+
+    def pop_right(self):
+        """Remove the last node and return its data atomically.
+
+        Returns:
+            The data of the removed node.
+
+        Raises:
+            ValueError: If the list is empty.
+        """
+        front = self._front
+        back = self._back
+        while True:
+            last = back.prev
+            if last is front:
+                with front.lock, back.lock:
+                    if front.next is back:
+                        raise ValueError("Empty list")
+                continue
+            pred = last.prev
+            if pred is None:
+                continue
+            with pred.lock, last.lock, back.lock:
+                if pred.next is last and last.next is back:
+                    data = self._unlink(pred, last, back)
+                    self._resize(-1)
+                    return data
+
+    def del_at_start(self):
+        """Delete the node at the beginning.
+
+        Raises:
+            ValueError: If the list is empty.
+        """
+        self.pop_left()
+
+    def del_at_end(self):
+        """Delete the node at the end.
+
+        Raises:
+            ValueError: If the list is empty.
+        """
+        self.pop_right()
+
+    def delete(self, position):
+        """Delete the node at the specified 0-based position.
+
+        Args:
+            position: The 0-based index of the node to delete.
+
+        Raises:
+            ValueError: If the list is empty or position is invalid.
+        """
+        if self.is_empty():
+            raise ValueError("Empty list")
+        if position < 0:
+            raise ValueError("Invalid position")
+        pred = self._walk(position)
+        try:
+            if pred is self._back or pred.next is self._back:
+                raise ValueError("Invalid position")
+            node = pred.next
+            with node.lock:
+                succ = node.next
+                with succ.lock:
+                    self._unlink(pred, node, succ)
+                    self._resize(-1)
+        finally:
+            pred.lock.release()
+
+    def remove(self, data):
+        """Remove the first node with the given data.
+
+        Args:
+            data: The data to remove.
+
+        Raises:
+            ValueError: If the list is empty or data is not found.
+        """
+        if self.is_empty():
+            raise ValueError("Empty list")
+        pred = self._front
+        pred.lock.acquire()
+        cur = pred.next
+        cur.lock.acquire()
+        try:
+            while cur is not self._back:
+                if cur.data == data:
+                    succ = cur.next
+                    with succ.lock:
+                        self._unlink(pred, cur, succ)
+                        self._resize(-1)
+                    return
+                pred.lock.release()
+                pred = cur
+                cur = cur.next
+                cur.lock.acquire()
+            raise ValueError("Data not found")
+        finally:
+            cur.lock.release()
+            pred.lock.release()
+
+    def update(self, position, data):
+        """Update the data of the node at the specified 0-based position.
+
+        Args:
+            position: The 0-based index of the node to update.
+            data: The new data value.
+
+        Raises:
+            ValueError: If the list is empty or position is invalid.
+        """
+        if self.is_empty():
+            raise ValueError("Empty list")
+        if position < 0:
+            raise ValueError("Invalid position")
+        node = self._walk(position + 1)
+        try:
+            if node is self._back:
+                raise ValueError("Invalid position")
+            node.data = data
+        finally:
+            node.lock.release()
+
+    def show_val(self, position):
+        """Return the data at the specified 0-based position.
+
+        Args:
+            position: The 0-based index of the node.
+
+        Returns:
+            The data at the specified position.
+
+        Raises:
+            ValueError: If the list is empty or position is invalid.
+        """
+        if self.is_empty():
+            raise ValueError("Empty list")
+        if position < 0:
+            raise ValueError("Invalid position")
+        node = self._walk(position + 1)
+        try:
+            if node is self._back:
+                raise ValueError("Invalid position")
+            return node.data
+        finally:
+            node.lock.release()
+
+    def show_len(self):
+        """Return the number of nodes in the list.
+
+        Returns:
+            The size of the list at the moment of the call.
+        """
+        return self._size
+
+    def find(self, data):
+        """Return the 0-based position of the first node with the given data.
+
+        Args:
+            data: The data to find.
+
+        Returns:
+            The 0-based index of the data, or -1 if not found.
+
+        Raises:
+            ValueError: If the list is empty.
+        """
+        if self.is_empty():
+            raise ValueError("Empty list")
+        return self._index_of(data)
+
+    def snapshot(self):
+        """Return a Python list of the data, read hand over hand.
+
+        Each node is read while locked, but the list as a whole may change
+        behind the walk, so the result is weakly consistent.
+        """
+        result = []
+        cur = self._front
+        cur.lock.acquire()
+        try:
+            while cur.next is not self._back:
+                nxt = cur.next
+                nxt.lock.acquire()
+                cur.lock.release()
+                cur = nxt
+                result.append(cur.data)
+        finally:
+            cur.lock.release()
+        return result
+
+    def display(self):
+        """Return a string representation of the list.
+
+        Returns:
+            A string representing the list.
+        """
+        values = self.snapshot()
+        if not values:
+            return "Empty list"
+        return " <-> ".join(str(data) for data in values) + " <-> None"
+
+    def __contains__(self, data):
+        """Return True if some node carries the given data."""
+        return self._index_of(data) != -1
+
+    def __iter__(self):
+        """Yield the data of each node from a snapshot of the list."""
+        return iter(self.snapshot())
+
+class ConcurrentCircularDoubleLinkedList(ConcurrentDoubleLinkedList):
+    """A circular doubly linked list that several threads may use at once.
+
+    The back sentinel links forward to the front sentinel and the front
+    sentinel back to the back one, closing the ring while the head and
+    tail keep separate locks. Walks never follow that closing link with a
+    lock held, so locks are still taken in front-to-back order; going
+    round the ring is done by ``rotate``, which moves nodes between the
+    ends, and by ``snapshot(start)``.
+    """
+    __slots__ = []
+
+    def __init__(self):
+        """Initialize an empty ring."""
+        super().__init__()
+        self._back.next = self._front
+        self._front.prev = self._back
+
+    def _rotate_left(self):
+        """Atomically move the first node to the end; a no-op below two nodes.
+
+        Locks the front sentinel, the first two nodes, the last node and
+        the back sentinel, in that order.
+        """
+        front = self._front
+        back = self._back
+        with front.lock:
+            first = front.next
+            if first is back:
+                return
+            with first.lock:
+                succ = first.next
+                if succ is back:
+                    return
+                with succ.lock:
+                    while True:
+                        last = back.prev
+                        if last is not succ:
+                            last.lock.acquire()
+                        back.lock.acquire()
+                        if last.next is back:
+                            break
+                        back.lock.release()
+                        last.lock.release()
+                    try:
+                        front.next = succ
+                        succ.prev = front
+                        last.next = first
+                        first.prev = last
+                        first.next = back
+                        back.prev = first
+                    finally:
+                        back.lock.release()
+                        if last is not succ:
+                            last.lock.release()
+
+    def _rotate_right(self):
+        """Atomically move the last node to the front; a no-op below two nodes.
+
+        Locks the front sentinel, the first node, the last two nodes and
+        the back sentinel, in that order.
+        """
+        front = self._front
+        back = self._back
+        with front.lock:
+            first = front.next
+            if first is back:
+                return
+            with first.lock:
+                while True:
+                    last = back.prev
+                    if last is first:
+                        return
+                    pred = last.prev
+                    if pred is None:
+                        continue
+                    if pred is not first:
+                        pred.lock.acquire()
+                    last.lock.acquire()
+                    back.lock.acquire()
+                    if pred.next is last and last.next is back:
+                        break
+                    back.lock.release()
+                    last.lock.release()
+                    if pred is not first:
+                        pred.lock.release()
+                try:
+                    pred.next = back
+                    back.prev = pred
+                    last.prev = front
+                    last.next = first
+                    front.next = last
+                    first.prev = last
+                finally:
+                    back.lock.release()
+                    last.lock.release()
+                    if pred is not first:
+                        pred.lock.release()
+
+    def rotate(self, k=1):
+        """Rotate the ring k steps to the right, like ``collections.deque.rotate``.
+
+        Each one-step move of a node between the ends is atomic and
+        allocates nothing; a rotation by several steps is a sequence of
+        such moves, so other threads may see it part way.
+
+        Args:
+            k: The number of steps; negative values rotate to the left.
+        """
+        step = self._rotate_right if k > 0 else self._rotate_left
+        size = self._size
+        steps = abs(k) % size if size else 0
+        for _ in range(steps):
+            step()
+
+    def snapshot(self, start=0):
+        """Return a Python list of the data, once round from position start.
+
+        Args:
+            start: The 0-based index of the first element; the snapshot
+                wraps past the tail back to the head.
+
+        Raises:
+            ValueError: If start is negative.
+        """
+        if start < 0:
+            raise ValueError("Invalid position")
+        values = super().snapshot()
+        if not values:
+            return values
+        start %= len(values)
+        return values[start:] + values[:start]
+
+    def display(self):
+        """Return a string representation of the list.
+
+        Returns:
+            A string representing the list.
+        """
+        values = self.snapshot()
+        if not values:
+            return "Empty list"
+        return " <-> ".join(str(data) for data in values) + " <-> (back to head)"
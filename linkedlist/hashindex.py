@@ -0,0 +1,192 @@
+class HashIndex:
+    """Map from payload key to the nodes carrying it.
+
+    Each bucket lists its nodes in list order, so the first entry is always
+    the node ``remove`` and ``find`` would reach first by scanning. Keys are
+    the payloads themselves, or ``key(payload)`` when a key function is
+    given, and must be hashable.
+    """
+    __slots__ = ['owner', 'key', 'buckets']
+
+    def __init__(self, owner, key=None):
+        """Attach an index to owner.
+
+        Args:
+            owner: The list whose nodes are indexed.
+            key: Optional function mapping a payload to its index key.
+        """
+        self.owner = owner
+        self.key = key
+        self.buckets = {}
+
+    def _key(self, data):
+        """Return the index key of a payload."""
+        return data if self.key is None else self.key(data)
+
+    def __contains__(self, data):
+        """Return True if some node carries a payload matching data."""
+        return self._key(data) in self.buckets
+
+    def first(self, data):
+        """Return the first node in list order matching data, or None."""
+        bucket = self.buckets.get(self._key(data))
+        return bucket[0] if bucket else None
+
+    def nodes(self, data):
+        """Return the nodes matching data, in list order."""
+        return list(self.buckets.get(self._key(data), ()))
+
+    def add(self, node):
+        """Index a node that has just been linked into the owner."""
+        self.add_run(node, 1)
+
+    def add_run(self, first, count):
+        """Index count consecutive nodes from first, just linked into the owner.
+
+        A key whose bucket is empty, or a run at either end of the owner,
+        goes straight to the matching end of its bucket. Otherwise the run
+        is placed by ``_place_between``, which looks only as far as the
+        nearest nodes sharing its keys, never from the head.
+        """
+        groups = {}
+        cur = first
+        for _ in range(count):
+            groups.setdefault(self._key(cur.data), []).append(cur)
+            last = cur
+            cur = cur.next
+        at_end = last is self.owner.tail
+        at_start = first is self.owner.head
+        pending = {}
+        for k, nodes in groups.items():
+            bucket = self.buckets.setdefault(k, [])
+            if not bucket or at_end:
+                bucket.extend(nodes)
+            elif at_start:
+                bucket[0:0] = nodes
+            else:
+                pending[k] = nodes
+        if pending:
+            self._place_between(first, last, pending)
+
+    def _place_between(self, first, last, pending):
+        """Insert runs of nodes into their non-empty buckets in list order.
+
+        Walks forward from the node after last and, when nodes have a
+        ``prev`` link, backward from the node before first, one step each
+        in turn. A key whose node turns up ahead goes just before it in
+        the bucket, one whose node turns up behind goes just after it.
+        Once either walk runs off its end of the owner, every key still
+        pending belongs at that end of its bucket. The cost is the
+        distance to the nearest such node or end, plus the bucket searches.
+
+        Args:
+            first: The first node of the run.
+            last: The last node of the run.
+            pending: Dict from key to the run's nodes with that key, in order.
+        """
+        owner = self.owner
+        buckets = self.buckets
+        backward = hasattr(first, "prev")
+        ahead = last.next
+        behind = first.prev if backward else None
+        while True:
+            if ahead is None or ahead is owner.head:
+                for k, nodes in pending.items():
+                    buckets[k].extend(nodes)
+                return
+            nodes = pending.pop(self._key(ahead.data), None)
+            if nodes is not None:
+                bucket = buckets[self._key(ahead.data)]
+                i = bucket.index(ahead)
+                bucket[i:i] = nodes
+                if not pending:
+                    return
+            ahead = ahead.next
+            if not backward:
+                continue
+            if behind is None or behind is owner.tail:
+                for k, nodes in pending.items():
+                    buckets[k][0:0] = nodes
+                return
+            nodes = pending.pop(self._key(behind.data), None)
+            if nodes is not None:
+                bucket = buckets[self._key(behind.data)]
+                i = bucket.index(behind) + 1
+                bucket[i:i] = nodes
+                if not pending:
+                    return
+            behind = behind.prev
+
+    def discard(self, node):
+        """Drop a node that is about to be unlinked or have its data changed."""
+        k = self._key(node.data)
+        bucket = self.buckets[k]
+        if bucket[0] is node:
+            del bucket[0]
+        elif bucket[-1] is node:
+            bucket.pop()
+        else:
+            for i, member in enumerate(bucket):
+                if member is node:
+                    del bucket[i]
+                    break
+        if not bucket:
+            del self.buckets[k]
+
+    def discard_run(self, first, count):
+        """Drop count consecutive nodes from first that are leaving the owner."""
+        groups = {}
+        cur = first
+        for _ in range(count):
+            groups.setdefault(self._key(cur.data), []).append(cur)
+            cur = cur.next
+        for k, nodes in groups.items():
+            bucket = self.buckets[k]
+            start = 0
+            while bucket[start] is not nodes[0]:
+                start += 1
+            del bucket[start:start + len(nodes)]
+            if not bucket:
+                del self.buckets[k]
+
+    def move_run(self, first, count, to_end):
+        """Reorder the buckets after a run moved between the owner's ends.
+
+        The count consecutive nodes from first were a prefix of the owner
+        that is now its suffix (to_end=True), or a suffix now a prefix.
+        They are the same prefix or suffix of each of their buckets, so
+        each bucket is rotated rather than rebuilt.
+        """
+        counts = {}
+        cur = first
+        for _ in range(count):
+            k = self._key(cur.data)
+            counts[k] = counts.get(k, 0) + 1
+            cur = cur.next
+        for k, c in counts.items():
+            bucket = self.buckets[k]
+            if to_end:
+                moved = bucket[:c]
+                del bucket[:c]
+                bucket.extend(moved)
+            else:
+                moved = bucket[-c:]
+                del bucket[-c:]
+                bucket[0:0] = moved
+
+    def rebuild(self):
+        """Re-index every node of the owner in one pass."""
+        self.buckets.clear()
+        cur = self.owner.head
+        for _ in range(self.owner.size):
+            self.buckets.setdefault(self._key(cur.data), []).append(cur)
+            cur = cur.next
+
+    def reverse(self):
+        """Flip every bucket after the owner was reversed."""
+        for bucket in self.buckets.values():
+            bucket.reverse()
+
+    def clear(self):
+        """Forget every node."""
+        self.buckets.clear()
@@ -0,0 +1,216 @@
+from time import perf_counter
+from types import FunctionType, GeneratorType
+
+from .CLL import CircularLinkedList
+from .DCLL import CircularDoubleLinkedList
+from .DLL import DoubleLinkedList
+from .node import DLLNode, SLLNode
+from .skiplist import _Lane
+from .SLL import SingleLinkedList
+from .stream import Stream
+
+CLASSES = (SingleLinkedList, DoubleLinkedList, CircularLinkedList, CircularDoubleLinkedList)
+DUNDERS = ('__contains__', '__iter__', '__reversed__')
+LINKS = ((SLLNode, 'next'), (DLLNode, 'next'), (DLLNode, 'prev'), (_Lane, 'next'), (_Lane, 'down'))
+
+_hops = [0]
+_probes = {}
+_global = None
+_originals = {}
+
+
+class Probe:
+    """Call, node-hop and latency counters for instrumented lists.
+
+    A hop is one read of a ``next`` or ``prev`` link (or of a skip-list
+    lane), so ``hops`` shows how far an operation walked. Only the
+    outermost public call is recorded: ``delete(0)`` counts as one
+    ``delete``, not also as the ``del_at_start`` it hands over to.
+
+    Calls that return a lazy result, such as iteration, ``reversed``,
+    ``stream`` and ``stride``, are credited with the hops and time of
+    pulling values from it too, and are recorded once it is exhausted or
+    discarded rather than when they return.
+    """
+    __slots__ = ['methods', 'hooks', '_busy']
+
+    def __init__(self):
+        """Initialize a probe with no calls recorded."""
+        self.methods = {}
+        self.hooks = []
+        self._busy = False
+
+    def add_hook(self, hops, callback):
+        """Call callback after any single operation walking more than hops links.
+
+        Args:
+            hops: The hop threshold.
+            callback: Called as ``callback(lst, method, hops, seconds)``.
+        """
+        self.hooks.append((hops, callback))
+
+    def _record(self, lst, name, hops, seconds):
+        """Add one call to the counters of name and fire any hooks it trips."""
+        entry = self.methods.get(name)
+        if entry is None:
+            entry = self.methods[name] = [0, 0, 0.0, 0]
+        entry[0] += 1
+        entry[1] += hops
+        entry[2] += seconds
+        if hops > entry[3]:
+            entry[3] = hops
+        for threshold, callback in self.hooks:
+            if hops > threshold:
+                callback(lst, name, hops, seconds)
+
+    def stats(self):
+        """Return a snapshot of the counters.
+
+        Returns:
+            A dict mapping each method called to a dict with its call
+            count, total and largest hops per call, and total seconds.
+        """
+        return {name: {"calls": calls, "hops": hops, "max_hops": most, "seconds": seconds}
+                for name, (calls, hops, seconds, most) in self.methods.items()}
+
+    def reset(self):
+        """Zero the counters, keeping the hooks."""
+        self.methods.clear()
+
+
+def _counted(read):
+    """Return a link getter that counts each read as a hop."""
+    def get(node):
+        _hops[0] += 1
+        return read(node)
+    return get
+
+
+def _tracked(probe, lst, name, iterator, hops, seconds):
+    """Yield from a lazy result, crediting each step to the call that returned it.
+
+    The call is recorded once the iterator is exhausted, fails or is
+    discarded.
+    """
+    try:
+        while True:
+            busy = probe._busy
+            probe._busy = True
+            before = _hops[0]
+            start = perf_counter()
+            try:
+                value = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                seconds += perf_counter() - start
+                hops += _hops[0] - before
+                probe._busy = busy
+            yield value
+    finally:
+        probe._record(lst, name, hops, seconds)
+
+
+def _timed(name, method):
+    """Return method wrapped to record its calls on the list's probe."""
+    def timed(self, *args, **kwargs):
+        probe = _probes.get(self, _global)
+        if probe is None or probe._busy:
+            return method(self, *args, **kwargs)
+        probe._busy = True
+        hops = _hops[0]
+        start = perf_counter()
+        try:
+            result = method(self, *args, **kwargs)
+        except BaseException:
+            probe._busy = False
+            probe._record(self, name, _hops[0] - hops, perf_counter() - start)
+            raise
+        seconds = perf_counter() - start
+        hops = _hops[0] - hops
+        probe._busy = False
+        if isinstance(result, GeneratorType):
+            return _tracked(probe, self, name, result, hops, seconds)
+        if isinstance(result, Stream):
+            result._it = _tracked(probe, self, name, result._it, hops, seconds)
+            return result
+        probe._record(self, name, hops, seconds)
+        return result
+    timed.__name__ = method.__name__
+    timed.__doc__ = method.__doc__
+    return timed
+
+
+def _patch():
+    """Swap counting links and recording methods into the list classes."""
+    for node_type, link in LINKS:
+        raw = vars(node_type)[link]
+        _originals[node_type, link] = raw
+        setattr(node_type, link, property(_counted(raw.__get__), raw.__set__))
+    for cls in CLASSES:
+        for name, attr in list(vars(cls).items()):
+            if isinstance(attr, FunctionType) and (not name.startswith('_') or name in DUNDERS):
+                _originals[cls, name] = attr
+                setattr(cls, name, _timed(name, attr))
+
+
+def _unpatch():
+    """Restore the classes patched by ``_patch``."""
+    for (owner, name), attr in _originals.items():
+        setattr(owner, name, attr)
+    _originals.clear()
+
+
+def instrument(lst=None):
+    """Start recording calls, hops and time for lst, or for every list.
+
+    While any list is instrumented, every link read in the process goes
+    through a counting property, which slows all lists down several times;
+    once the last probe is removed the classes are restored and the
+    overhead is gone. Calls on a list with its own probe are not recorded
+    by the global one.
+
+    Args:
+        lst: A ``SingleLinkedList``, ``DoubleLinkedList``,
+            ``CircularLinkedList`` or ``CircularDoubleLinkedList``; None
+            to instrument all of them.
+
+    Returns:
+        The ``Probe`` collecting the counters; calling ``instrument`` again
+        for the same target returns the same probe.
+
+    Raises:
+        TypeError: If lst is not one of the four list classes.
+    """
+    global _global
+    if lst is not None and not isinstance(lst, CLASSES):
+        raise TypeError("Can only instrument node-based linked lists")
+    if not _originals:
+        _patch()
+    if lst is None:
+        if _global is None:
+            _global = Probe()
+        return _global
+    if lst not in _probes:
+        _probes[lst] = Probe()
+    return _probes[lst]
+
+
+def uninstrument(lst=None):
+    """Stop recording for lst, or the global probe if lst is None.
+
+    The probe keeps its counters. The instrumented list is referenced until
+    this is called.
+
+    Raises:
+        ValueError: If the target is not instrumented.
+    """
+    global _global
+    if lst is None:
+        if _global is None:
+            raise ValueError("Not instrumented")
+        _global = None
+    elif _probes.pop(lst, None) is None:
+        raise ValueError("Not instrumented")
+    if _global is None and not _probes:
+        _unpatch()
@@ -0,0 +1,468 @@
+import mmap
+import os
+import pickle
+import struct
+
+NIL = -1
+MAGIC = b'LLMAP\x00\x01\x00'
+HEADER_SIZE = 64
+INLINE = 36
+
+_HEADER = struct.Struct('<8s6q')
+_LINK = struct.Struct('<q')
+_PAYLOAD = struct.Struct('<qi')
+RECORD_SIZE = 2 * _LINK.size + _PAYLOAD.size + INLINE
+
+
+class MappedLinkedList:
+    """A doubly linked list stored in a memory-mapped file.
+
+    The file starts with a fixed header (head, tail, size, free-list head,
+    end of used space and garbage bytes) followed by fixed-size node
+    records and payload blobs, all addressed by byte offset. A record
+    holds the ``next`` and ``prev`` offsets and the pickled payload, inline
+    when it fits in ``INLINE`` bytes and otherwise as the offset and length
+    of a blob further on in the file.
+
+    Deleted records go onto a free-list threaded through their ``next``
+    field and are reused first; blobs of deleted payloads are counted in
+    ``garbage`` until ``compact()`` rewrites the file without them. The
+    file doubles in size whenever it runs out of room. Opening an existing
+    file only reads the header, so startup is O(1) whatever the length.
+
+    The header is rewritten in the mapping after every change, so a
+    process that dies between two operations leaves a file that reopens
+    consistently; ``flush()`` or ``close()`` is still needed to force the
+    pages to disk against a machine crash.
+
+    Payloads are serialized with ``pickle`` unless another serializer is
+    given. Unpickling runs arbitrary code, so never open a file from an
+    untrusted source with the default serializer; pass one that only
+    builds plain data, such as a JSON encoder working on bytes.
+
+    The method names match ``DoubleLinkedList``.
+    """
+    __slots__ = ['path', 'head', 'tail', 'size', 'garbage', '_free', '_end', '_file', '_map',
+                 '_dumps', '_loads']
+
+    def __init__(self, path, capacity=1024, serializer=pickle):
+        """Open the list stored at path, creating the file if needed.
+
+        Args:
+            path: The file holding the list.
+            capacity: The number of records to make room for in a new file.
+            serializer: An object whose ``dumps`` turns a payload into bytes
+                and whose ``loads`` turns those bytes back. It must be the
+                same every time the file is opened.
+
+        Raises:
+            ValueError: If the file exists but does not hold a list.
+        """
+        self.path = path
+        self._dumps = serializer.dumps
+        self._loads = serializer.loads
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        self._file = open(path, 'r+b' if exists else 'w+b')
+        if not exists:
+            self._file.truncate(HEADER_SIZE + max(capacity, 1) * RECORD_SIZE)
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        if exists:
+            self._read_header()
+        else:
+            self.head = self.tail = self._free = NIL
+            self.size = self.garbage = 0
+            self._end = HEADER_SIZE
+            self._write_header()
+
+    def _read_header(self):
+        """Load the header fields from the file, closing it if they are not valid."""
+        if len(self._map) < HEADER_SIZE or self._map[:len(MAGIC)] != MAGIC:
+            self._map.close()
+            self._file.close()
+            raise ValueError("Not a linked list file")
+        _, self.head, self.tail, self.size, self._free, self._end, self.garbage = \
+            _HEADER.unpack_from(self._map, 0)
+
+    def _write_header(self):
+        """Store the in-memory header fields in the file."""
+        _HEADER.pack_into(self._map, 0, MAGIC, self.head, self.tail, self.size,
+                          self._free, self._end, self.garbage)
+
+    def _grow(self, needed):
+        """Grow the file geometrically until it holds at least needed bytes."""
+        length = len(self._map)
+        while length < needed:
+            length *= 2
+        self._map.close()
+        self._file.truncate(length)
+        self._map = mmap.mmap(self._file.fileno(), 0)
+
+    def _reserve(self, nbytes):
+        """Return the offset of nbytes of fresh space at the end of the file."""
+        off = self._end
+        if off + nbytes > len(self._map):
+            self._grow(off + nbytes)
+        self._end = off + nbytes
+        return off
+
+    def _next(self, off):
+        """Return the next offset of the record at off."""
+        return _LINK.unpack_from(self._map, off)[0]
+
+    def _prev(self, off):
+        """Return the prev offset of the record at off."""
+        return _LINK.unpack_from(self._map, off + 8)[0]
+
+    def _set_next(self, off, value):
+        """Set the next offset of the record at off."""
+        _LINK.pack_into(self._map, off, value)
+
+    def _set_prev(self, off, value):
+        """Set the prev offset of the record at off."""
+        _LINK.pack_into(self._map, off + 8, value)
+
+    def _put(self, off, blob):
+        """Write an already serialized payload into the record at off."""
+        if len(blob) <= INLINE:
+            _PAYLOAD.pack_into(self._map, off + 16, NIL, len(blob))
+            start = off + 16 + _PAYLOAD.size
+        else:
+            start = self._reserve(len(blob))
+            _PAYLOAD.pack_into(self._map, off + 16, start, len(blob))
+        self._map[start:start + len(blob)] = blob
+
+    def _blob(self, off):
+        """Return the serialized payload of the record at off."""
+        blob_off, length = _PAYLOAD.unpack_from(self._map, off + 16)
+        start = off + 16 + _PAYLOAD.size if blob_off == NIL else blob_off
+        return self._map[start:start + length]
+
+    def _load(self, off):
+        """Return the payload of the record at off."""
+        return self._loads(self._blob(off))
+
+    def _discard_payload(self, off):
+        """Count the blob of the record at off, if any, as garbage."""
+        blob_off, length = _PAYLOAD.unpack_from(self._map, off + 16)
+        if blob_off != NIL:
+            self.garbage += length
+
+    def _alloc(self, data):
+        """Return the offset of a record holding data, reusing a freed one if possible."""
+        blob = self._dumps(data)
+        off = self._free
+        if off != NIL:
+            self._free = self._next(off)
+        else:
+            off = self._reserve(RECORD_SIZE)
+        self._put(off, blob)
+        return off
+
+    def _release(self, off):
+        """Push the record at off onto the free-list."""
+        self._discard_payload(off)
+        self._set_next(off, self._free)
+        self._set_prev(off, NIL)
+        self._free = off
+
+    def _record_at(self, position):
+        """Return the offset of the record at a valid 0-based position."""
+        if position > self.size // 2:
+            cur = self.tail
+            for _ in range(self.size - 1 - position):
+                cur = self._prev(cur)
+            return cur
+        cur = self.head
+        for _ in range(position):
+            cur = self._next(cur)
+        return cur
+
+    def _unlink(self, off):
+        """Unlink and free the record at off."""
+        nxt = self._next(off)
+        prv = self._prev(off)
+        if prv == NIL:
+            self.head = nxt
+        else:
+            self._set_next(prv, nxt)
+        if nxt == NIL:
+            self.tail = prv
+        else:
+            self._set_prev(nxt, prv)
+        self._release(off)
+        self.size -= 1
+        self._write_header()
+
+    def _link_after(self, prv, data):
+        """Link a new record holding data after prv, or at the head if prv is NIL."""
+        off = self._alloc(data)
+        nxt = self.head if prv == NIL else self._next(prv)
+        self._set_prev(off, prv)
+        self._set_next(off, nxt)
+        if prv == NIL:
+            self.head = off
+        else:
+            self._set_next(prv, off)
+        if nxt == NIL:
+            self.tail = off
+        else:
+            self._set_prev(nxt, off)
+        self.size += 1
+        self._write_header()
+
+    def compact(self):
+        """Rewrite the file without free records or dead blobs, in O(n).
+
+        The live records are copied in list order into a new file, which
+        then replaces the old one, so a crash part way through leaves the
+        old file untouched. Payloads are copied as stored, without being
+        deserialized. Afterwards ``garbage`` is 0 and the file is no larger
+        than the data it holds.
+        """
+        tmp = self.path + '.compact'
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        new = MappedLinkedList(tmp, self.size)
+        prv = NIL
+        cur = self.head
+        while cur != NIL:
+            off = new._reserve(RECORD_SIZE)
+            new._put(off, self._blob(cur))
+            new._set_prev(off, prv)
+            new._set_next(off, NIL)
+            if prv == NIL:
+                new.head = off
+            else:
+                new._set_next(prv, off)
+            prv = off
+            cur = self._next(cur)
+        new.tail = prv
+        new.size = self.size
+        new.flush()
+        new._map.close()
+        new._file.truncate(new._end)
+        new._file.close()
+        self._map.close()
+        self._file.close()
+        os.replace(tmp, self.path)
+        self._file = open(self.path, 'r+b')
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        self._read_header()
+
+    def flush(self):
+        """Write the header and every change so far to disk."""
+        self._write_header()
+        self._map.flush()
+
+    def close(self):
+        """Flush and release the file; the list is unusable afterwards."""
+        if self._map.closed:
+            return
+        self.flush()
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        """Return the list for use in a with block."""
+        return self
+
+    def __exit__(self, *exc):
+        """Close the list at the end of a with block."""
+        self.close()
+
+    def is_empty(self):
+        """Return True if the list is empty."""
+        return self.size == 0
+
+    def insert_at_beginning(self, data):
+        """Insert a node with the given data at the beginning.
+
+        Args:
+            data: The data to insert.
+        """
+        self._link_after(NIL, data)
+
+    def insert_at_end(self, data):
+        """Insert a node with the given data at the end.
+
+        Args:
+            data: The data to insert.
+        """
+        self._link_after(self.tail, data)
+
+    def insert_at_position(self, data, position):
+        """Insert a node with the given data at the specified 0-based position.
+
+        Args:
+            data: The data to insert.
+            position: The 0-based index where the node should be inserted.
+
+        Raises:
+            ValueError: If position is negative or beyond list length.
+        """
+        if position < 0 or position > self.size:
+            raise ValueError("Invalid position")
+        if position == 0:
+            self._link_after(NIL, data)
+        else:
+            self._link_after(self._record_at(position - 1), data)
+
+    def extend(self, iterable):
+        """Append every item of iterable at the end.
+
+        Args:
+            iterable: The items to append, in order.
+        """
+        for data in iterable:
+            self._link_after(self.tail, data)
+
+    def delete(self, position):
+        """Delete the node at the specified 0-based position.
+
+        Args:
+            position: The 0-based index of the node to delete.
+
+        Raises:
+            ValueError: If the list is empty or position is invalid.
+        """
+        if not self.size:
+            raise ValueError("Empty list")
+        if position < 0 or position >= self.size:
+            raise ValueError("Invalid position")
+        self._unlink(self._record_at(position))
+
+    def remove(self, data):
+        """Remove the first node with the given data.
+
+        Args:
+            data: The data to remove.
+
+        Raises:
+            ValueError: If the list is empty or data is not found.
+        """
+        if not self.size:
+            raise ValueError("Empty list")
+        cur = self.head
+        while cur != NIL:
+            if self._load(cur) == data:
+                self._unlink(cur)
+                return
+            cur = self._next(cur)
+        raise ValueError("Data not found")
+
+    def del_at_start(self):
+        """Delete the node at the beginning.
+
+        Raises:
+            ValueError: If the list is empty.
+        """
+        if not self.size:
+            raise ValueError("Empty list")
+        self._unlink(self.head)
+
+    def del_at_end(self):
+        """Delete the node at the end.
+
+        Raises:
+            ValueError: If the list is empty.
+        """
+        if not self.size:
+            raise ValueError("Empty list")
+        self._unlink(self.tail)
+
+    def update(self, position, data):
+        """Update the data of the node at the specified 0-based position.
+
+        Args:
+            position: The 0-based index of the node to update.
+            data: The new data value.
+
+        Raises:
+            ValueError: If the list is empty or position is invalid.
+        """
+        if not self.size:
+            raise ValueError("Empty list")
+        if position < 0 or position >= self.size:
+            raise ValueError("Invalid position")
+        blob = self._dumps(data)
+        off = self._record_at(position)
+        self._discard_payload(off)
+        self._put(off, blob)
+        self._write_header()
+
+    def reverse(self):
+        """Reverse the linked list in place by swapping every record's links."""
+        cur = self.head
+        while cur != NIL:
+            nxt = self._next(cur)
+            self._set_next(cur, self._prev(cur))
+            self._set_prev(cur, nxt)
+            cur = nxt
+        self.head, self.tail = self.tail, self.head
+        self._write_header()
+
+    def show_val(self, position):
+        """Return the data at the specified 0-based position.
+
+        Args:
+            position: The 0-based index of the node.
+
+        Returns:
+            The data at the specified position.
+
+        Raises:
+            ValueError: If the list is empty or position is invalid.
+        """
+        if not self.size:
+            raise ValueError("Empty list")
+        if position < 0 or position >= self.size:
+            raise ValueError("Invalid position")
+        return self._load(self._record_at(position))
+
+    def show_len(self):
+        """Return the number of nodes in the list.
+
+        Returns:
+            The size of the list.
+        """
+        return self.size
+
+    def find(self, data):
+        """Return the 0-based position of the first node with the given data.
+
+        Args:
+            data: The data to find.
+
+        Returns:
+            The 0-based index of the data, or -1 if not found.
+
+        Raises:
+            ValueError: If the list is empty.
+        """
+        if not self.size:
+            raise ValueError("Empty list")
+        for idx, value in enumerate(self):
+            if value == data:
+                return idx
+        return -1
+
+    def display(self):
+        """Return a string representation of the list.
+
+        Returns:
+            A string representing the list.
+        """
+        if not self.size:
+            return "Empty list"
+        return " <-> ".join(str(data) for data in self) + " <-> None"
+
+    def __contains__(self, data):
+        """Return True if some node carries the given data."""
+        return any(value == data for value in self)
+
+    def __iter__(self):
+        """Yield the data of each node in the list."""
+        cur = self.head
+        while cur != NIL:
+            yield self._load(cur)
+            cur = self._next(cur)
@@ -0,0 +1,165 @@
+from heapq import heapify, heappop, heapreplace
+
+from .DLL import DoubleLinkedList
+from .SLL import SingleLinkedList
+from .stream import Stream
+
+def _check(lists):
+    """Validate the inputs of a merge and return True if they are doubly linked.
+
+    Raises:
+        TypeError: If the lists are not all SingleLinkedList or all
+            DoubleLinkedList of the same type.
+        ValueError: If there are no lists or one appears twice.
+    """
+    if not lists:
+        raise ValueError("No lists to merge")
+    cls = type(lists[0])
+    if (not issubclass(cls, (SingleLinkedList, DoubleLinkedList))
+            or any(type(lst) is not cls for lst in lists)):
+        raise TypeError("Can only merge node-backed lists of the same type")
+    if len({id(lst) for lst in lists}) < len(lists):
+        raise ValueError("Cannot merge a list with itself")
+    return issubclass(cls, DoubleLinkedList)
+
+def _unmerge(lists, head, tail, fronts, tails, doubly):
+    """Give the nodes of an interrupted merge back to its inputs.
+
+    Each input gets back the run it had not yet given up, and the chain
+    head..tail merged so far goes in front of the first input's run.
+    """
+    for order, lst in enumerate(lists):
+        first, last = fronts[order], tails[order]
+        if order == 0 and head is not None:
+            tail.next = first
+            if first is None:
+                last = tail
+            elif doubly:
+                first.prev = tail
+            first = head
+        if first is None:
+            continue
+        if doubly:
+            first.prev = None
+        size = 0
+        node = first
+        while node is not None:
+            size += 1
+            node = node.next
+        lst.head, lst.tail, lst.size = first, last, size
+        lst._restructured()
+
+def merge_sorted(*lists, key=None):
+    """Merge sorted lists into one sorted list by relinking their nodes.
+
+    A heap holds the current front node of each input, so merging k lists
+    of n nodes in all takes O(n log k) comparisons. No payload is copied
+    and no node is allocated: every node moves into the result, and each
+    input is left empty. Once a single input is left its remaining run is
+    attached as a whole. The merge is stable, with ties going to the
+    earlier list, as with ``sorted`` over the concatenation.
+
+    If key or a comparison raises, no node is lost: each input gets back
+    the nodes it had not yet given up, and the first input also the nodes
+    already merged, in front.
+
+    Args:
+        *lists: SingleLinkedList or DoubleLinkedList instances of one type,
+            each already sorted by key.
+        key: Optional function computing the sort key of each payload. It
+            is called once per node.
+
+    Returns:
+        A new list configured like the first input holding every node.
+
+    Raises:
+        TypeError: If the lists are not of one supported type.
+        ValueError: If there are no lists or one appears twice.
+    """
+    doubly = _check(lists)
+    heap = []
+    for order, lst in enumerate(lists):
+        if doubly:
+            lst.materialize()
+        node = lst.head
+        if node is not None:
+            heap.append((node.data if key is None else key(node.data), order, node))
+    heapify(heap)
+    merged = lists[0]._like()
+    if not heap:
+        return merged
+    fronts = [lst.head for lst in lists]
+    tails = [lst.tail for lst in lists]
+    size = 0
+    for lst in lists:
+        size += lst.size
+        lst._reset()
+
+    head = tail = None
+    try:
+        while True:
+            _, order, node = heap[0]
+            if tail is None:
+                head = node
+            else:
+                tail.next = node
+            if doubly:
+                node.prev = tail
+            if len(heap) == 1:
+                tail = tails[order]
+                break
+            tail = node
+            nxt = node.next
+            fronts[order] = nxt
+            if nxt is None:
+                heappop(heap)
+            else:
+                heapreplace(heap, (nxt.data if key is None else key(nxt.data), order, nxt))
+    except BaseException:
+        _unmerge(lists, head, tail, fronts, tails, doubly)
+        raise
+    merged.head = head
+    merged.tail = tail
+    merged.size = size
+    merged._restructured()
+    return merged
+
+def _popped(lists, heap, key):
+    """Yield the data of the smallest front node, deleting it from its list first."""
+    while heap:
+        _, order = heap[0]
+        lst = lists[order]
+        data = lst.head.data
+        lst.del_at_start()
+        if lst.head is None:
+            heappop(heap)
+        else:
+            heapreplace(heap, (lst.head.data if key is None else key(lst.head.data), order))
+        yield data
+
+def imerge(*lists, key=None):
+    """Lazily merge sorted lists, taking each item off the front of its list.
+
+    Each node is deleted from its input just before its data is yielded,
+    so the merged data never exists twice, and a merge stopped part way
+    leaves every input holding exactly what was not yet yielded. Ties go
+    to the earlier list.
+
+    Args:
+        *lists: SingleLinkedList or DoubleLinkedList instances of one type,
+            each already sorted by key.
+        key: Optional function computing the sort key of each payload.
+
+    Returns:
+        A ``Stream`` over the merged data, collecting into the type of the
+        first input by default.
+
+    Raises:
+        TypeError: If the lists are not of one supported type.
+        ValueError: If there are no lists or one appears twice.
+    """
+    _check(lists)
+    heap = [(lst.head.data if key is None else key(lst.head.data), order)
+            for order, lst in enumerate(lists) if lst.head is not None]
+    heapify(heap)
+    return Stream(lists[0], _popped(lists, heap, key))
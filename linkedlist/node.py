@@ -1,16 +1,25 @@
-class SLLNode:
-    """Node for a singly linked list."""
-    __slots__ = ['data', 'next']
-
-    def __init__(self, data):
-        self.data = data
-        self.next = None
-
-class DLLNode:
-    """Node for a doubly linked list."""
-    __slots__ = ['prev', 'data', 'next']
-
-    def __init__(self, data):
-        self.data = data
-        self.prev = None
+class SLLNode:
+    """Node for a singly linked list."""
+    __slots__ = ['data', 'next']
+
+    def __init__(self, data):
+        self.data = data
+        self.next = None
+
+class DLLNode:
+    """Node for a doubly linked list."""
+    __slots__ = ['prev', 'data', 'next']
+
+    def __init__(self, data):
+        self.data = data
+        self.prev = None
+        self.next = None
+
+class ChunkNode:
+    """Node for an unrolled linked list, holding a small list of elements."""
+    __slots__ = ['prev', 'items', 'next']
+
+    def __init__(self, items):
+        self.items = items
+        self.prev = None
         self.next = None
\ No newline at end of file
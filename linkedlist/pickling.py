@@ -0,0 +1,53 @@
+from array import array
+
+def _packed(values):
+    """Return values as an int64 or float64 array, or None if they do not fit one."""
+    if not values:
+        return None
+    kind = type(values[0])
+    if kind is int:
+        typecode = 'q'
+    elif kind is float:
+        typecode = 'd'
+    else:
+        return None
+    for data in values:
+        if type(data) is not kind:
+            return None
+    try:
+        return array(typecode, values)
+    except OverflowError:
+        return None
+
+def reduce_list(lst, protocol, options):
+    """Return a ``__reduce_ex__`` tuple that pickles lst as a flat payload.
+
+    The payloads are written as one sequence rather than a chain of nodes,
+    so pickling never recurses through ``next``. A list holding only ints
+    that fit in 64 bits, or only floats, is packed into an array; from
+    protocol 5 on that array is passed as a ``PickleBuffer`` so callers can
+    ship it out of band.
+
+    Args:
+        lst: The list to pickle.
+        protocol: The pickle protocol in use.
+        options: Constructor keyword arguments that recreate its
+            configuration.
+    """
+    values = list(lst)
+    packed = _packed(values)
+    if packed is None:
+        return rebuild, (type(lst), options, None, values)
+    payload = packed
+    if protocol >= 5:
+        from pickle import PickleBuffer
+        payload = PickleBuffer(packed)
+    return rebuild, (type(lst), options, packed.typecode, payload)
+
+def rebuild(cls, options, typecode, payload):
+    """Recreate a list pickled by ``reduce_list`` in a single linking pass."""
+    if typecode is not None and not isinstance(payload, array):
+        values = array(typecode)
+        values.frombytes(memoryview(payload).cast('B'))
+        payload = values
+    return cls.from_iterable(payload, **options)
@@ -0,0 +1,80 @@
+class NodePool:
+    """A bounded free-list of scrubbed nodes for reuse by later inserts.
+
+    Lists built with ``pool=`` hand every node they unlink back to the
+    pool and take new nodes from it before allocating. Released nodes have
+    their ``data``, ``next`` and ``prev`` cleared so no payload is kept
+    alive. One pool may be shared by several lists of the same node type.
+
+    A pooled list must not leak node references: a node handed back to the
+    pool is reused by the next insert.
+    """
+    __slots__ = ['node_type', 'capacity', 'hits', 'misses', 'dropped', '_free', '_doubly']
+
+    def __init__(self, node_type, capacity=1024):
+        """Create an empty pool.
+
+        Args:
+            node_type: The node class to pool, ``SLLNode`` or ``DLLNode``.
+            capacity: The most nodes kept for reuse; extra ones are dropped.
+
+        Raises:
+            ValueError: If capacity is negative.
+        """
+        if capacity < 0:
+            raise ValueError("Invalid capacity")
+        self.node_type = node_type
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self.dropped = 0
+        self._free = []
+        self._doubly = 'prev' in node_type.__slots__
+
+    def acquire(self, data):
+        """Return a node holding data, reusing a pooled one when available."""
+        if self._free:
+            self.hits += 1
+            node = self._free.pop()
+            node.data = data
+            return node
+        self.misses += 1
+        return self.node_type(data)
+
+    def release(self, node):
+        """Scrub an unlinked node and keep it for reuse if there is room."""
+        node.data = None
+        node.next = None
+        if self._doubly:
+            node.prev = None
+        if len(self._free) < self.capacity:
+            self._free.append(node)
+        else:
+            self.dropped += 1
+
+    def stats(self):
+        """Return a snapshot of the pool counters.
+
+        Returns:
+            A dict with the pooled node count, capacity, hits, misses and
+            dropped releases.
+        """
+        return {
+            "pooled": len(self._free),
+            "capacity": self.capacity,
+            "hits": self.hits,
+            "misses": self.misses,
+            "dropped": self.dropped,
+        }
+
+    def reset_stats(self):
+        """Zero the hit, miss and dropped counters."""
+        self.hits = self.misses = self.dropped = 0
+
+    def clear(self):
+        """Drop every pooled node."""
+        self._free.clear()
+
+    def __len__(self):
+        """Return the number of nodes ready for reuse."""
+        return len(self._free)
@@ -0,0 +1,132 @@
+from .CLL import CircularLinkedList
+
+class _Member:
+    """A scheduled member and its number of consecutive turns."""
+    __slots__ = ['member', 'weight']
+
+    def __init__(self, member, weight):
+        self.member = member
+        self.weight = weight
+
+class RoundRobin:
+    """Hand out turns to the members of a ring, one after another.
+
+    The members live in a ``CircularLinkedList`` whose head is the member
+    holding the current turn, so passing the turn on is a one-step
+    ``rotate`` and taking the current member out is ``del_at_start``; both
+    are O(1) and neither allocates. A member of weight w gets w turns in a
+    row before the turn moves on.
+    """
+    __slots__ = ['_ring', '_left', '_started']
+
+    def __init__(self, members=(), weight=1):
+        """Initialize a scheduler.
+
+        Args:
+            members: The initial members, in turn order.
+            weight: The weight given to each initial member.
+
+        Raises:
+            ValueError: If weight is less than 1.
+        """
+        if weight < 1:
+            raise ValueError("Invalid weight")
+        self._ring = CircularLinkedList.from_iterable(_Member(member, weight) for member in members)
+        self._left = 0
+        self._started = False
+
+    @property
+    def current(self):
+        """The member given the last turn, or None before the first turn."""
+        if not self._started:
+            return None
+        return self._ring.head.data.member
+
+    def add(self, member, weight=1):
+        """Add a member, whose first turn comes after every existing member's.
+
+        Args:
+            member: The member to schedule.
+            weight: The number of consecutive turns it gets each round.
+
+        Raises:
+            ValueError: If weight is less than 1.
+        """
+        if weight < 1:
+            raise ValueError("Invalid weight")
+        self._ring.insert_at_end(_Member(member, weight))
+
+    def next(self):
+        """Pass the turn on and return the member that now has it.
+
+        Raises:
+            ValueError: If there are no members.
+        """
+        ring = self._ring
+        if not ring.size:
+            raise ValueError("No members")
+        if not self._left:
+            if self._started:
+                ring.rotate(-1)
+            self._started = True
+            self._left = ring.head.data.weight
+        self._left -= 1
+        return ring.head.data.member
+
+    def remove_current(self):
+        """Remove the member holding the current turn in O(1) and return it.
+
+        The next call to ``next`` gives the turn to the member after it.
+
+        Raises:
+            ValueError: If no turn has been given since the last removal.
+        """
+        if not self._started:
+            raise ValueError("No current member")
+        member = self._ring.head.data.member
+        self._ring.del_at_start()
+        self._started = False
+        self._left = 0
+        return member
+
+    def remove(self, member):
+        """Remove the first entry for member, in O(n).
+
+        Raises:
+            ValueError: If member is not scheduled.
+        """
+        if self._started and self._ring.head.data.member == member:
+            self.remove_current()
+            return
+        for idx, entry in enumerate(self._ring):
+            if entry.member == member:
+                self._ring.delete(idx)
+                return
+        raise ValueError("Data not found")
+
+    def set_weight(self, member, weight):
+        """Change the weight of the first entry for member, from its next turn on.
+
+        Raises:
+            ValueError: If weight is less than 1 or member is not scheduled.
+        """
+        if weight < 1:
+            raise ValueError("Invalid weight")
+        for entry in self._ring:
+            if entry.member == member:
+                entry.weight = weight
+                return
+        raise ValueError("Data not found")
+
+    def __len__(self):
+        """Return the number of members."""
+        return self._ring.size
+
+    def __contains__(self, member):
+        """Return True if member is scheduled."""
+        return any(entry.member == member for entry in self._ring)
+
+    def __iter__(self):
+        """Yield the members in turn order, starting with the current one."""
+        for entry in self._ring:
+            yield entry.member
@@ -0,0 +1,162 @@
+import random
+
+
+class _Lane:
+    """Express-lane entry pointing at a node of the underlying chain."""
+    __slots__ = ['node', 'next', 'down', 'span']
+
+    def __init__(self, node, down=None):
+        self.node = node
+        self.next = None
+        self.down = down
+        self.span = 0
+
+
+class SkipIndex:
+    """Indexable skip-list lanes layered over a ``SingleLinkedList`` chain.
+
+    The owner's ``SLLNode`` chain is the bottom level and is never touched
+    here; each lane above it links a random subset of those nodes and
+    records in ``span`` how many chain positions a hop skips. Positional
+    lookups descend the lanes in expected O(log n) and finish with a short
+    walk on the chain.
+
+    The lanes are built lazily from the chain on first use and thrown away
+    by ``invalidate`` after mutations that reorder the whole chain.
+    """
+    __slots__ = ['owner', 'heads', 'valid', 'p']
+
+    MAX_LEVEL = 32
+
+    def __init__(self, owner, p=0.25):
+        """Attach an index to owner.
+
+        Args:
+            owner: The ``SingleLinkedList`` whose chain is indexed.
+            p: Probability of promoting a node to the next lane.
+        """
+        self.owner = owner
+        self.heads = []
+        self.valid = False
+        self.p = p
+
+    def _random_level(self):
+        """Return how many lanes a new node should appear in."""
+        level = 0
+        while level < self.MAX_LEVEL and random.random() < self.p:
+            level += 1
+        return level
+
+    def _grow(self, level):
+        """Add empty lanes on top until there are at least level of them."""
+        while len(self.heads) < level:
+            down = self.heads[-1] if self.heads else None
+            self.heads.append(_Lane(None, down))
+
+    def invalidate(self):
+        """Drop the lanes; they are rebuilt on the next lookup."""
+        self.heads = []
+        self.valid = False
+
+    def rebuild(self):
+        """Build fresh lanes from the owner's chain in one O(n) pass."""
+        self.heads = []
+        last = []
+        rank = []
+        cur = self.owner.head
+        pos = 0
+        while cur:
+            level = self._random_level()
+            if level > len(self.heads):
+                self._grow(level)
+                while len(last) < level:
+                    last.append(self.heads[len(last)])
+                    rank.append(-1)
+            down = None
+            for i in range(level):
+                lane = _Lane(cur, down)
+                last[i].next = lane
+                last[i].span = pos - rank[i]
+                last[i] = lane
+                rank[i] = pos
+                down = lane
+            cur = cur.next
+            pos += 1
+        self.valid = True
+
+    def _descend(self, position):
+        """Return the rightmost lane entry at or before position on each level.
+
+        Returns:
+            A pair of lists, bottom lane first: the lane entries and their
+            chain positions (-1 for a lane head).
+        """
+        update = [None] * len(self.heads)
+        ranks = [0] * len(self.heads)
+        pos = -1
+        level = len(self.heads) - 1
+        lane = self.heads[-1] if self.heads else None
+        while lane is not None:
+            while lane.next is not None and pos + lane.span <= position:
+                pos += lane.span
+                lane = lane.next
+            update[level] = lane
+            ranks[level] = pos
+            lane = lane.down
+            level -= 1
+        return update, ranks
+
+    def node_at(self, position):
+        """Return the chain node at a valid 0-based position."""
+        if not self.valid:
+            self.rebuild()
+        pos = -1
+        cur = None
+        lane = self.heads[-1] if self.heads else None
+        while lane is not None:
+            while lane.next is not None and pos + lane.span <= position:
+                pos += lane.span
+                lane = lane.next
+            cur = lane.node
+            lane = lane.down
+        if cur is None:
+            cur = self.owner.head
+            pos = 0
+        for _ in range(position - pos):
+            cur = cur.next
+        return cur
+
+    def inserted(self, position, node):
+        """Record that node was linked into the chain at position."""
+        if not self.valid:
+            return
+        level = self._random_level()
+        self._grow(level)
+        update, ranks = self._descend(position - 1)
+        down = None
+        for i, lane in enumerate(update):
+            if i < level:
+                new = _Lane(node, down)
+                new.next = lane.next
+                if lane.next is not None:
+                    new.span = ranks[i] + lane.span + 1 - position
+                lane.next = new
+                lane.span = position - ranks[i]
+                down = new
+            elif lane.next is not None:
+                lane.span += 1
+
+    def deleted(self, position, node):
+        """Record that node, currently at position, is being unlinked."""
+        if not self.valid:
+            return
+        update, _ = self._descend(position - 1)
+        for lane in update:
+            nxt = lane.next
+            if nxt is None:
+                continue
+            if nxt.node is node:
+                lane.span += nxt.span - 1
+                lane.next = nxt.next
+            else:
+                lane.span -= 1
@@ -0,0 +1,122 @@
+def _split(node, n):
+    """Cut a chain after its first n nodes and return the rest (or None)."""
+    for _ in range(n - 1):
+        if node is None:
+            return None
+        node = node.next
+    if node is None:
+        return None
+    rest = node.next
+    node.next = None
+    return rest
+
+
+def _before(b, a, key, reverse):
+    """Return True if node b must precede node a in the merged order."""
+    ka = a.data if key is None else key(a.data)
+    kb = b.data if key is None else key(b.data)
+    return ka < kb if reverse else kb < ka
+
+
+class _Anchor:
+    """Stand-in node whose next link is the head of the chain being built."""
+
+    __slots__ = ("next",)
+
+    def __init__(self):
+        self.next = None
+
+
+def _merge_after(tail, a, b, key, reverse):
+    """Stably merge chains a and b by relinking them after node tail.
+
+    If a comparison raises, the unmerged rest of a and then b are linked
+    after the merged prefix, so every node stays reachable from tail.
+
+    Returns:
+        The last node of the merged chain.
+    """
+    try:
+        if key is None and not reverse:
+            while a is not None and b is not None:
+                if b.data < a.data:
+                    tail.next = b
+                    tail = b
+                    b = b.next
+                else:
+                    tail.next = a
+                    tail = a
+                    a = a.next
+        else:
+            while a is not None and b is not None:
+                if _before(b, a, key, reverse):
+                    tail.next = b
+                    tail = b
+                    b = b.next
+                else:
+                    tail.next = a
+                    tail = a
+                    a = a.next
+    except BaseException:
+        tail.next = a if a is not None else b
+        if a is not None:
+            while a.next is not None:
+                a = a.next
+            a.next = b
+        raise
+    rest = a if a is not None else b
+    tail.next = rest
+    if rest is not None:
+        tail = rest
+        while tail.next is not None:
+            tail = tail.next
+    return tail
+
+
+def merge_chains(a, b, key=None, reverse=False):
+    """Stably merge two sorted None-terminated chains by relinking.
+
+    On ties the node from a comes first. Only ``<`` is used on the keys,
+    as with ``sorted``.
+
+    Returns:
+        A (head, tail) pair for the merged chain.
+    """
+    anchor = _Anchor()
+    tail = _merge_after(anchor, a, b, key, reverse)
+    if tail is anchor:
+        return None, None
+    return anchor.next, tail
+
+
+def sort_chain(lst, key=None, reverse=False):
+    """Stable bottom-up merge sort of the None-terminated chain of lst.
+
+    Nodes are relinked through ``next`` only and the new ends are stored in
+    ``lst.head`` and ``lst.tail``; ``prev`` links must be repaired by the
+    caller. Runs in O(n log n) time and O(1) extra memory. If a key or
+    comparison raises, the nodes are first joined back into one chain.
+    """
+    if lst.size < 2:
+        return
+    anchor = _Anchor()
+    anchor.next = lst.head
+    width = 1
+    try:
+        while width < lst.size:
+            cur = anchor.next
+            tail = anchor
+            while cur is not None:
+                left = cur
+                right = _split(left, width)
+                cur = _split(right, width)
+                tail = _merge_after(tail, left, right, key, reverse)
+            width *= 2
+    finally:
+        if width < lst.size:
+            while tail.next is not None:
+                tail = tail.next
+            tail.next = cur
+        while tail.next is not None:
+            tail = tail.next
+        lst.head, lst.tail = anchor.next, tail
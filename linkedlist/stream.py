@@ -0,0 +1,169 @@
+from collections import deque
+from itertools import chain, islice
+
+_MISSING = object()
+
+
+class Stream:
+    """A lazy pipeline over the data of a linked list.
+
+    Each step wraps the iterator of the step before it, so nothing is
+    computed or copied until a terminal operation (``reduce``, ``collect``
+    or plain iteration) pulls values, and the traversal of the list stops
+    as soon as the pipeline needs no more of them. A stream is consumed by
+    the first terminal operation run on it.
+    """
+    __slots__ = ['source', '_it']
+
+    def __init__(self, source, iterable):
+        """Initialize a stream.
+
+        Args:
+            source: The list the stream was started from.
+            iterable: The values flowing through the stream.
+        """
+        self.source = source
+        self._it = iter(iterable)
+
+    @classmethod
+    def of(cls, lst, start=0, wrap=False):
+        """Return a stream over the data of lst, starting at position start.
+
+        On the node-based lists the first node is found with the list's own
+        ``_node_at``, from the nearest end, the finger or the skip index,
+        and the stream walks on from there, so nothing before start is
+        visited twice. Other lists are read through plain iteration.
+
+        Args:
+            lst: The list to read.
+            start: The 0-based index of the first element.
+            wrap: If True, carry on from the head after the tail, so a
+                circular list is read once round from start.
+
+        Raises:
+            ValueError: If start is negative or beyond list length.
+        """
+        if start < 0 or start > lst.size:
+            raise ValueError("Invalid position")
+        if hasattr(lst, "_node_at"):
+            return cls(lst, _walk(lst, start, wrap))
+        values = islice(lst, start, None)
+        if wrap and start:
+            values = chain(values, islice(lst, start))
+        return cls(lst, values)
+
+    def _then(self, iterable):
+        """Return the next stage of the pipeline."""
+        return Stream(self.source, iterable)
+
+    def filter(self, predicate):
+        """Keep only the values for which predicate returns true."""
+        return self._then(filter(predicate, self._it))
+
+    def map(self, fn):
+        """Replace each value with fn(value)."""
+        return self._then(map(fn, self._it))
+
+    def take(self, n):
+        """Stop after the first n values."""
+        return self._then(islice(self._it, n))
+
+    def skip(self, n):
+        """Drop the first n values."""
+        return self._then(islice(self._it, n, None))
+
+    def chunk(self, n):
+        """Group the values into tuples of n, the last one possibly shorter.
+
+        Raises:
+            ValueError: If n is less than 1.
+        """
+        if n < 1:
+            raise ValueError("Invalid size")
+        it = self._it
+        return self._then(iter(lambda: tuple(islice(it, n)), ()))
+
+    def window(self, n):
+        """Yield each run of n consecutive values as a tuple.
+
+        Raises:
+            ValueError: If n is less than 1.
+        """
+        if n < 1:
+            raise ValueError("Invalid size")
+        return self._then(_windows(self._it, n))
+
+    def reduce(self, fn, initial=_MISSING):
+        """Fold the values from the left with fn and return the result.
+
+        Args:
+            fn: Callable taking the running result and the next value.
+            initial: The starting result; by default the first value.
+
+        Raises:
+            ValueError: If the stream is empty and no initial is given.
+        """
+        acc = initial
+        if acc is _MISSING:
+            acc = next(self._it, _MISSING)
+            if acc is _MISSING:
+                raise ValueError("Empty stream")
+        for value in self._it:
+            acc = fn(acc, value)
+        return acc
+
+    def collect(self, into=None, **kwargs):
+        """Build a list from the values in a single linking pass.
+
+        Args:
+            into: The list class to build, by default the type of the
+                source list. Any class with a ``from_iterable`` constructor
+                works, as does a builtin such as ``list``.
+            **kwargs: Constructor options passed to ``from_iterable``.
+
+        Returns:
+            A new list holding the values in stream order.
+        """
+        if into is None:
+            into = type(self.source)
+        build = getattr(into, "from_iterable", None)
+        if build is None:
+            return into(self._it, **kwargs)
+        return build(self._it, **kwargs)
+
+    def __iter__(self):
+        """Return the iterator of values, consuming the stream."""
+        return self._it
+
+
+def _windows(it, n):
+    """Yield each run of n consecutive items of it as a tuple."""
+    window = deque(islice(it, n - 1), maxlen=n)
+    for value in it:
+        window.append(value)
+        yield tuple(window)
+
+
+def _walk(lst, start, wrap):
+    """Yield the data of a node-based lst from position start on.
+
+    The walk follows ``prev`` links on a reversed (flipped) list and goes
+    back to the head after the tail when wrap is true.
+    """
+    size = lst.size
+    if wrap and size:
+        start %= size
+    count = size if wrap else size - start
+    if count <= 0:
+        return
+    flipped = getattr(lst, "_flipped", False)
+    if flipped:
+        node = lst._physically(lst._node_at, size - 1 - start)
+    else:
+        node = lst._node_at(start)
+    for _ in range(count - 1):
+        yield node.data
+        node = node.prev if flipped else node.next
+        if node is None:
+            node = lst.head
+    yield node.data
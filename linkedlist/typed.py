@@ -0,0 +1,272 @@
+from array import array
+
+from .array_engine import NIL, ArrayLinkedList
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class TypedLinkedList(ArrayLinkedList):
+    """A singly linked list whose payloads live in one typed buffer.
+
+    Payloads are stored unboxed in an ``array`` of ``typecode`` rather than
+    as Python objects. The list keeps track of whether its slots are
+    already laid out front to back; while they are, which holds after bulk
+    construction and appends, the buffer reads in list order and the
+    queries below run straight over it. Otherwise the first query compacts
+    the list once in O(n). With NumPy installed the queries run over a
+    zero-copy ``ndarray`` view of the buffer.
+    """
+    __slots__ = ['_ordered']
+
+    typecode = 'q'
+    dtype = 'int64'
+
+    def __init__(self):
+        """Initialize an empty typed linked list."""
+        super().__init__()
+        self._data = array(self.typecode)
+        self._ordered = True
+
+    def _alloc(self, data):
+        """Return a slot holding data; the payload is stored before any link changes."""
+        slot = self._free
+        if slot == NIL:
+            self._data.append(data)
+            self._next.append(NIL)
+            return len(self._data) - 1
+        self._data[slot] = data
+        self._free = self._next[slot]
+        self._next[slot] = NIL
+        return slot
+
+    def _release(self, slot):
+        """Zero a slot and push it onto the free-list."""
+        self._data[slot] = 0
+        self._next[slot] = self._free
+        self._free = slot
+        self._ordered = False
+
+    def _relink(self, start):
+        """Link the buffer slots from start onward in order after slot start - 1."""
+        n = len(self._data)
+        if n == start:
+            return
+        self._next.extend(range(start + 1, n + 1))
+        self._next[n - 1] = NIL
+        if start:
+            self._next[start - 1] = start
+        else:
+            self.head = 0
+        self.tail = n - 1
+        self.size = n
+        self._close()
+
+    def _view(self):
+        """Return the payloads in list order: an ndarray view, or the array itself."""
+        self.compact()
+        if numpy is None:
+            return self._data
+        if not self.size:
+            return numpy.empty(0, dtype=self.dtype)
+        return numpy.frombuffer(self._data, dtype=self.dtype)
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        """Build a list from an iterable of numbers in one pass.
+
+        Returns:
+            A new list holding the items.
+        """
+        lst = cls()
+        lst.extend(iterable)
+        return lst
+
+    @classmethod
+    def from_numpy(cls, values):
+        """Build a list from a NumPy array with a single copy.
+
+        Args:
+            values: A one-dimensional array, converted to ``dtype`` if needed.
+
+        Returns:
+            A new list holding the values in order.
+        """
+        if numpy is None:
+            raise ImportError("from_numpy needs numpy")
+        lst = cls()
+        values = numpy.ascontiguousarray(values, dtype=cls.dtype)
+        lst._data.frombytes(memoryview(values).cast('B'))
+        lst._relink(0)
+        return lst
+
+    def to_numpy(self, copy=True):
+        """Return the payloads, in list order, as a NumPy array.
+
+        Args:
+            copy: If False, return a view sharing the list's buffer. The
+                list cannot grow while such a view is alive (``array``
+                raises BufferError), and later edits show through it.
+
+        Returns:
+            A one-dimensional ``ndarray`` of ``dtype``.
+        """
+        if numpy is None:
+            raise ImportError("to_numpy needs numpy")
+        view = self._view()
+        return view.copy() if copy else view
+
+    def compact(self):
+        """Lay the slots out in list order, dropping freed slots. O(n), one copy."""
+        if self._ordered:
+            return
+        values = array(self.typecode, self)
+        self._data = values
+        self._next = array('q')
+        self._free = NIL
+        self.head = self.tail = NIL
+        self.size = 0
+        self._relink(0)
+        self._ordered = True
+
+    def insert_at_beginning(self, data):
+        """Insert a node with the given data at the beginning.
+
+        Args:
+            data: The data to insert.
+        """
+        super().insert_at_beginning(data)
+        self._ordered = self.size == 1 and self._ordered
+
+    def insert_at_position(self, data, position):
+        """Insert a node with the given data at the specified 0-based position.
+
+        Args:
+            data: The data to insert.
+            position: The 0-based index where the node should be inserted.
+
+        Raises:
+            ValueError: If position is negative or beyond list length.
+        """
+        if position == self.size:
+            self.insert_at_end(data)
+            return
+        super().insert_at_position(data, position)
+        self._ordered = False
+
+    def extend(self, iterable):
+        """Append every item of iterable at the end.
+
+        The items are converted to the buffer type first, so a bad item
+        leaves the list unchanged. While the list is laid out in order they
+        are then copied into the buffer in one C-level call.
+
+        Args:
+            iterable: The numbers to append, in order.
+        """
+        values = array(self.typecode, iterable)
+        if not self._ordered:
+            super().extend(values)
+            return
+        self._data.extend(values)
+        self._relink(self.size)
+
+    def extendleft(self, iterable):
+        """Insert every item of iterable at the beginning, one after another.
+
+        Args:
+            iterable: The numbers to insert; they end up in reverse order.
+        """
+        super().extendleft(iterable)
+        self._ordered = self.size < 2 and self._ordered
+
+    def reverse(self):
+        """Reverse the linked list in place."""
+        super().reverse()
+        self._ordered = self.size < 2 and self._ordered
+
+    def find(self, data):
+        """Return the 0-based position of the first node with the given data.
+
+        Args:
+            data: The data to find.
+
+        Returns:
+            The 0-based index of the data, or -1 if not found.
+
+        Raises:
+            ValueError: If the list is empty.
+        """
+        if not self.size:
+            raise ValueError("Empty list")
+        self.compact()
+        try:
+            return self._data.index(data)
+        except ValueError:
+            return -1
+
+    def count(self, data):
+        """Return the number of nodes holding data."""
+        self.compact()
+        return self._data.count(data)
+
+    def sum(self):
+        """Return the sum of the payloads; int sums wrap at 64 bits with NumPy."""
+        if numpy is None:
+            self.compact()
+            return sum(self._data)
+        return self._view().sum().item()
+
+    def min(self):
+        """Return the smallest payload.
+
+        Raises:
+            ValueError: If the list is empty.
+        """
+        if not self.size:
+            raise ValueError("Empty list")
+        view = self._view()
+        return min(view) if numpy is None else view.min().item()
+
+    def max(self):
+        """Return the largest payload.
+
+        Raises:
+            ValueError: If the list is empty.
+        """
+        if not self.size:
+            raise ValueError("Empty list")
+        view = self._view()
+        return max(view) if numpy is None else view.max().item()
+
+    def argwhere(self, predicate):
+        """Return the positions, in list order, whose payload satisfies predicate.
+
+        Args:
+            predicate: An elementwise test such as ``lambda v: v > 0``. With
+                NumPy it is called once on the whole ndarray and must return
+                a boolean mask; without NumPy it is called per payload.
+
+        Returns:
+            A list of 0-based positions.
+        """
+        view = self._view()
+        if numpy is None:
+            return [idx for idx, data in enumerate(view) if predicate(data)]
+        return numpy.flatnonzero(predicate(view)).tolist()
+
+
+class IntLinkedList(TypedLinkedList):
+    """A typed linked list of signed 64-bit integers."""
+    __slots__ = []
+    typecode = 'q'
+    dtype = 'int64'
+
+
+class FloatLinkedList(TypedLinkedList):
+    """A typed linked list of 64-bit floats."""
+    __slots__ = []
+    typecode = 'd'
+    dtype = 'float64'
@@ -0,0 +1,375 @@
+from itertools import islice
+
+from .node import ChunkNode
+
+class UnrolledLinkedList:
+    """A linked list of chunks, each holding up to chunk_size elements.
+
+    Chunks are doubly linked and keep their elements in a small Python
+    list, so iteration and search run over contiguous slots with one
+    pointer hop per chunk instead of per element. A chunk that overflows
+    on insert is split in two; a chunk that drops below half full on
+    delete borrows from or merges with a neighbour.
+    """
+    __slots__ = ['head', 'tail', 'size', 'chunk_size', 'chunks']
+
+    def __init__(self, chunk_size=64):
+        """Initialize an empty unrolled linked list.
+
+        Args:
+            chunk_size: The most elements a chunk holds.
+
+        Raises:
+            ValueError: If chunk_size is less than 2.
+        """
+        if chunk_size < 2:
+            raise ValueError("Invalid chunk size")
+        self.head = None
+        self.tail = None
+        self.size = 0
+        self.chunk_size = chunk_size
+        self.chunks = 0
+
+    def _link_after(self, chunk, new):
+        """Link chunk new after chunk, or at the front if chunk is None."""
+        nxt = self.head if chunk is None else chunk.next
+        new.prev = chunk
+        new.next = nxt
+        if chunk is None:
+            self.head = new
+        else:
+            chunk.next = new
+        if nxt is None:
+            self.tail = new
+        else:
+            nxt.prev = new
+        self.chunks += 1
+
+    def _unlink(self, chunk):
+        """Unlink an empty or merged-away chunk."""
+        if chunk.prev is None:
+            self.head = chunk.next
+        else:
+            chunk.prev.next = chunk.next
+        if chunk.next is None:
+            self.tail = chunk.prev
+        else:
+            chunk.next.prev = chunk.prev
+        self.chunks -= 1
+
+    def _locate(self, position):
+        """Return (chunk, offset) for a valid 0-based position, walking from the nearer end."""
+        if position < self.size // 2:
+            chunk = self.head
+            while position >= len(chunk.items):
+                position -= len(chunk.items)
+                chunk = chunk.next
+            return chunk, position
+        back = self.size - position
+        chunk = self.tail
+        while back > len(chunk.items):
+            back -= len(chunk.items)
+            chunk = chunk.prev
+        return chunk, len(chunk.items) - back
+
+    def _split(self, chunk):
+        """Move the upper half of an overfull chunk into a new chunk after it."""
+        half = len(chunk.items) // 2
+        self._link_after(chunk, ChunkNode(chunk.items[half:]))
+        del chunk.items[half:]
+
+    def _rebalance(self, chunk):
+        """Refill or drop a chunk that fell below half full after a delete."""
+        items = chunk.items
+        if not items:
+            self._unlink(chunk)
+            return
+        half = self.chunk_size // 2
+        if len(items) >= half:
+            return
+        nxt = chunk.next
+        if nxt is not None:
+            if len(items) + len(nxt.items) <= self.chunk_size:
+                items.extend(nxt.items)
+                self._unlink(nxt)
+            else:
+                take = (len(nxt.items) - len(items)) // 2
+                items.extend(nxt.items[:take])
+                del nxt.items[:take]
+        elif chunk.prev is not None and len(chunk.prev.items) + len(items) <= self.chunk_size:
+            chunk.prev.items.extend(items)
+            self._unlink(chunk)
+
+    @classmethod
+    def from_iterable(cls, iterable, **kwargs):
+        """Build a list from an iterable, filling whole chunks at a time.
+
+        Args:
+            iterable: The items to store, in order.
+            **kwargs: Constructor options such as ``chunk_size``.
+
+        Returns:
+            A new list holding the items.
+        """
+        lst = cls(**kwargs)
+        lst.extend(iterable)
+        return lst
+
+    @classmethod
+    def from_range(cls, *args, **kwargs):
+        """Build a list holding ``range(*args)``.
+
+        Returns:
+            A new list holding the range values.
+        """
+        return cls.from_iterable(range(*args), **kwargs)
+
+    def is_empty(self):
+        """Return True if the list is empty."""
+        return self.size == 0
+
+    def insert_at_beginning(self, data):
+        """Insert the given data at the beginning.
+
+        Args:
+            data: The data to insert.
+        """
+        if self.head is None or len(self.head.items) >= self.chunk_size:
+            self._link_after(None, ChunkNode([data]))
+        else:
+            self.head.items.insert(0, data)
+        self.size += 1
+
+    def insert_at_end(self, data):
+        """Insert the given data at the end.
+
+        Args:
+            data: The data to insert.
+        """
+        if self.tail is None or len(self.tail.items) >= self.chunk_size:
+            self._link_after(self.tail, ChunkNode([data]))
+        else:
+            self.tail.items.append(data)
+        self.size += 1
+
+    def insert_at_position(self, data, position):
+        """Insert the given data at the specified 0-based position.
+
+        Args:
+            data: The data to insert.
+            position: The 0-based index where the data should be inserted.
+
+        Raises:
+            ValueError: If position is negative or beyond list length.
+        """
+        if position < 0 or position > self.size:
+            raise ValueError("Invalid position")
+        if position == 0:
+            self.insert_at_beginning(data)
+            return
+        if position == self.size:
+            self.insert_at_end(data)
+            return
+
+        chunk, offset = self._locate(position)
+        chunk.items.insert(offset, data)
+        self.size += 1
+        if len(chunk.items) > self.chunk_size:
+            self._split(chunk)
+
+    def extend(self, iterable):
+        """Append every item of iterable at the end, a whole chunk at a time.
+
+        Args:
+            iterable: The items to append, in order.
+        """
+        it = iter(iterable)
+        cap = self.chunk_size
+        if self.tail is not None and len(self.tail.items) < cap:
+            more = list(islice(it, cap - len(self.tail.items)))
+            self.tail.items.extend(more)
+            self.size += len(more)
+        while True:
+            items = list(islice(it, cap))
+            if not items:
+                break
+            self._link_after(self.tail, ChunkNode(items))
+            self.size += len(items)
+
+    def delete(self, position):
+        """Delete the element at the specified 0-based position.
+
+        Args:
+            position: The 0-based index of the element to delete.
+
+        Raises:
+            ValueError: If the list is empty or position is invalid.
+        """
+        if not self.size:
+            raise ValueError("Empty list")
+        if position < 0 or position >= self.size:
+            raise ValueError("Invalid position")
+        chunk, offset = self._locate(position)
+        del chunk.items[offset]
+        self.size -= 1
+        self._rebalance(chunk)
+
+    def remove(self, data):
+        """Remove the first element equal to data.
+
+        Args:
+            data: The data to remove.
+
+        Raises:
+            ValueError: If the list is empty or data is not found.
+        """
+        if not self.size:
+            raise ValueError("Empty list")
+        chunk = self.head
+        while chunk:
+            if data in chunk.items:
+                chunk.items.remove(data)
+                self.size -= 1
+                self._rebalance(chunk)
+                return
+            chunk = chunk.next
+        raise ValueError("Data not found")
+
+    def del_at_start(self):
+        """Delete the element at the beginning.
+
+        Raises:
+            ValueError: If the list is empty.
+        """
+        if not self.size:
+            raise ValueError("Empty list")
+        del self.head.items[0]
+        self.size -= 1
+        self._rebalance(self.head)
+
+    def del_at_end(self):
+        """Delete the element at the end.
+
+        Raises:
+            ValueError: If the list is empty.
+        """
+        if not self.size:
+            raise ValueError("Empty list")
+        self.tail.items.pop()
+        self.size -= 1
+        self._rebalance(self.tail)
+
+    def update(self, position, data):
+        """Update the element at the specified 0-based position.
+
+        Args:
+            position: The 0-based index of the element to update.
+            data: The new data value.
+
+        Raises:
+            ValueError: If the list is empty or position is invalid.
+        """
+        if not self.size:
+            raise ValueError("Empty list")
+        if position < 0 or position >= self.size:
+            raise ValueError("Invalid position")
+        chunk, offset = self._locate(position)
+        chunk.items[offset] = data
+
+    def reverse(self):
+        """Reverse the list in place, chunk order and chunk contents."""
+        chunk = self.head
+        while chunk:
+            chunk.items.reverse()
+            chunk.next, chunk.prev = chunk.prev, chunk.next
+            chunk = chunk.prev
+        self.head, self.tail = self.tail, self.head
+
+    def show_val(self, position):
+        """Return the data at the specified 0-based position.
+
+        Args:
+            position: The 0-based index of the element.
+
+        Returns:
+            The data at the specified position.
+
+        Raises:
+            ValueError: If the list is empty or position is invalid.
+        """
+        if not self.size:
+            raise ValueError("Empty list")
+        if position < 0 or position >= self.size:
+            raise ValueError("Invalid position")
+        chunk, offset = self._locate(position)
+        return chunk.items[offset]
+
+    def show_len(self):
+        """Return the number of elements in the list.
+
+        Returns:
+            The size of the list.
+        """
+        return self.size
+
+    def find(self, data):
+        """Return the 0-based position of the first element equal to data.
+
+        Args:
+            data: The data to find.
+
+        Returns:
+            The 0-based index of the data, or -1 if not found.
+
+        Raises:
+            ValueError: If the list is empty.
+        """
+        if not self.size:
+            raise ValueError("Empty list")
+        base = 0
+        chunk = self.head
+        while chunk:
+            if data in chunk.items:
+                return base + chunk.items.index(data)
+            base += len(chunk.items)
+            chunk = chunk.next
+        return -1
+
+    def generate(self, n):
+        """Generate a list with values from 1 to n at positions 0 to n-1.
+
+        Args:
+            n: The number of elements to generate.
+
+        Raises:
+            ValueError: If n is negative.
+        """
+        if n < 0:
+            raise ValueError("Invalid size")
+        self.extend(range(1, n + 1))
+
+    def display(self):
+        """Return a string representation of the list.
+
+        Returns:
+            A string representing the list.
+        """
+        if not self.size:
+            return "Empty list"
+        return " -> ".join(map(str, self)) + " -> None"
+
+    def __contains__(self, data):
+        """Return True if some element equals data."""
+        chunk = self.head
+        while chunk:
+            if data in chunk.items:
+                return True
+            chunk = chunk.next
+        return False
+
+    def __iter__(self):
+        """Yield each element in list order."""
+        chunk = self.head
+        while chunk:
+            yield from chunk.items
+            chunk = chunk.next
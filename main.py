@@ -1,10 +1,12 @@
-from linkedlist.SLL import SingleLinkedList
-from linkedlist.DLL import DoubleLinkedList
-from linkedlist.CLL import CircularLinkedList
-from linkedlist.DCLL import CircularDoubleLinkedList
-
-
-s = SingleLinkedList()
-s.append(12,3)
-s.del_at_end()
-s.display()
\ No newline at end of file
+from linkedlist import (CircularDoubleLinkedList, CircularLinkedList,
+                        DoubleLinkedList, SingleLinkedList)
+
+
+s = SingleLinkedList()
+s.insert_at_end(12)
+s.insert_at_end(3)
+s.del_at_end()
+print(s.display())
+
+for cls in (DoubleLinkedList, CircularLinkedList, CircularDoubleLinkedList):
+    print(cls.from_range(1, 4).display())
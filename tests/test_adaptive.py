@@ -0,0 +1,56 @@
+import pytest
+
+from linkedlist.adaptive import AdaptiveLinkedList
+
+
+@pytest.mark.parametrize("circular", [False, True])
+def test_promotes_after_backward_operations(circular):
+    lst = AdaptiveLinkedList.from_range(100, circular=circular, promote_after=3)
+    lst.del_at_end()
+    lst.show_val(90)
+    assert not lst.doubly
+    lst.update(80, -1)
+    assert lst.doubly
+    assert lst.promotions == 1
+    assert list(lst) == [*range(80), -1, *range(81, 99)]
+
+
+def test_demotes_after_quiet_operations():
+    lst = AdaptiveLinkedList.from_range(10, promote_after=1, demote_after=2)
+    lst.del_at_end()
+    assert lst.doubly
+    lst.insert_at_end(9)
+    lst.del_at_start()
+    assert not lst.doubly
+    assert [entry[1] for entry in lst.history] == ["doubly", "singly"]
+    assert list(lst) == list(range(1, 10))
+
+
+def test_failed_tail_delete_is_not_counted():
+    lst = AdaptiveLinkedList(promote_after=1)
+    with pytest.raises(ValueError):
+        lst.del_at_end()
+    assert not lst.doubly
+    assert lst.stats() == {"storage": "singly", "operations": 0, "tail_deletes": 0,
+                           "backward_accesses": 0, "promotions": 0, "demotions": 0}
+
+
+@pytest.mark.parametrize("call", [
+    lambda lst: lst.show_val(50),
+    lambda lst: lst.delete(50),
+    lambda lst: lst.update(50, 0),
+    lambda lst: lst.insert_at_position(0, 50),
+])
+def test_failed_positional_operation_is_not_counted(call):
+    lst = AdaptiveLinkedList.from_range(10, promote_after=1)
+    with pytest.raises(ValueError):
+        call(lst)
+    assert not lst.doubly
+    assert lst.backward_accesses == 0
+
+
+def test_failed_remove_is_not_counted():
+    lst = AdaptiveLinkedList.from_range(3)
+    with pytest.raises(ValueError):
+        lst.remove(7)
+    assert lst.stats()["operations"] == 0
@@ -0,0 +1,79 @@
+import pytest
+
+from linkedlist import (ArrayCircularDoubleLinkedList, ArrayCircularLinkedList,
+                        ArrayDoubleLinkedList, ArraySingleLinkedList,
+                        CircularDoubleLinkedList, CircularLinkedList,
+                        DoubleLinkedList, SingleLinkedList)
+
+ENGINES = [
+    (SingleLinkedList, ArraySingleLinkedList),
+    (DoubleLinkedList, ArrayDoubleLinkedList),
+    (CircularLinkedList, ArrayCircularLinkedList),
+    (CircularDoubleLinkedList, ArrayCircularDoubleLinkedList),
+]
+
+
+@pytest.mark.parametrize("cls, array_cls", ENGINES)
+def test_engine_by_keyword_or_position(cls, array_cls):
+    assert type(cls(engine="array")) is array_cls
+    assert type(cls("array")) is array_cls
+    assert type(cls("node")) is cls
+    assert type(cls.from_range(3, engine="array")) is array_cls
+
+
+@pytest.mark.parametrize("cls, array_cls", ENGINES)
+@pytest.mark.parametrize("options", [{"indexed": True}, {"key": str}, {"pool": 8},
+                                     {"key": 0}, {"pool": 0}, {"indexed": None}])
+def test_array_engine_refuses_node_options(cls, array_cls, options):
+    with pytest.raises(ValueError):
+        cls(engine="array", **options)
+
+
+@pytest.mark.parametrize("cls, array_cls", ENGINES)
+def test_array_engine_refuses_positional_options(cls, array_cls):
+    with pytest.raises(ValueError):
+        cls("array", True)
+
+
+def test_array_engine_skiplist_option():
+    with pytest.raises(ValueError):
+        SingleLinkedList(engine="array", skiplist=True)
+    with pytest.raises(TypeError):
+        SingleLinkedList("array", False, skiplist=False)
+    assert type(SingleLinkedList("array", False, False, None, None)) is ArraySingleLinkedList
+
+
+@pytest.mark.parametrize("cls, array_cls", ENGINES)
+def test_array_engine_accepts_default_options(cls, array_cls):
+    assert type(cls("array", False)) is array_cls
+    assert type(cls(engine="array", indexed=False, key=None, pool=None)) is array_cls
+
+
+@pytest.mark.parametrize("cls, array_cls", ENGINES)
+def test_array_engine_rejects_bad_arguments(cls, array_cls):
+    with pytest.raises(TypeError):
+        cls(engine="array", capacity=4)
+    with pytest.raises(TypeError):
+        cls("array", False, None, None, None, None)
+
+
+@pytest.mark.parametrize("cls, array_cls", ENGINES)
+def test_unknown_engine(cls, array_cls):
+    with pytest.raises(ValueError):
+        cls(engine="disk")
+
+
+@pytest.mark.parametrize("cls, array_cls", ENGINES)
+def test_core_operations_match_node_engine(cls, array_cls):
+    lists = [cls.from_range(5), cls.from_range(5, engine="array")]
+    for lst in lists:
+        lst.insert_at_beginning(-1)
+        lst.insert_at_position(9, 3)
+        lst.delete(1)
+        lst.remove(4)
+        lst.update(0, 7)
+        lst.del_at_end()
+        lst.reverse()
+    assert list(lists[0]) == list(lists[1])
+    assert lists[0].find(9) == lists[1].find(9)
+    assert lists[0].display() == lists[1].display()
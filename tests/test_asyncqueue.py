@@ -0,0 +1,139 @@
+import asyncio
+
+import pytest
+
+from linkedlist import AsyncLinkedQueue
+
+
+def test_fifo_and_nowait_errors():
+    async def main():
+        queue = AsyncLinkedQueue(maxsize=2)
+        with pytest.raises(asyncio.QueueEmpty):
+            queue.get_nowait()
+        queue.put_nowait(1)
+        await queue.put(2)
+        assert queue.full() and queue.qsize() == 2
+        with pytest.raises(asyncio.QueueFull):
+            queue.put_nowait(3)
+        assert [queue.get_nowait(), await queue.get()] == [1, 2]
+        assert queue.empty()
+
+    asyncio.run(main())
+
+
+def test_waiting_consumers_are_served_in_order():
+    async def main():
+        queue = AsyncLinkedQueue()
+        getters = [asyncio.create_task(queue.get()) for _ in range(3)]
+        await asyncio.sleep(0)
+        for item in "abc":
+            queue.put_nowait(item)
+        assert await asyncio.gather(*getters) == ["a", "b", "c"]
+        assert queue.empty()
+
+    asyncio.run(main())
+
+
+def test_blocked_producers_fill_freed_slots_in_order():
+    async def main():
+        queue = AsyncLinkedQueue(maxsize=1)
+        await queue.put(0)
+        putters = [asyncio.create_task(queue.put(i)) for i in (1, 2)]
+        await asyncio.sleep(0)
+        assert queue.qsize() == 1
+        got = [await queue.get() for _ in range(3)]
+        await asyncio.gather(*putters)
+        assert got == [0, 1, 2]
+
+    asyncio.run(main())
+
+
+def test_cancelled_consumer_gives_its_item_back():
+    async def main():
+        queue = AsyncLinkedQueue()
+        first = asyncio.create_task(queue.get())
+        second = asyncio.create_task(queue.get())
+        await asyncio.sleep(0)
+        queue.put_nowait("x")
+        first.cancel()
+        assert await second == "x"
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    asyncio.run(main())
+
+
+
+def test_cancelled_producer_does_not_queue_its_item():
+    async def main():
+        queue = AsyncLinkedQueue(maxsize=1)
+        await queue.put(0)
+        first = asyncio.create_task(queue.put(1))
+        second = asyncio.create_task(queue.put(2))
+        await asyncio.sleep(0)
+        assert queue.get_nowait() == 0
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        await second
+        assert queue.qsize() == 1 and queue.get_nowait() == 2
+        assert queue.empty()
+
+    asyncio.run(main())
+
+
+def test_cancelled_consumer_keeps_the_queue_bounded():
+    async def main():
+        queue = AsyncLinkedQueue(maxsize=1)
+        consumer = asyncio.create_task(queue.get())
+        await asyncio.sleep(0)
+        queue.put_nowait("a")
+        with pytest.raises(asyncio.QueueFull):
+            queue.put_nowait("b")
+        producer = asyncio.create_task(queue.put("b"))
+        consumer.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await consumer
+        assert queue.qsize() == 1 and queue.full()
+        assert [await queue.get(), await queue.get()] == ["a", "b"]
+        await producer
+        assert queue.empty()
+
+    asyncio.run(main())
+
+def test_get_many():
+    async def main():
+        queue = AsyncLinkedQueue()
+        waiter = asyncio.create_task(queue.get_many(3))
+        await asyncio.sleep(0)
+        queue.put_nowait(1)
+        assert await waiter == [1]
+        for item in range(2, 7):
+            queue.put_nowait(item)
+        assert await queue.get_many(3) == [2, 3, 4]
+        assert await queue.get_many(10) == [5, 6]
+        with pytest.raises(ValueError):
+            await queue.get_many(0)
+
+    asyncio.run(main())
+
+
+def test_producers_and_consumers_lose_nothing():
+    async def main():
+        queue = AsyncLinkedQueue(maxsize=3)
+        seen = []
+
+        async def produce(base):
+            for i in range(50):
+                await queue.put(base + i)
+
+        async def consume():
+            for _ in range(50):
+                seen.append(await queue.get())
+
+        await asyncio.gather(*(produce(base) for base in (0, 100, 200)),
+                             *(consume() for _ in range(3)))
+        assert sorted(seen) == [base + i for base in (0, 100, 200) for i in range(50)]
+        assert queue.empty()
+
+    asyncio.run(main())
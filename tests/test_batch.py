@@ -0,0 +1,100 @@
+import random
+
+import pytest
+
+from linkedlist import (CircularDoubleLinkedList, CircularLinkedList,
+                        DoubleLinkedList, SingleLinkedList)
+
+CLASSES = [SingleLinkedList, DoubleLinkedList, CircularLinkedList, CircularDoubleLinkedList]
+OPTIONS = [{}, {"indexed": True}, {"pool": 4}]
+
+
+def inserted(values, items):
+    """Return values with the (position, data) items inserted as insert_many does."""
+    result = []
+    for pos in range(len(values) + 1):
+        result.extend(data for at, data in items if at == pos)
+        if pos < len(values):
+            result.append(values[pos])
+    return result
+
+
+def build(cls, options, values, rng):
+    """Return a cls holding values, sometimes as a reversed doubly linked list."""
+    if cls in (DoubleLinkedList, CircularDoubleLinkedList) and rng.random() < 0.5:
+        lst = cls.from_iterable(values[::-1], **options)
+        lst.reverse()
+        return lst
+    return cls.from_iterable(values, **options)
+
+
+@pytest.mark.parametrize("cls", CLASSES)
+@pytest.mark.parametrize("options", OPTIONS)
+def test_batch_ops_match_a_list(cls, options):
+    rng = random.Random(6)
+    for _ in range(60):
+        values = [rng.randrange(4) for _ in range(rng.randrange(8))]
+        lst = build(cls, options, values, rng)
+        items = [(rng.randrange(len(values) + 1), -i) for i in range(rng.randrange(4))]
+        lst.insert_many(items)
+        values = inserted(values, items)
+        assert list(lst) == values
+        if values:
+            doomed = {rng.randrange(len(values)) for _ in range(rng.randrange(4))}
+            lst.delete_many(doomed)
+            values = [v for i, v in enumerate(values) if i not in doomed]
+            assert list(lst) == values
+        target = rng.randrange(4)
+        assert lst.remove_all(target) == values.count(target)
+        values = [v for v in values if v != target]
+        assert lst.remove_if(lambda v: v < 0) == sum(v < 0 for v in values)
+        values = [v for v in values if v >= 0]
+        assert list(lst) == values
+        assert lst.size == len(values)
+        if values:
+            assert lst.show_val(len(values) - 1) == values[-1]
+            assert lst.find(values[0]) == 0
+        lst.insert_at_end(9)
+        assert list(lst) == values + [9]
+
+
+@pytest.mark.parametrize("cls", CLASSES)
+def test_invalid_batches_change_nothing(cls):
+    lst = cls.from_range(3)
+    with pytest.raises(ValueError):
+        lst.insert_many([(1, "a"), (4, "b")])
+    with pytest.raises(ValueError):
+        lst.delete_many([0, 3])
+    with pytest.raises(ValueError):
+        lst.delete_many([-1])
+    assert list(lst) == [0, 1, 2]
+    with pytest.raises(ValueError):
+        cls().delete_many([0])
+    lst.delete_many([])
+    lst.insert_many([])
+    assert list(lst) == [0, 1, 2]
+
+
+@pytest.mark.parametrize("cls", CLASSES)
+@pytest.mark.parametrize("options", OPTIONS)
+def test_raising_predicate_leaves_a_valid_list(cls, options):
+    lst = cls.from_iterable([0, 1, 2, 3, 4, 5], **options)
+    seen = []
+
+    def predicate(value):
+        seen.append(value)
+        if len(seen) == 3:
+            raise RuntimeError("boom")
+        return value == 0
+
+    with pytest.raises(RuntimeError):
+        lst.remove_if(predicate)
+    assert list(lst) == [1, 2, 3, 4, 5]
+    assert lst.size == 5
+    assert lst.show_val(4) == 5
+    assert lst.tail.data == 5
+    assert 0 not in lst and lst.find(3) == 2
+    if hasattr(lst.head, "prev"):
+        assert list(reversed(lst)) == [5, 4, 3, 2, 1]
+    lst.insert_at_end(6)
+    assert list(lst) == [1, 2, 3, 4, 5, 6]
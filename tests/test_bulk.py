@@ -0,0 +1,67 @@
+import pytest
+
+from linkedlist import (CircularDoubleLinkedList, CircularLinkedList,
+                        DoubleLinkedList, SingleLinkedList)
+
+CLASSES = [SingleLinkedList, DoubleLinkedList, CircularLinkedList, CircularDoubleLinkedList]
+CIRCULAR = (CircularLinkedList, CircularDoubleLinkedList)
+
+
+def check_links(lst, expected):
+    """Assert the nodes of lst hold expected and are linked consistently."""
+    assert list(lst) == expected
+    assert lst.size == len(expected)
+    if not expected:
+        assert lst.head is None and lst.tail is None
+        return
+    assert lst.head.data == expected[0]
+    assert lst.tail.data == expected[-1]
+    assert lst.tail.next is (lst.head if isinstance(lst, CIRCULAR) else None)
+    if hasattr(lst.head, "prev"):
+        assert list(reversed(lst)) == expected[::-1]
+
+
+@pytest.mark.parametrize("cls", CLASSES)
+@pytest.mark.parametrize("n", [0, 1, 2, 7])
+def test_from_iterable_and_from_range(cls, n):
+    check_links(cls.from_iterable(iter(range(n))), list(range(n)))
+    check_links(cls.from_range(2, 2 + n), list(range(2, 2 + n)))
+
+
+@pytest.mark.parametrize("cls", CLASSES)
+def test_extend_and_extendleft(cls):
+    lst = cls()
+    lst.extend([])
+    lst.extendleft([])
+    check_links(lst, [])
+    lst.extend(x for x in [3, 4])
+    lst.extendleft([2, 1])
+    lst.extend([5])
+    lst.extendleft([0])
+    check_links(lst, [0, 1, 2, 3, 4, 5])
+    lst.insert_at_end(6)
+    lst.insert_at_beginning(-1)
+    check_links(lst, [-1, 0, 1, 2, 3, 4, 5, 6])
+
+
+@pytest.mark.parametrize("cls", CLASSES)
+def test_generate(cls):
+    lst = cls()
+    lst.generate(4)
+    check_links(lst, [1, 2, 3, 4])
+    lst.generate(0)
+    check_links(lst, [1, 2, 3, 4])
+    with pytest.raises(ValueError):
+        lst.generate(-1)
+
+
+@pytest.mark.parametrize("cls", CLASSES)
+@pytest.mark.parametrize("options", [{"indexed": True}, {"pool": 2}])
+def test_bulk_construction_keeps_options(cls, options):
+    lst = cls.from_iterable([1, 2, 1], **options)
+    lst.extend([3, 1])
+    lst.extendleft([0])
+    check_links(lst, [0, 1, 2, 1, 3, 1])
+    assert lst.find(3) == 4
+    lst.remove(1)
+    check_links(lst, [0, 2, 1, 3, 1])
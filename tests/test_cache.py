@@ -0,0 +1,93 @@
+import random
+from collections import OrderedDict
+
+import pytest
+
+from linkedlist import LFUCache, LRUCache, memoize
+
+
+def test_lru_matches_an_ordered_dict():
+    rng = random.Random(12)
+    cache = LRUCache(capacity=5)
+    model = OrderedDict()
+    for step in range(2000):
+        key = rng.randrange(10)
+        if rng.random() < 0.5:
+            value = cache.get(key)
+            assert value == model.get(key)
+            if key in model:
+                model.move_to_end(key)
+        else:
+            cache.put(key, step)
+            model.pop(key, None)
+            if len(model) == 5:
+                model.popitem(last=False)
+            model[key] = step
+        assert cache.keys() == list(reversed(model))
+    assert len(cache) == len(model)
+
+
+def test_lfu_evicts_the_least_frequent_then_least_recent():
+    rng = random.Random(13)
+    cache = LFUCache(capacity=4)
+    model = {}
+    for tick in range(2000):
+        key = rng.randrange(8)
+        if rng.random() < 0.6:
+            assert cache.get(key) == (model[key][0] if key in model else None)
+            if key in model:
+                value, freq, _ = model[key]
+                model[key] = (value, freq + 1, tick)
+        else:
+            if key in model:
+                model[key] = (tick, model[key][1] + 1, tick)
+            else:
+                if len(model) == 4:
+                    victim = min(model, key=lambda k: (model[k][1], model[k][2]))
+                    del model[victim]
+                model[key] = (tick, 1, tick)
+            cache.put(key, tick)
+        assert {k: cache.frequency(k) for k in model} == {k: v[1] for k, v in model.items()}
+        assert set(model) == {k for k in range(8) if k in cache}
+
+
+@pytest.mark.parametrize("cls", [LRUCache, LFUCache])
+def test_weights_counters_and_callbacks(cls):
+    evicted = []
+    cache = cls(capacity=None, max_weight=10, weigh=len,
+                on_evict=lambda key, value: evicted.append(key))
+    cache.put("a", "xxxx")
+    cache.put("b", "xxxx")
+    cache.get("a")
+    cache.put("c", "xxxx")
+    assert evicted == ["b"]
+    assert cache.weight == 8
+    assert cache.stats() == {"size": 2, "weight": 8, "hits": 1, "misses": 0, "evictions": 1}
+    assert cache.get("b", "gone") == "gone"
+    assert cache.peek("a") == "xxxx"
+    assert cache.pop("a") == "xxxx"
+    assert cache.pop("a", None) is None
+    with pytest.raises(KeyError):
+        cache.pop("a")
+    with pytest.raises(ValueError):
+        cache.put("d", "x" * 11)
+    assert evicted == ["b"]
+    cache.clear()
+    assert len(cache) == 0 and cache.weight == 0
+    cache.put("e", "x")
+    assert "e" in cache
+    with pytest.raises(ValueError):
+        cls(capacity=-1)
+
+
+def test_memoize():
+    calls = []
+
+    @memoize(LRUCache(capacity=2))
+    def square(x, offset=0):
+        calls.append(x)
+        return x * x + offset
+
+    assert [square(2), square(2), square(2, offset=1), square(3)] == [4, 4, 5, 9]
+    assert calls == [2, 2, 3]
+    assert square.cache.stats()["hits"] == 1
@@ -0,0 +1,79 @@
+import threading
+from collections import deque
+
+import pytest
+
+from linkedlist.concurrent import (ConcurrentCircularDoubleLinkedList,
+                                   ConcurrentDoubleLinkedList)
+
+
+def assert_linked(lst):
+    cur = lst._front
+    while cur is not lst._back:
+        assert cur.next.prev is cur
+        cur = cur.next
+
+
+@pytest.mark.parametrize("cls", [ConcurrentDoubleLinkedList, ConcurrentCircularDoubleLinkedList])
+def test_ends_and_positions(cls):
+    lst = cls.from_iterable([1, 2, 3])
+    lst.insert_at_beginning(0)
+    lst.insert_at_position(9, 2)
+    assert lst.snapshot() == [0, 1, 9, 2, 3]
+    assert lst.pop_left() == 0
+    assert lst.pop_right() == 3
+    lst.delete(1)
+    assert lst.snapshot() == [1, 2]
+    assert lst.size == 2
+    with pytest.raises(ValueError):
+        lst.delete(5)
+    assert_linked(lst)
+
+
+def test_ring_is_closed_through_the_sentinels():
+    ring = ConcurrentCircularDoubleLinkedList.from_iterable([1, 2])
+    assert ring._back.next is ring._front
+    assert ring._front.prev is ring._back
+    assert ring.display() == "1 <-> 2 <-> (back to head)"
+
+
+@pytest.mark.parametrize("n", range(5))
+def test_rotate_matches_deque(n):
+    for k in range(-7, 8):
+        ring = ConcurrentCircularDoubleLinkedList.from_iterable(range(n))
+        expected = deque(range(n))
+        ring.rotate(k)
+        expected.rotate(k)
+        assert ring.snapshot() == list(expected)
+        assert_linked(ring)
+
+
+def test_snapshot_wraps_from_start():
+    ring = ConcurrentCircularDoubleLinkedList.from_iterable(range(5))
+    assert ring.snapshot(3) == [3, 4, 0, 1, 2]
+    assert ring.snapshot(5) == [0, 1, 2, 3, 4]
+    with pytest.raises(ValueError):
+        ring.snapshot(-1)
+
+
+def test_rotate_is_safe_alongside_pushes_and_pops():
+    ring = ConcurrentCircularDoubleLinkedList.from_iterable(range(100))
+
+    def rotate():
+        for step in (1, -1, 2, -3) * 500:
+            ring.rotate(step)
+
+    def churn():
+        for i in range(1000):
+            ring.insert_at_end(i)
+            ring.pop_left()
+            ring.insert_at_beginning(i)
+            ring.pop_right()
+
+    threads = [threading.Thread(target=fn) for fn in (rotate, rotate, churn, churn)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert ring.size == len(ring.snapshot()) == 100
+    assert_linked(ring)
@@ -0,0 +1,59 @@
+import random
+
+import pytest
+
+from linkedlist import (CircularDoubleLinkedList, CircularLinkedList,
+                        DoubleLinkedList, SingleLinkedList)
+from linkedlist.instrument import instrument, uninstrument
+
+CLASSES = [SingleLinkedList, DoubleLinkedList, CircularLinkedList, CircularDoubleLinkedList]
+
+
+@pytest.mark.parametrize("cls", CLASSES)
+def test_positional_ops_match_a_list(cls):
+    rng = random.Random(2)
+    lst = cls.from_range(20)
+    expected = list(range(20))
+    for step in range(500):
+        op = rng.randrange(4)
+        if op == 0 or not expected:
+            pos = rng.randrange(len(expected) + 1)
+            lst.insert_at_position(step, pos)
+            expected.insert(pos, step)
+        elif op == 1:
+            pos = rng.randrange(len(expected))
+            lst.delete(pos)
+            del expected[pos]
+        elif op == 2:
+            pos = rng.randrange(len(expected))
+            lst.update(pos, -step)
+            expected[pos] = -step
+        else:
+            pos = rng.randrange(len(expected))
+            assert lst.show_val(pos) == expected[pos]
+    assert list(lst) == expected
+
+
+@pytest.mark.parametrize("cls", CLASSES)
+def test_sequential_access_is_amortized(cls):
+    lst = cls.from_range(1000)
+    probe = instrument(lst)
+    try:
+        for pos in range(1000):
+            assert lst.show_val(pos) == pos
+        assert probe.stats()["show_val"]["hops"] < 3000
+    finally:
+        uninstrument(lst)
+
+
+@pytest.mark.parametrize("cls", [DoubleLinkedList, CircularDoubleLinkedList])
+def test_doubly_linked_lists_walk_from_the_nearest_end(cls):
+    lst = cls.from_range(1000)
+    probe = instrument(lst)
+    try:
+        assert lst.show_val(990) == 990
+        lst.delete(995)
+        assert probe.stats()["show_val"]["max_hops"] <= 10
+        assert probe.stats()["delete"]["max_hops"] <= 10
+    finally:
+        uninstrument(lst)
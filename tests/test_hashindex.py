@@ -0,0 +1,55 @@
+import pytest
+
+from linkedlist import (CircularDoubleLinkedList, CircularLinkedList,
+                        DoubleLinkedList, SingleLinkedList)
+
+CLASSES = [SingleLinkedList, DoubleLinkedList, CircularLinkedList, CircularDoubleLinkedList]
+
+
+def assert_buckets_in_list_order(lst):
+    expected = {}
+    cur = lst.head
+    for _ in range(lst.size):
+        expected.setdefault(lst._index._key(cur.data), []).append(cur)
+        cur = cur.next
+    assert expected.keys() == lst._index.buckets.keys()
+    for k, nodes in expected.items():
+        assert all(a is b for a, b in zip(nodes, lst._index.buckets[k]))
+
+
+@pytest.mark.parametrize("cls", CLASSES)
+def test_middle_inserts_and_updates_keep_bucket_order(cls):
+    lst = cls.from_iterable([1, 2, 1, 3, 1, 2], indexed=True)
+    lst.insert_at_position(1, 2)
+    lst.update(4, 2)
+    lst.insert_at_position(2, 7)
+    assert list(lst) == [1, 2, 1, 1, 2, 1, 2, 2]
+    assert_buckets_in_list_order(lst)
+    lst.remove(1)
+    assert lst.find(1) == 1
+    assert lst.find(2) == 0
+
+
+@pytest.mark.parametrize("cls", CLASSES)
+def test_spliced_run_lands_between_its_neighbours(cls):
+    lst = cls.from_iterable([5, 0, 5, 0, 5], indexed=True)
+    lst.splice(3, cls.from_iterable([5, 9, 0]))
+    assert list(lst) == [5, 0, 5, 5, 9, 0, 0, 5]
+    assert_buckets_in_list_order(lst)
+    assert lst.find(9) == 4
+
+
+@pytest.mark.parametrize("cls", CLASSES)
+def test_key_function_groups_payloads(cls):
+    lst = cls.from_iterable(["apple", "bob", "avocado"], indexed=True, key=len)
+    assert lst.find("xyz") == 1
+    assert "kiwi" not in lst
+    lst.insert_at_position("cat", 1)
+    assert lst.find("xyz") == 1
+    assert_buckets_in_list_order(lst)
+
+
+@pytest.mark.parametrize("cls", CLASSES)
+def test_key_without_index_is_rejected(cls):
+    with pytest.raises(ValueError):
+        cls(key=len)
@@ -0,0 +1,79 @@
+import pytest
+
+from linkedlist import CircularLinkedList, DoubleLinkedList, SingleLinkedList
+from linkedlist.instrument import instrument, uninstrument
+
+
+@pytest.fixture
+def probed():
+    lst = DoubleLinkedList.from_range(100)
+    probe = instrument(lst)
+    yield lst, probe
+    uninstrument(lst)
+
+
+def test_counts_calls_and_hops(probed):
+    lst, probe = probed
+    lst.show_val(10)
+    lst.insert_at_end(1)
+    stats = probe.stats()
+    assert stats["show_val"]["calls"] == 1
+    assert stats["show_val"]["hops"] >= 10
+    assert stats["insert_at_end"]["hops"] < 5
+
+
+def test_only_the_outermost_call_is_recorded(probed):
+    lst, probe = probed
+    lst.delete(0)
+    assert set(probe.stats()) == {"delete"}
+
+
+def test_failed_calls_are_recorded(probed):
+    lst, probe = probed
+    with pytest.raises(ValueError):
+        lst.show_val(500)
+    assert probe.stats()["show_val"]["calls"] == 1
+
+
+def test_lazy_results_are_credited_with_their_walk(probed):
+    lst, probe = probed
+    assert sum(lst) == 4950
+    assert list(reversed(lst))[0] == 99
+    assert lst.stream().filter(lambda x: x > 90).collect(list) == list(range(91, 100))
+    stats = probe.stats()
+    for name in ("__iter__", "__reversed__", "stream"):
+        assert stats[name]["calls"] == 1
+        assert stats[name]["hops"] >= 99
+
+
+def test_hooks_fire_for_long_walks(probed):
+    lst, probe = probed
+    seen = []
+    probe.add_hook(50, lambda lst, method, hops, seconds: seen.append(method))
+    lst.show_val(1)
+    list(lst)
+    lst.find(-1)
+    assert seen == ["__iter__", "find"]
+
+
+def test_stride_is_recorded_after_iteration():
+    ring = CircularLinkedList.from_range(30)
+    probe = instrument(ring)
+    try:
+        values = ring.stride(3)
+        assert "stride" not in probe.stats()
+        assert list(values) == list(range(0, 30, 3))
+        assert probe.stats()["stride"]["hops"] >= 29
+    finally:
+        uninstrument(ring)
+
+
+def test_uninstrument_restores_the_classes():
+    lst = SingleLinkedList.from_range(3)
+    original = SingleLinkedList.__iter__
+    instrument(lst)
+    assert SingleLinkedList.__iter__ is not original
+    uninstrument(lst)
+    assert SingleLinkedList.__iter__ is original
+    with pytest.raises(ValueError):
+        uninstrument(lst)
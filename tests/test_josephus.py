@@ -0,0 +1,80 @@
+import pytest
+
+from linkedlist import CircularDoubleLinkedList, CircularLinkedList
+
+CLASSES = [CircularLinkedList, CircularDoubleLinkedList]
+OPTIONS = [{}, {"indexed": True}, {"pool": 4}]
+
+
+def josephus(values, k, count):
+    """Return (removed, remaining from the next count's start) the slow way."""
+    values = list(values)
+    removed = []
+    idx = 0
+    for _ in range(count):
+        idx = (idx + k - 1) % len(values)
+        removed.append(values.pop(idx))
+    if values:
+        idx %= len(values)
+    return removed, values[idx:] + values[:idx]
+
+
+def check_ring(lst, expected):
+    assert list(lst) == expected
+    assert lst.size == len(expected)
+    if expected:
+        assert lst.tail.next is lst.head
+        assert lst.show_val(len(expected) - 1) == expected[-1]
+        if hasattr(lst.head, "prev"):
+            assert lst.head.prev is lst.tail
+            assert list(reversed(lst)) == expected[::-1]
+        for value in expected:
+            assert lst.find(value) == expected.index(value)
+
+
+@pytest.mark.parametrize("cls", CLASSES)
+@pytest.mark.parametrize("options", OPTIONS)
+def test_eliminate_every_matches_josephus(cls, options):
+    for n in range(7):
+        for k in range(1, 9):
+            for count in {0, n // 2, n}:
+                lst = cls.from_range(n, **options)
+                removed, remaining = josephus(range(n), k, count)
+                assert lst.eliminate_every(k, count) == removed
+                check_ring(lst, remaining)
+
+
+def test_eliminate_every_carries_on():
+    lst = CircularLinkedList.from_range(10)
+    first = lst.eliminate_every(3, 4)
+    assert first + lst.eliminate_every(3) == josephus(range(10), 3, 10)[0]
+
+
+@pytest.mark.parametrize("cls", CLASSES)
+@pytest.mark.parametrize("options", OPTIONS)
+def test_stride_and_take_every(cls, options):
+    for n in range(7):
+        for k in range(1, 5):
+            for start in range(n + 1):
+                values = list(range(n))
+                wrapped = values[start:] + values[:start]
+                lst = cls.from_iterable(values, **options)
+                assert lst.stride(k, start).collect(list) == wrapped[::k]
+                part = lst.take_every(k, start)
+                check_ring(part, wrapped[::k])
+                taken = set(wrapped[::k])
+                check_ring(lst, [v for v in values if v not in taken])
+
+
+@pytest.mark.parametrize("cls", CLASSES)
+def test_bad_arguments(cls):
+    lst = cls.from_range(3)
+    with pytest.raises(ValueError):
+        lst.eliminate_every(0)
+    with pytest.raises(ValueError):
+        lst.eliminate_every(2, 4)
+    with pytest.raises(ValueError):
+        lst.stride(0)
+    with pytest.raises(ValueError):
+        lst.take_every(1, 4)
+    check_ring(lst, [0, 1, 2])
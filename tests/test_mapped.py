@@ -0,0 +1,113 @@
+import json
+import os
+
+import pytest
+
+from linkedlist import MappedLinkedList
+
+
+class JSONBytes:
+    """A serializer that only ever builds plain data."""
+
+    @staticmethod
+    def dumps(data):
+        return json.dumps(data).encode()
+
+    @staticmethod
+    def loads(blob):
+        return json.loads(bytes(blob))
+
+
+def test_reopen_keeps_the_list(tmp_path):
+    path = str(tmp_path / "list.bin")
+    with MappedLinkedList(path, capacity=2) as lst:
+        lst.extend(range(10))
+        lst.insert_at_position("x" * 100, 3)
+        lst.delete(0)
+        lst.reverse()
+    with MappedLinkedList(path) as lst:
+        assert list(lst) == list(reversed([1, 2, "x" * 100] + list(range(3, 10))))
+
+
+def test_header_is_current_without_flush(tmp_path):
+    path = str(tmp_path / "list.bin")
+    lst = MappedLinkedList(path)
+    lst.extend(range(5))
+    lst.insert_at_beginning(-1)
+    lst.del_at_end()
+    lst.update(2, "y" * 100)
+    # A second mapping sees what a reopen after a crash would see.
+    other = MappedLinkedList(path)
+    assert other.size == 5
+    assert list(other) == [-1, 0, "y" * 100, 2, 3]
+    assert other.show_val(4) == 3
+    other._map.close()
+    other._file.close()
+    lst.close()
+
+
+def test_compact_reclaims_dead_blobs(tmp_path):
+    path = str(tmp_path / "list.bin")
+    lst = MappedLinkedList(path)
+    lst.extend("a" * 200 + str(i) for i in range(50))
+    for _ in range(40):
+        lst.del_at_start()
+    lst.update(0, "b" * 300)
+    assert lst.garbage > 0
+    before = os.path.getsize(path)
+    expected = list(lst)
+    lst.compact()
+    assert lst.garbage == 0
+    assert os.path.getsize(path) < before
+    assert list(lst) == expected
+    assert not os.path.exists(path + ".compact")
+    lst.insert_at_end("c" * 200)
+    lst.insert_at_beginning(1)
+    lst.close()
+    with MappedLinkedList(path) as lst:
+        assert list(lst) == [1] + expected + ["c" * 200]
+
+
+def test_compact_empty_list(tmp_path):
+    path = str(tmp_path / "list.bin")
+    with MappedLinkedList(path) as lst:
+        lst.extend(range(3))
+        while lst.size:
+            lst.del_at_end()
+        lst.compact()
+        assert lst.is_empty()
+        lst.insert_at_end(7)
+    with MappedLinkedList(path) as lst:
+        assert list(lst) == [7]
+
+
+def test_custom_serializer(tmp_path):
+    path = str(tmp_path / "list.bin")
+    with MappedLinkedList(path, serializer=JSONBytes) as lst:
+        lst.extend([{"a": 1}, [1, 2], "z" * 50])
+    with open(path, "rb") as f:
+        assert b'{"a": 1}' in f.read()
+    with MappedLinkedList(path, serializer=JSONBytes) as lst:
+        assert list(lst) == [{"a": 1}, [1, 2], "z" * 50]
+
+
+def test_failed_serialization_changes_nothing(tmp_path):
+    path = str(tmp_path / "list.bin")
+    with MappedLinkedList(path, serializer=JSONBytes) as lst:
+        lst.extend([1, 2])
+        lst.delete(0)
+        free = lst._free
+        with pytest.raises(TypeError):
+            lst.insert_at_end(object())
+        with pytest.raises(TypeError):
+            lst.update(0, object())
+        assert lst._free == free
+        assert list(lst) == [2]
+        assert lst.garbage == 0
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"not a list" * 10)
+    with pytest.raises(ValueError):
+        MappedLinkedList(str(path))
@@ -0,0 +1,111 @@
+import random
+from operator import itemgetter
+
+import pytest
+
+from linkedlist import (CircularLinkedList, DoubleLinkedList, SingleLinkedList,
+                        imerge, merge_sorted)
+
+CLASSES = [SingleLinkedList, DoubleLinkedList]
+first = itemgetter(0)
+
+
+def sorted_inputs(rng, cls, k):
+    runs = [sorted(((rng.randrange(6), (order, i)) for i in range(rng.randrange(6))), key=first)
+            for order in range(k)]
+    return runs, [cls.from_iterable(run) for run in runs]
+
+
+def _nodes(lst):
+    cur = lst.head
+    while cur is not None:
+        yield cur
+        cur = cur.next
+
+
+@pytest.mark.parametrize("cls", CLASSES)
+def test_merge_sorted_is_stable_and_relinks(cls):
+    rng = random.Random(25)
+    for _ in range(100):
+        runs, lists = sorted_inputs(rng, cls, rng.randrange(1, 5))
+        nodes = {id(node) for lst in lists for node in _nodes(lst)}
+        merged = merge_sorted(*lists, key=first)
+        expected = sorted((pair for run in runs for pair in run), key=first)
+        assert list(merged) == expected
+        assert merged.size == len(expected)
+        assert {id(node) for node in _nodes(merged)} == nodes
+        if expected:
+            assert merged.tail.data == expected[-1] and merged.tail.next is None
+        if cls is DoubleLinkedList:
+            assert list(reversed(merged)) == expected[::-1]
+        assert all(lst.size == 0 and lst.head is None for lst in lists)
+        merged.insert_at_end((9, None))
+        assert merged.show_val(len(expected)) == (9, None)
+
+
+def test_merge_keeps_options_and_handles_reversed_inputs():
+    a = DoubleLinkedList.from_iterable([5, 3, 1], indexed=True)
+    a.reverse()
+    b = DoubleLinkedList.from_iterable([2, 4, 6], indexed=True)
+    merged = merge_sorted(a, b)
+    assert list(merged) == [1, 2, 3, 4, 5, 6]
+    assert merged._index is not None and merged.find(4) == 3
+    merged.remove(3)
+    assert list(merged) == [1, 2, 4, 5, 6]
+
+
+@pytest.mark.parametrize("cls", CLASSES)
+def test_imerge_takes_items_off_the_inputs(cls):
+    rng = random.Random(26)
+    for _ in range(60):
+        runs, lists = sorted_inputs(rng, cls, rng.randrange(1, 4))
+        expected = sorted((pair for run in runs for pair in run), key=first)
+        stop = rng.randrange(len(expected) + 1)
+        taken = imerge(*lists, key=first).take(stop).collect(list)
+        assert taken == expected[:stop]
+        assert sorted(pair for lst in lists for pair in lst) == sorted(expected[stop:])
+        assert sum(lst.size for lst in lists) == len(expected) - stop
+
+
+def test_bad_inputs():
+    a = SingleLinkedList.from_range(2)
+    with pytest.raises(ValueError):
+        merge_sorted()
+    with pytest.raises(ValueError):
+        merge_sorted(a, a)
+    with pytest.raises(TypeError):
+        merge_sorted(a, DoubleLinkedList.from_range(2))
+    with pytest.raises(TypeError):
+        imerge(CircularLinkedList.from_range(2))
+    assert list(a) == [0, 1]
+
+
+@pytest.mark.parametrize("cls", CLASSES)
+def test_incomparable_heads_leave_the_inputs_alone(cls):
+    a = cls.from_iterable(["a", "b"], indexed=True)
+    b = cls.from_iterable([1, 2])
+    with pytest.raises(TypeError):
+        merge_sorted(a, b)
+    assert list(a) == ["a", "b"] and list(b) == [1, 2]
+    assert a.find("b") == 1
+
+
+@pytest.mark.parametrize("cls", CLASSES)
+def test_failed_merge_gives_the_nodes_back(cls):
+    a = cls.from_iterable([1, "a", 5], indexed=True)
+    b = cls.from_iterable([2, 3])
+    c = cls.from_iterable([0, 4, 6])
+    nodes = {id(node) for lst in (a, b, c) for node in _nodes(lst)}
+    with pytest.raises(TypeError):
+        merge_sorted(a, b, c)
+    assert list(a) == [0, 1, "a", 5]
+    assert list(b) == [2, 3] and list(c) == [4, 6]
+    assert {id(node) for lst in (a, b, c) for node in _nodes(lst)} == nodes
+    for lst in (a, b, c):
+        assert lst.size == len(list(lst))
+        assert lst.tail.data == list(lst)[-1] and lst.tail.next is None
+        if cls is DoubleLinkedList:
+            assert list(reversed(lst)) == list(lst)[::-1]
+    assert a.find("a") == 2
+    a.remove("a")
+    assert list(merge_sorted(a, b, c)) == [0, 1, 2, 3, 4, 5, 6]
@@ -0,0 +1,52 @@
+import os
+import subprocess
+import sys
+from importlib import import_module
+
+import pytest
+
+import linkedlist
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def loaded_after(code):
+    """Return the linkedlist and heavy stdlib modules loaded by code in a fresh interpreter."""
+    probe = (f"import sys\n{code}\n"
+             "print(' '.join(sorted(m for m in sys.modules if m.startswith('linkedlist')"
+             " or m in ('asyncio', 'importlib', 'mmap', 'numpy', 'threading',"
+             " 'pickle'))))")
+    out = subprocess.run([sys.executable, "-c", probe], cwd=ROOT, check=True,
+                         capture_output=True, text=True).stdout
+    return set(out.split())
+
+
+def test_bare_import_loads_no_submodule():
+    assert loaded_after("import linkedlist") == {"linkedlist"}
+
+
+def test_core_list_import_stays_light():
+    modules = loaded_after("from linkedlist import SingleLinkedList")
+    assert "linkedlist.SLL" in modules
+    assert not modules & {"asyncio", "importlib", "mmap", "numpy", "threading",
+                          "linkedlist.asyncqueue", "linkedlist.mapped", "linkedlist.typed",
+                          "linkedlist.concurrent"}
+
+
+@pytest.mark.parametrize("name", linkedlist.__all__)
+def test_every_export_resolves_to_its_module(name):
+    module = import_module(f"linkedlist.{linkedlist._EXPORTS[name]}")
+    assert getattr(linkedlist, name) is getattr(module, name)
+    assert name in dir(linkedlist)
+
+
+def test_core_classes_live_in_their_own_modules():
+    assert linkedlist.DoubleLinkedList.__module__ == "linkedlist.DLL"
+    assert linkedlist.CircularDoubleLinkedList.__module__ == "linkedlist.DCLL"
+
+
+def test_unknown_names_raise_attribute_error():
+    with pytest.raises(AttributeError):
+        linkedlist.NoSuchList
+    with pytest.raises(ImportError):
+        exec("from linkedlist import NoSuchList")
@@ -0,0 +1,77 @@
+import copy
+import pickle
+
+import pytest
+
+from linkedlist import (CircularDoubleLinkedList, CircularLinkedList,
+                        DoubleLinkedList, SingleLinkedList)
+
+CLASSES = [SingleLinkedList, DoubleLinkedList, CircularLinkedList, CircularDoubleLinkedList]
+PAYLOADS = [[], [1, 2, 3], [0.5, -1.0], [2 ** 70, 1], [1, "a", (2,)], [True, 1]]
+
+
+@pytest.mark.parametrize("cls", CLASSES)
+@pytest.mark.parametrize("payload", PAYLOADS)
+@pytest.mark.parametrize("protocol", [2, 4, 5])
+def test_round_trip(cls, payload, protocol):
+    lst = cls.from_iterable(payload)
+    clone = pickle.loads(pickle.dumps(lst, protocol))
+    assert type(clone) is cls
+    assert list(clone) == payload
+    assert [type(value) for value in clone] == [type(value) for value in payload]
+    clone.insert_at_end(9)
+    assert clone.show_val(clone.size - 1) == 9
+
+
+@pytest.mark.parametrize("cls", CLASSES)
+def test_long_lists_do_not_recurse(cls):
+    lst = cls.from_range(20_000)
+    assert list(pickle.loads(pickle.dumps(lst))) == list(range(20_000))
+    assert list(copy.deepcopy(lst)) == list(range(20_000))
+
+
+def test_numeric_payloads_go_out_of_band():
+    lst = DoubleLinkedList.from_range(1000)
+    buffers = []
+    data = pickle.dumps(lst, 5, buffer_callback=buffers.append)
+    assert len(buffers) == 1
+    assert len(data) < 1000
+    assert list(pickle.loads(data, buffers=buffers)) == list(range(1000))
+
+
+def test_options_are_kept_and_the_pool_is_not():
+    lst = SingleLinkedList.from_iterable([3, 1, 3], skiplist=True, indexed=True, pool=4)
+    clone = pickle.loads(pickle.dumps(lst))
+    assert clone._skip is not None and clone._index is not None
+    assert clone._pool is None
+    clone.remove(3)
+    assert list(clone) == [1, 3]
+
+
+@pytest.mark.parametrize("cls", [DoubleLinkedList, CircularDoubleLinkedList])
+def test_reversed_lists_keep_their_order(cls):
+    lst = cls.from_range(5)
+    lst.reverse()
+    assert list(pickle.loads(pickle.dumps(lst))) == [4, 3, 2, 1, 0]
+    assert list(copy.copy(lst)) == [4, 3, 2, 1, 0]
+
+
+@pytest.mark.parametrize("cls", CLASSES)
+def test_copy_shares_and_deepcopy_copies_payloads(cls):
+    inner = [1]
+    lst = cls.from_iterable([inner, inner], indexed=True, key=len)
+    shallow = copy.copy(lst)
+    deep = copy.deepcopy(lst)
+    assert shallow.head.data is inner
+    assert deep.head.data == inner and deep.head.data is not inner
+    assert deep.tail.data is deep.head.data
+    assert deep._index is not None and deep.find([1]) == 0
+    lst.insert_at_end([2])
+    assert shallow.size == deep.size == 2
+
+
+def test_deepcopy_of_a_list_that_holds_itself():
+    lst = DoubleLinkedList.from_range(2)
+    lst.insert_at_end(lst)
+    clone = copy.deepcopy(lst)
+    assert clone.tail.data is clone
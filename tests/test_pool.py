@@ -0,0 +1,68 @@
+import gc
+import weakref
+
+import pytest
+
+from linkedlist import (CircularDoubleLinkedList, CircularLinkedList,
+                        DoubleLinkedList, NodePool, SingleLinkedList)
+from linkedlist.node import DLLNode, SLLNode
+
+CLASSES = [SingleLinkedList, DoubleLinkedList, CircularLinkedList, CircularDoubleLinkedList]
+
+
+class Payload:
+    pass
+
+
+@pytest.mark.parametrize("cls", CLASSES)
+def test_unlinked_nodes_are_reused(cls):
+    lst = cls.from_range(4, pool=8)
+    pool = lst._pool
+    first, last = lst.head, lst.tail
+    lst.del_at_start()
+    lst.delete(1)
+    lst.remove(3)
+    assert len(pool) == 3
+    assert first.data is None and first.next is None
+    lst.insert_at_end(7)
+    assert pool.stats()["hits"] == 1
+    assert lst.tail is last
+    lst.extend([8, 9])
+    assert len(pool) == 0
+    assert list(lst) == [1, 7, 8, 9]
+
+
+@pytest.mark.parametrize("cls", CLASSES)
+def test_released_nodes_drop_their_payload(cls):
+    payload = Payload()
+    ref = weakref.ref(payload)
+    lst = cls.from_iterable([payload, 1], pool=4)
+    del payload
+    lst.del_at_start()
+    gc.collect()
+    assert ref() is None
+
+
+def test_capacity_bounds_the_pool():
+    pool = NodePool(SLLNode, capacity=2)
+    lst = SingleLinkedList.from_range(5, pool=pool)
+    while lst.size:
+        lst.del_at_end()
+    assert pool.stats() == {"pooled": 2, "capacity": 2, "hits": 0, "misses": 5, "dropped": 3}
+    pool.reset_stats()
+    pool.clear()
+    assert len(pool) == 0 and pool.hits == pool.misses == pool.dropped == 0
+
+
+def test_a_pool_is_shared_and_typed():
+    pool = NodePool(DLLNode)
+    first = DoubleLinkedList.from_range(3, pool=pool)
+    second = CircularDoubleLinkedList(pool=pool)
+    first.del_at_end()
+    second.insert_at_end("x")
+    assert pool.hits == 1
+    assert list(first) == [0, 1] and list(second) == ["x"]
+    with pytest.raises(ValueError):
+        SingleLinkedList(pool=pool)
+    with pytest.raises(ValueError):
+        NodePool(SLLNode, capacity=-1)
@@ -0,0 +1,79 @@
+import pytest
+
+from linkedlist import CircularDoubleLinkedList, DoubleLinkedList
+from linkedlist.node import DLLNode
+
+CLASSES = [DoubleLinkedList, CircularDoubleLinkedList]
+
+
+def assert_holds(lst, expected):
+    assert list(lst) == expected
+    assert list(reversed(lst)) == expected[::-1]
+    assert lst.size == len(expected)
+
+
+@pytest.mark.parametrize("cls", CLASSES)
+def test_reverse_is_lazy_and_mirrors_operations(cls):
+    lst = cls.from_range(6)
+    lst.reverse()
+    assert lst._flipped
+    lst.insert_at_beginning(9)
+    lst.insert_at_position(7, 3)
+    lst.delete(1)
+    lst.del_at_end()
+    assert_holds(lst, [9, 4, 7, 3, 2, 1])
+    assert lst.show_val(1) == 4
+    lst.materialize()
+    assert not lst._flipped
+    assert_holds(lst, [9, 4, 7, 3, 2, 1])
+
+
+@pytest.mark.parametrize("cls", CLASSES)
+def test_concat_keeps_a_shared_orientation(cls):
+    left = cls.from_range(4)
+    right = cls.from_range(4, 7)
+    left.reverse()
+    right.reverse()
+    left.concat(right)
+    assert left._flipped
+    assert_holds(left, [3, 2, 1, 0, 6, 5, 4])
+    assert_holds(right, [])
+
+
+@pytest.mark.parametrize("cls", CLASSES)
+@pytest.mark.parametrize("position", range(5))
+def test_splice_across_orientations(cls, position):
+    for flip_self in (False, True):
+        for flip_other in (False, True):
+            lst = cls.from_range(4)
+            other = cls.from_range(10, 13)
+            expected = list(range(4))
+            inserted = [10, 11, 12]
+            if flip_self:
+                lst.reverse()
+                expected.reverse()
+            if flip_other:
+                other.reverse()
+                inserted.reverse()
+            lst.splice(position, other)
+            assert_holds(lst, expected[:position] + inserted + expected[position:])
+            assert_holds(other, [])
+
+
+def test_splice_into_indexed_list_rewrites_the_other_side():
+    lst = DoubleLinkedList.from_range(3, indexed=True)
+    other = DoubleLinkedList.from_range(3, 9)
+    other.reverse()
+    lst.concat(other)
+    assert not lst._flipped
+    assert_holds(lst, [0, 1, 2, 8, 7, 6, 5, 4, 3])
+    assert lst.find(6) == 5
+
+
+def test_push_front_and_back_on_a_reversed_list():
+    lst = DoubleLinkedList.from_range(3)
+    lst.reverse()
+    lst._push_front(DLLNode(9))
+    lst._push_back(DLLNode(-1))
+    assert lst._flipped
+    assert_holds(lst, [9, 2, 1, 0, -1])
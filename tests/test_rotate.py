@@ -0,0 +1,78 @@
+from collections import deque
+
+import pytest
+
+from linkedlist import CircularDoubleLinkedList, CircularLinkedList, HashIndex, RoundRobin
+
+CLASSES = [CircularLinkedList, CircularDoubleLinkedList]
+
+
+@pytest.mark.parametrize("cls", CLASSES)
+@pytest.mark.parametrize("options", [{}, {"indexed": True}, {"pool": 4}])
+def test_rotate_matches_deque(cls, options):
+    for n in range(5):
+        for k in range(-6, 7):
+            lst = cls.from_iterable([i % 3 for i in range(n)], **options)
+            expected = deque(lst)
+            lst.rotate(k)
+            expected.rotate(k)
+            assert list(lst) == list(expected)
+            if n:
+                assert lst.tail.next is lst.head
+                assert lst.show_val(n - 1) == expected[-1]
+            if lst._index is not None:
+                for value in set(expected):
+                    assert lst.find(value) == list(expected).index(value)
+
+
+@pytest.mark.parametrize("cls", CLASSES)
+def test_rotate_reorders_the_index_without_rebuilding(cls, monkeypatch):
+    lst = cls.from_iterable([1, 2, 1, 3, 2, 1], indexed=True)
+
+    def fail(index):
+        raise AssertionError("rebuilt")
+
+    monkeypatch.setattr(HashIndex, "rebuild", fail)
+    lst.rotate(2)
+    lst.rotate(-3)
+    assert list(lst) == [2, 1, 3, 2, 1, 1]
+    lst.remove(1)
+    assert list(lst) == [2, 3, 2, 1, 1]
+
+
+def test_rotate_on_a_reversed_doubly_linked_ring():
+    lst = CircularDoubleLinkedList.from_range(5)
+    lst.reverse()
+    lst.rotate(1)
+    assert list(lst) == [0, 4, 3, 2, 1]
+
+
+def test_round_robin_weighted_turns():
+    rr = RoundRobin("ab")
+    rr.add("c", weight=2)
+    assert [rr.next() for _ in range(8)] == list("abccabcc")
+    assert rr.current == "c"
+
+
+def test_round_robin_removal():
+    rr = RoundRobin("abcd")
+    assert [rr.next() for _ in range(2)] == ["a", "b"]
+    assert rr.remove_current() == "b"
+    assert rr.current is None
+    assert rr.next() == "c"
+    rr.remove("a")
+    assert list(rr) == ["c", "d"]
+    assert "a" not in rr
+    assert [rr.next() for _ in range(3)] == ["d", "c", "d"]
+    with pytest.raises(ValueError):
+        rr.remove("z")
+
+
+def test_round_robin_rejects_bad_input():
+    rr = RoundRobin()
+    with pytest.raises(ValueError):
+        rr.next()
+    with pytest.raises(ValueError):
+        rr.remove_current()
+    with pytest.raises(ValueError):
+        rr.add("a", weight=0)
@@ -0,0 +1,85 @@
+import random
+
+from linkedlist import SingleLinkedList
+from linkedlist.instrument import instrument, uninstrument
+
+
+def check_lanes(lst):
+    """Assert every lane hop lands on the chain node its span says."""
+    index = lst._skip
+    if not index.valid:
+        return
+    positions = {id(node): pos for pos, node in enumerate(_chain(lst))}
+    for head in index.heads:
+        pos = -1
+        lane = head
+        while lane.next is not None:
+            pos += lane.span
+            lane = lane.next
+            assert positions[id(lane.node)] == pos
+
+
+def _chain(lst):
+    cur = lst.head
+    while cur:
+        yield cur
+        cur = cur.next
+
+
+def test_lanes_follow_every_mutation():
+    rng = random.Random(3)
+    lst = SingleLinkedList.from_range(50, skiplist=True)
+    expected = list(range(50))
+    for step in range(400):
+        op = rng.randrange(9)
+        if op == 0:
+            pos = rng.randrange(len(expected) + 1)
+            lst.insert_at_position(step, pos)
+            expected.insert(pos, step)
+        elif op == 1 and expected:
+            pos = rng.randrange(len(expected))
+            lst.delete(pos)
+            del expected[pos]
+        elif op == 2:
+            lst.insert_at_beginning(step)
+            expected.insert(0, step)
+        elif op == 3 and expected:
+            lst.del_at_end()
+            expected.pop()
+        elif op == 4 and expected:
+            value = rng.choice(expected)
+            lst.remove(value)
+            expected.remove(value)
+        elif op == 5 and rng.random() < 0.1:
+            lst.reverse()
+            expected.reverse()
+        elif op == 6 and rng.random() < 0.1:
+            lst.sort()
+            expected.sort()
+        elif op == 7:
+            pos = rng.randrange(len(expected) + 1)
+            lst.insert_many([(pos, step), (pos, step + 1)])
+            expected[pos:pos] = [step, step + 1]
+        elif op == 8 and expected:
+            lst.insert_at_end(step)
+            expected.append(step)
+        if expected:
+            pos = rng.randrange(len(expected))
+            assert lst.show_val(pos) == expected[pos]
+        check_lanes(lst)
+    assert list(lst) == expected
+    assert lst.size == len(expected)
+
+
+def test_random_access_descends_the_lanes():
+    lst = SingleLinkedList.from_range(20000, skiplist=True)
+    lst.show_val(0)
+    rng = random.Random(4)
+    probe = instrument(lst)
+    try:
+        for _ in range(200):
+            pos = rng.randrange(20000)
+            assert lst.show_val(pos) == pos
+        assert probe.stats()["show_val"]["max_hops"] < 500
+    finally:
+        uninstrument(lst)
@@ -0,0 +1,74 @@
+import random
+
+import pytest
+
+from linkedlist import (CircularDoubleLinkedList, CircularLinkedList,
+                        DoubleLinkedList, SingleLinkedList)
+
+CLASSES = [SingleLinkedList, DoubleLinkedList, CircularLinkedList, CircularDoubleLinkedList]
+
+
+@pytest.mark.parametrize("cls", CLASSES)
+@pytest.mark.parametrize("options", [{}, {"indexed": True}])
+@pytest.mark.parametrize("reverse", [False, True])
+def test_sort_is_stable_and_matches_sorted(cls, options, reverse):
+    rng = random.Random(8)
+    for n in list(range(8)) + [100, 257]:
+        pairs = [(rng.randrange(5), i) for i in range(n)]
+        lst = cls.from_iterable(pairs, **options)
+        expected = sorted(pairs, key=lambda pair: pair[0], reverse=reverse)
+        lst.sort(key=lambda pair: pair[0], reverse=reverse)
+        assert list(lst) == expected
+        assert lst.size == n
+        if n:
+            assert lst.tail.data == expected[-1]
+            circular = cls in (CircularLinkedList, CircularDoubleLinkedList)
+            assert lst.tail.next is (lst.head if circular else None)
+            assert lst.show_val(n // 2) == expected[n // 2]
+            assert lst.find(expected[-1]) == n - 1
+        if hasattr(lst, "_flipped"):
+            assert list(reversed(lst)) == expected[::-1]
+        lst.insert_at_end(None)
+        assert list(lst) == expected + [None]
+
+
+@pytest.mark.parametrize("cls", CLASSES)
+def test_sort_relinks_the_same_nodes(cls):
+    lst = cls.from_iterable([3, 1, 2])
+    nodes = {}
+    cur = lst.head
+    for _ in range(3):
+        nodes[cur.data] = cur
+        cur = cur.next
+    lst.sort()
+    assert lst.head is nodes[1]
+    assert lst.tail is nodes[3]
+
+
+@pytest.mark.parametrize("cls", [DoubleLinkedList, CircularDoubleLinkedList])
+def test_sort_after_reverse(cls):
+    lst = cls.from_iterable([2, 5, 1, 4])
+    lst.reverse()
+    lst.sort()
+    assert list(lst) == [1, 2, 4, 5]
+    assert list(reversed(lst)) == [5, 4, 2, 1]
+
+
+@pytest.mark.parametrize("cls", CLASSES)
+@pytest.mark.parametrize("options", [{}, {"indexed": True}])
+def test_incomparable_payload_leaves_a_valid_list(cls, options):
+    payload = [5, 4, "a", 3, 2, 1, 0, 9]
+    lst = cls.from_iterable(payload, **options)
+    with pytest.raises(TypeError):
+        lst.sort()
+    assert sorted(lst, key=str) == sorted(payload, key=str)
+    assert lst.size == len(payload)
+    assert lst.tail.data == list(lst)[-1]
+    circular = cls in (CircularLinkedList, CircularDoubleLinkedList)
+    assert lst.tail.next is (lst.head if circular else None)
+    if hasattr(lst, "_flipped"):
+        assert list(reversed(lst)) == list(lst)[::-1]
+    assert lst.find("a") == list(lst).index("a")
+    lst.remove("a")
+    lst.sort(reverse=True)
+    assert list(lst) == [9, 5, 4, 3, 2, 1, 0]
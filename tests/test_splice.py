@@ -0,0 +1,91 @@
+import random
+
+import pytest
+
+from linkedlist import (CircularDoubleLinkedList, CircularLinkedList,
+                        DoubleLinkedList, SingleLinkedList)
+
+CLASSES = [SingleLinkedList, DoubleLinkedList, CircularLinkedList, CircularDoubleLinkedList]
+CASES = ([(cls, {}) for cls in CLASSES] + [(cls, {"indexed": True}) for cls in CLASSES]
+         + [(SingleLinkedList, {"skiplist": True})])
+
+
+def check(lst, expected):
+    """Assert lst holds expected with consistent size, ends and links."""
+    assert list(lst) == expected
+    assert lst.size == len(expected)
+    if expected:
+        assert (lst.head.data, lst.tail.data) == (expected[0], expected[-1])
+        circular = isinstance(lst, (CircularLinkedList, CircularDoubleLinkedList))
+        assert lst.tail.next is (lst.head if circular else None)
+        if hasattr(lst.head, "prev"):
+            assert list(reversed(lst)) == expected[::-1]
+        for pos, value in enumerate(expected):
+            assert lst.show_val(pos) == value
+            assert lst.find(value) == expected.index(value)
+    else:
+        assert lst.head is None and lst.tail is None
+
+
+def _nodes(lst):
+    cur = lst.head
+    for _ in range(lst.size):
+        yield cur
+        cur = cur.next
+
+
+@pytest.mark.parametrize("cls, options", CASES)
+def test_relinking_matches_a_list(cls, options):
+    rng = random.Random(7)
+    for _ in range(80):
+        values = [rng.randrange(100) for _ in range(rng.randrange(7))]
+        extra = [rng.randrange(100, 200) for _ in range(rng.randrange(4))]
+        lst = cls.from_iterable(values, **options)
+        other = cls.from_iterable(extra, **options)
+        nodes = {id(node) for node in _nodes(other)}
+        op = rng.randrange(4)
+        if op == 0:
+            pos = rng.randrange(len(values) + 1)
+            lst.splice(pos, other)
+            values[pos:pos] = extra
+            assert nodes <= {id(node) for node in _nodes(lst)}
+        elif op == 1:
+            lst.concat(other)
+            values += extra
+        elif op == 2:
+            start = rng.randrange(len(values) + 1)
+            stop = rng.randrange(start, len(values) + 1)
+            part = lst.cut(start, stop)
+            check(part, values[start:stop])
+            part.insert_at_end(-1)
+            del values[start:stop]
+        else:
+            pos = rng.randrange(len(values) + 1)
+            part = lst.split_at(pos)
+            check(part, values[pos:])
+            del values[pos:]
+        check(lst, values)
+        if op < 2:
+            check(other, [])
+            other.insert_at_end(1)
+            check(other, [1])
+        lst.insert_at_beginning(-2)
+        check(lst, [-2] + values)
+
+
+@pytest.mark.parametrize("cls", CLASSES)
+def test_bad_arguments(cls):
+    lst = cls.from_range(3)
+    with pytest.raises(TypeError):
+        lst.splice(0, [1])
+    with pytest.raises(ValueError):
+        lst.splice(0, lst)
+    with pytest.raises(ValueError):
+        lst.splice(4, cls.from_range(1))
+    with pytest.raises(ValueError):
+        lst.cut(2, 1)
+    with pytest.raises(ValueError):
+        lst.cut(0, 4)
+    with pytest.raises(ValueError):
+        lst.split_at(-1)
+    check(lst, [0, 1, 2])
@@ -0,0 +1,59 @@
+import pytest
+
+from linkedlist import (CircularDoubleLinkedList, CircularLinkedList,
+                        DoubleLinkedList, SingleLinkedList, Stream)
+
+LINEAR = [SingleLinkedList, DoubleLinkedList]
+CIRCULAR = [CircularLinkedList, CircularDoubleLinkedList]
+OPTIONS = [{}, {"indexed": True}, {"pool": 4}]
+
+
+@pytest.mark.parametrize("cls", LINEAR + CIRCULAR)
+@pytest.mark.parametrize("options", OPTIONS)
+@pytest.mark.parametrize("reverse", [False, True])
+def test_stream_from_every_start(cls, options, reverse):
+    for n in range(6):
+        lst = cls.from_range(n, **options)
+        expected = list(range(n))
+        if reverse and hasattr(lst, "reverse"):
+            lst.reverse()
+            expected.reverse()
+        for start in range(n + 1):
+            wrapped = expected[start:] + expected[:start]
+            assert list(lst.stream(start)) == (wrapped if cls in CIRCULAR else expected[start:])
+            assert list(Stream.of(lst, start)) == expected[start:]
+            assert list(Stream.of(lst, start, wrap=True)) == wrapped
+
+
+def test_stream_uses_the_skip_index():
+    lst = SingleLinkedList.from_range(50, skiplist=True)
+    assert lst.stream(45).collect(list) == [45, 46, 47, 48, 49]
+    assert list(lst.stream(50)) == []
+
+
+@pytest.mark.parametrize("cls", LINEAR + CIRCULAR)
+def test_stream_does_not_walk_from_the_head(cls, monkeypatch):
+    lst = cls.from_range(10)
+
+    def fail(self):
+        raise AssertionError("iterated from the head")
+
+    monkeypatch.setattr(cls, "__iter__", fail)
+    assert lst.stream(7).take(2).collect(list) == [7, 8]
+    if cls in CIRCULAR:
+        assert lst.stride(3, 8).collect(list) == [8, 1, 4, 7]
+
+
+def test_stream_is_lazy():
+    lst = DoubleLinkedList.from_range(5)
+    stream = lst.stream(2)
+    lst.insert_at_end(5)
+    assert list(stream) == [2, 3, 4, 5]
+
+
+def test_stream_rejects_bad_start():
+    lst = SingleLinkedList.from_range(3)
+    with pytest.raises(ValueError):
+        lst.stream(4)
+    with pytest.raises(ValueError):
+        lst.stream(-1)
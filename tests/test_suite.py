@@ -0,0 +1,50 @@
+import json
+from collections import deque
+
+import pytest
+
+from benchmarks import suite
+
+
+def outcome(op, cls, n):
+    """Return the last result of op on cls and the structure it leaves behind."""
+    fn = suite.implementation(op, cls)
+    s = suite.setup(cls, op.setup, n)
+    result = None
+    for i in range(op.calls(n)):
+        result = fn(cls, s, n, i)
+    if not isinstance(result, (int, str, type(None))):
+        result = list(result)
+    state = list(s[0] if op.setup == "pair" else s)
+    return result, state
+
+
+@pytest.mark.parametrize("op", suite.OPS, ids=lambda op: op.name)
+def test_every_structure_does_the_same_work(op):
+    n = 40
+    outcomes = {cls: outcome(op, cls, n) for cls in suite.STRUCTURES
+                if suite.implementation(op, cls) is not None}
+    reference = outcomes[suite.STRUCTURES[0]]
+    for cls, (result, state) in outcomes.items():
+        assert state == reference[1], cls.__name__
+        if None not in (result, reference[0]) and op.name != "display":
+            assert result == reference[0], cls.__name__
+
+
+def test_run_and_compare(tmp_path, capsys):
+    base = tmp_path / "base.json"
+    assert suite.main(["run", "--sizes", "50", "--only", "find,sort",
+                       "--repeat", "1", "--out", str(base)]) == 0
+    results = json.loads(base.read_text())["results"]
+    assert {r["op"] for r in results} == {"find", "sort"}
+    assert not any(r["structure"] == deque.__name__ and r["op"] == "sort" for r in results)
+    assert suite.main(["compare", str(base), str(base)]) == 0
+
+    slower = json.loads(base.read_text())
+    for r in slower["results"]:
+        r["seconds"] = r["seconds"] * 3 + 1e-3
+    new = tmp_path / "new.json"
+    new.write_text(json.dumps(slower))
+    assert suite.main(["compare", str(base), str(new)]) == 1
+    assert "REGRESSION" in capsys.readouterr().out
+    assert suite.main(["compare", str(new), str(base)]) == 0
@@ -0,0 +1,88 @@
+import random
+
+import pytest
+
+from linkedlist import FloatLinkedList, IntLinkedList
+
+
+@pytest.mark.parametrize("cls", [IntLinkedList, FloatLinkedList])
+def test_mutations_and_queries_match_a_list(cls):
+    rng = random.Random(15)
+    lst = cls.from_iterable(range(10))
+    convert = float if cls is FloatLinkedList else int
+    expected = [convert(v) for v in range(10)]
+    for _ in range(300):
+        op = rng.randrange(7)
+        value = convert(rng.randrange(-50, 50))
+        if op == 0:
+            lst.insert_at_end(value)
+            expected.append(value)
+        elif op == 1:
+            lst.insert_at_beginning(value)
+            expected.insert(0, value)
+        elif op == 2:
+            pos = rng.randrange(len(expected) + 1)
+            lst.insert_at_position(value, pos)
+            expected.insert(pos, value)
+        elif op == 3 and expected:
+            pos = rng.randrange(len(expected))
+            lst.delete(pos)
+            del expected[pos]
+        elif op == 4 and expected:
+            pos = rng.randrange(len(expected))
+            lst.update(pos, value)
+            expected[pos] = value
+        elif op == 5:
+            lst.extend([value, value + 1])
+            expected += [value, value + 1]
+        elif op == 6 and rng.random() < 0.2:
+            lst.reverse()
+            expected.reverse()
+        assert list(lst) == expected
+        if expected:
+            assert lst.sum() == sum(expected)
+            assert (lst.min(), lst.max()) == (min(expected), max(expected))
+            assert lst.find(expected[-1]) == expected.index(expected[-1])
+            assert lst.count(expected[0]) == expected.count(expected[0])
+            assert lst.argwhere(lambda v: v > 0) == [i for i, v in enumerate(expected) if v > 0]
+
+
+def test_queries_compact_a_scattered_list():
+    lst = IntLinkedList.from_iterable(range(6))
+    lst.delete(1)
+    lst.insert_at_beginning(9)
+    assert not lst._ordered
+    assert lst.find(3) == 3
+    assert lst._ordered
+    assert list(lst._data) == [9, 0, 2, 3, 4, 5]
+    lst.extend([6])
+    assert list(lst) == [9, 0, 2, 3, 4, 5, 6]
+
+
+def test_bad_items_leave_the_list_unchanged():
+    lst = IntLinkedList.from_iterable([1, 2])
+    with pytest.raises(TypeError):
+        lst.extend([3, "x"])
+    with pytest.raises(OverflowError):
+        lst.extend([2 ** 64])
+    assert list(lst) == [1, 2]
+    with pytest.raises(ValueError):
+        IntLinkedList().min()
+    with pytest.raises(ValueError):
+        IntLinkedList().find(1)
+
+
+def test_numpy_round_trip():
+    numpy = pytest.importorskip("numpy")
+    values = numpy.arange(10, dtype="int64")
+    lst = IntLinkedList.from_numpy(values)
+    lst.delete(0)
+    lst.insert_at_beginning(-1)
+    out = lst.to_numpy()
+    assert out.tolist() == [-1] + list(range(1, 10))
+    assert lst.argwhere(lambda v: v % 2 == 0) == [2, 4, 6, 8]
+    view = lst.to_numpy(copy=False)
+    lst.update(0, 7)
+    assert view[0] == 7
+    floats = FloatLinkedList.from_numpy(numpy.array([0.5, 1.5]))
+    assert floats.sum() == 2.0
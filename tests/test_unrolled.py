@@ -0,0 +1,84 @@
+import random
+
+import pytest
+
+from linkedlist import UnrolledLinkedList
+
+
+def check_chunks(lst):
+    """Assert the chunk chain is consistent with size, chunks and chunk_size."""
+    total = count = 0
+    prev = None
+    chunk = lst.head
+    while chunk is not None:
+        assert chunk.prev is prev
+        assert 0 < len(chunk.items) <= lst.chunk_size
+        total += len(chunk.items)
+        count += 1
+        prev, chunk = chunk, chunk.next
+    assert lst.tail is prev
+    assert (total, count) == (lst.size, lst.chunks)
+
+
+@pytest.mark.parametrize("chunk_size", [2, 3, 8])
+def test_mutations_match_a_list(chunk_size):
+    rng = random.Random(16)
+    lst = UnrolledLinkedList.from_range(20, chunk_size=chunk_size)
+    expected = list(range(20))
+    for step in range(1500):
+        op = rng.randrange(8)
+        if op == 0:
+            pos = rng.randrange(len(expected) + 1)
+            lst.insert_at_position(step, pos)
+            expected.insert(pos, step)
+        elif op == 1 and expected:
+            pos = rng.randrange(len(expected))
+            lst.delete(pos)
+            del expected[pos]
+        elif op == 2:
+            lst.insert_at_beginning(step)
+            expected.insert(0, step)
+        elif op == 3:
+            items = list(range(step, step + rng.randrange(4)))
+            lst.extend(items)
+            expected += items
+        elif op == 4 and expected:
+            value = rng.choice(expected)
+            lst.remove(value)
+            expected.remove(value)
+        elif op == 5 and expected:
+            if rng.random() < 0.5:
+                lst.del_at_start()
+                expected.pop(0)
+            else:
+                lst.del_at_end()
+                expected.pop()
+        elif op == 6 and expected:
+            pos = rng.randrange(len(expected))
+            lst.update(pos, -step)
+            expected[pos] = -step
+        elif op == 7 and rng.random() < 0.1:
+            lst.reverse()
+            expected.reverse()
+        check_chunks(lst)
+        assert list(lst) == expected
+        if expected:
+            pos = rng.randrange(len(expected))
+            assert lst.show_val(pos) == expected[pos]
+            assert lst.find(expected[pos]) == expected.index(expected[pos])
+            assert expected[pos] in lst
+
+
+def test_errors():
+    with pytest.raises(ValueError):
+        UnrolledLinkedList(chunk_size=1)
+    lst = UnrolledLinkedList()
+    for call in (lst.del_at_start, lst.del_at_end, lambda: lst.delete(0), lambda: lst.find(1)):
+        with pytest.raises(ValueError):
+            call()
+    lst.extend([1, 2])
+    with pytest.raises(ValueError):
+        lst.insert_at_position(0, 3)
+    with pytest.raises(ValueError):
+        lst.remove(5)
+    assert list(lst) == [1, 2]